@@ -92,6 +92,25 @@ DATABASES = {
 }
 
 
+# Cache
+# Local por processo por padrão; em produção, aponte CACHE_URL para um
+# backend compartilhado (ex.: redis://...).
+CACHES = {
+    "default": (
+        env.cache("CACHE_URL")
+        if "CACHE_URL" in os.environ
+        else {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "campeonato-brasileiro",
+        }
+    )
+}
+
+# Fan-out dos eventos ao vivo (SSE). O broker em memória só alcança os
+# assinantes do próprio processo.
+LIVE_SCORE_BROKER = os.environ.get("LIVE_SCORE_BROKER", "matches.live.InMemoryBroker")
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
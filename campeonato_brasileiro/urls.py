@@ -1,5 +1,5 @@
 from django.contrib import admin
-from django.urls import path
+from django.urls import include, path
 from drf_spectacular.views import (
     SpectacularAPIView,
     SpectacularSwaggerView,
@@ -19,4 +19,8 @@ urlpatterns = [
     # JWT Auth endpoints
     path('api/v1/auth/token/', TokenObtainPairView.as_view(), name='token_obtain_pair'),
     path('api/v1/auth/token/refresh/', TokenRefreshView.as_view(), name='token_refresh'),
+    # Resources
+    path('api/v1/', include('clubs.urls')),
+    path('api/v1/', include('leagues.urls')),
+    path('api/v1/', include('matches.urls')),
 ]
@@ -0,0 +1,10 @@
+from rest_framework import serializers
+
+from clubs.models import Team
+
+
+class TeamSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Team
+        fields = ["id", "name", "created_at", "updated_at"]
+        read_only_fields = fields
@@ -0,0 +1,68 @@
+import pytest
+from clubs.tests.factories import TeamFactory
+
+URL = "/api/v1/teams/"
+
+
+@pytest.mark.django_db
+def test_list_and_retrieve(client):
+    team = TeamFactory(name="Bahia")
+    TeamFactory(name="América")
+
+    names = [row["name"] for row in client.get(URL).json()["results"]]
+    detail = client.get(f"{URL}{team.pk}/")
+
+    assert names == ["América", "Bahia"]
+    assert detail.json()["name"] == "Bahia"
+    assert detail["ETag"] and detail["Last-Modified"]
+
+
+@pytest.mark.django_db
+def test_not_modified_costs_one_query(client, django_assert_num_queries):
+    TeamFactory.create_batch(3)
+    etag = client.get(URL)["ETag"]
+
+    with django_assert_num_queries(1):
+        response = client.get(URL, HTTP_IF_NONE_MATCH=etag)
+
+    assert response.status_code == 304
+
+
+@pytest.mark.django_db
+def test_etag_changes_on_update_and_delete(client):
+    team, other = TeamFactory.create_batch(2)
+    etag = client.get(URL)["ETag"]
+
+    team.name = "Novo Nome"
+    team.save()
+    updated = client.get(URL, HTTP_IF_NONE_MATCH=etag)
+    assert updated.status_code == 200
+    assert updated["ETag"] != etag
+
+    # Remover um time que não é o mais recente não muda o max(updated_at).
+    other.delete()
+    assert client.get(URL, HTTP_IF_NONE_MATCH=updated["ETag"]).status_code == 200
+
+
+@pytest.mark.django_db
+def test_etag_depends_on_query_string(client):
+    TeamFactory.create_batch(3)
+    etag = client.get(URL)["ETag"]
+
+    response = client.get(f"{URL}?page=1", HTTP_IF_NONE_MATCH=etag)
+
+    assert response.status_code == 200
+
+
+@pytest.mark.django_db
+def test_unknown_team_returns_404(client):
+    team = TeamFactory()
+    url = f"{URL}{team.pk}/"
+    team.delete()
+
+    assert client.get(url).status_code == 404
+
+
+@pytest.mark.django_db
+def test_malformed_id_returns_404(client):
+    assert client.get(f"{URL}not-a-uuid/").status_code == 404
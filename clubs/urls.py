@@ -0,0 +1,8 @@
+from rest_framework.routers import SimpleRouter
+
+from clubs.views import TeamViewSet
+
+router = SimpleRouter()
+router.register("teams", TeamViewSet, basename="team")
+
+urlpatterns = router.urls
@@ -1,3 +1,10 @@
-from django.shortcuts import render
+from rest_framework import viewsets
 
-# Create your views here.
+from clubs.models import Team
+from clubs.serializers import TeamSerializer
+from core.mixins import ConditionalGetMixin
+
+
+class TeamViewSet(ConditionalGetMixin, viewsets.ReadOnlyModelViewSet):
+    queryset = Team.objects.order_by("name")
+    serializer_class = TeamSerializer
@@ -0,0 +1,12 @@
+import pytest
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+
+
+@pytest.fixture
+def client():
+    """Cliente da API autenticado, para os testes dos endpoints."""
+    client = APIClient()
+    user = get_user_model().objects.create_user("api", password="x")
+    client.force_authenticate(user)
+    return client
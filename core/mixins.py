@@ -0,0 +1,102 @@
+import hashlib
+from datetime import datetime
+from typing import Callable, Optional, Tuple
+
+from django.core.exceptions import ValidationError
+from django.db.models import Count, Max
+from django.http import Http404
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+
+
+class ConditionalGetMixin:
+    """
+    ETag e Last-Modified para ``list`` e ``retrieve`` de modelos derivados de
+    ``core.models.BaseModel``.
+
+    Os validadores saem de uma única consulta pequena: ``max(updated_at)`` de
+    cada campo em ``last_modified_fields`` (relacionamentos serializados
+    juntos entram aqui) e ``count``, que percebe remoções. Com paginação que
+    oferece ``window`` (``KeysetPagination``) a consulta lê só as chaves e
+    datas das linhas da página, pelo mesmo índice da página, em vez de
+    agregar o queryset inteiro. ``If-None-Match`` e ``If-Modified-Since``
+    são respondidos com 304 antes de carregar ou serializar os objetos.
+    """
+
+    last_modified_fields = ("updated_at",)
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        window = getattr(self.paginator, "window", None)
+        if window is not None:
+            validators = self._window_validators(window(queryset, request))
+        else:
+            validators = self._validators(queryset)
+        return self.conditional_response(
+            request,
+            *validators,
+            lambda: super(ConditionalGetMixin, self).list(request, *args, **kwargs),
+        )
+
+    def retrieve(self, request, *args, **kwargs):
+        lookup = self.lookup_url_kwarg or self.lookup_field
+        try:
+            version, last_modified = self._validators(
+                self.get_queryset().filter(**{self.lookup_field: kwargs[lookup]})
+            )
+        except (TypeError, ValueError, ValidationError):
+            # Mesmo tratamento de ``get_object_or_404`` para ids malformados.
+            raise Http404
+        if version == "0":
+            return super().retrieve(request, *args, **kwargs)
+        return self.conditional_response(
+            request,
+            version,
+            last_modified,
+            lambda: super(ConditionalGetMixin, self).retrieve(
+                request, *args, **kwargs
+            ),
+        )
+
+    def conditional_response(
+        self,
+        request,
+        version: str,
+        last_modified: Optional[datetime],
+        render: Callable,
+    ):
+        # O caminho completo entra na ETag: filtros e cursor mudam o conteúdo.
+        stamp = last_modified.isoformat() if last_modified else ""
+        raw = f"{request.get_full_path()}|{version}|{stamp}"
+        etag = quote_etag(hashlib.md5(raw.encode()).hexdigest())
+        timestamp = int(last_modified.timestamp()) if last_modified else None
+
+        not_modified = get_conditional_response(
+            request, etag=etag, last_modified=timestamp
+        )
+        if not_modified is not None:
+            not_modified["ETag"] = etag
+            return not_modified
+
+        response = render()
+        response["ETag"] = etag
+        if timestamp is not None:
+            response["Last-Modified"] = http_date(timestamp)
+        return response
+
+    def _validators(self, queryset) -> Tuple[str, Optional[datetime]]:
+        fields = self.last_modified_fields
+        aggregates = queryset.order_by().aggregate(
+            count=Count("pk"),
+            **{f"last_{i}": Max(field) for i, field in enumerate(fields)},
+        )
+        stamps = [aggregates[f"last_{i}"] for i in range(len(fields))]
+        stamps = [stamp for stamp in stamps if stamp is not None]
+        return str(aggregates["count"]), max(stamps, default=None)
+
+    def _window_validators(self, window) -> Tuple[str, Optional[datetime]]:
+        rows = list(window.values_list("pk", *self.last_modified_fields))
+        stamps = [stamp for row in rows for stamp in row[1:] if stamp is not None]
+        # Chaves e datas de cada linha: percebe remoções e inserções na página.
+        digest = hashlib.md5(repr(rows).encode()).hexdigest()
+        return digest, max(stamps, default=None)
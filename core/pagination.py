@@ -0,0 +1,134 @@
+import base64
+import json
+from typing import List, Optional, Sequence
+
+from django.db.models import Q, QuerySet
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class KeysetPagination(BasePagination):
+    """
+    Paginação por chave (keyset) sobre ``ordering``.
+
+    O cursor guarda os valores da última linha da página; a página seguinte
+    é ``WHERE (date, id) > (ultima_data, ultimo_id)`` com ``LIMIT``, então,
+    com um índice na mesma ordem, páginas profundas custam o mesmo que a
+    primeira. Não há ``COUNT(*)`` nem ``OFFSET``. O último campo de
+    ``ordering`` precisa ser único para que o cursor seja estável.
+    """
+
+    ordering: Sequence[str] = ("date", "id")
+    page_size = 20
+    max_page_size = 100
+    cursor_query_param = "cursor"
+    page_size_query_param = "page_size"
+    invalid_cursor_message = "Cursor inválido."
+
+    def paginate_queryset(self, queryset: QuerySet, request, view=None) -> List:
+        self.request = request
+        self.model = queryset.model
+        self.base_url = request.build_absolute_uri()
+        page_size = self.get_page_size(request)
+
+        rows = list(self.window(queryset, request))
+        self.has_next = len(rows) > page_size
+        self.page = rows[:page_size]
+        return self.page
+
+    def window(self, queryset: QuerySet, request) -> QuerySet:
+        """
+        Linhas da página pedida mais a primeira da seguinte (que indica se há
+        próxima página), ainda sem avaliar o queryset.
+        """
+        self.model = queryset.model
+        queryset = queryset.order_by(*self.ordering)
+        cursor = self.decode_cursor(request)
+        if cursor is not None:
+            queryset = queryset.filter(self._after(cursor))
+        return queryset[: self.get_page_size(request) + 1]
+
+    def get_page_size(self, request) -> int:
+        try:
+            size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        return max(1, min(size, self.max_page_size))
+
+    def get_next_link(self) -> Optional[str]:
+        if not self.has_next:
+            return None
+        last = self.page[-1]
+        values = [
+            self._field(field).value_to_string(last) for field in self._names()
+        ]
+        encoded = base64.urlsafe_b64encode(json.dumps(values).encode()).decode()
+        return replace_query_param(self.base_url, self.cursor_query_param, encoded)
+
+    def get_first_link(self) -> str:
+        return remove_query_param(self.base_url, self.cursor_query_param)
+
+    def get_paginated_response(self, data) -> Response:
+        return Response({"next": self.get_next_link(), "results": data})
+
+    def get_paginated_response_schema(self, schema: dict) -> dict:
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
+
+    def get_schema_operation_parameters(self, view) -> List[dict]:
+        return [
+            {
+                "name": self.cursor_query_param,
+                "required": False,
+                "in": "query",
+                "description": "Cursor da página, retornado em ``next``.",
+                "schema": {"type": "string"},
+            },
+            {
+                "name": self.page_size_query_param,
+                "required": False,
+                "in": "query",
+                "description": f"Itens por página (máximo {self.max_page_size}).",
+                "schema": {"type": "integer"},
+            },
+        ]
+
+    def decode_cursor(self, request) -> Optional[list]:
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            values = json.loads(base64.urlsafe_b64decode(encoded.encode()))
+            if not isinstance(values, list) or len(values) != len(self.ordering):
+                raise ValueError
+            return [
+                self._field(name).to_python(value)
+                for name, value in zip(self._names(), values)
+            ]
+        except Exception:
+            raise NotFound(self.invalid_cursor_message)
+
+    def _after(self, cursor: list) -> Q:
+        """``(f1, f2, ...) > (v1, v2, ...)``, respeitando ``-`` de cada campo."""
+        condition = Q()
+        equal = Q()
+        for field, value in zip(self.ordering, cursor):
+            name = field.lstrip("-")
+            lookup = "lt" if field.startswith("-") else "gt"
+            condition |= equal & Q(**{f"{name}__{lookup}": value})
+            equal &= Q(**{name: value})
+        return condition
+
+    def _names(self) -> List[str]:
+        return [field.lstrip("-") for field in self.ordering]
+
+    def _field(self, name: str):
+        return self.model._meta.get_field(name)
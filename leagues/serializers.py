@@ -0,0 +1,24 @@
+from rest_framework import serializers
+
+from leagues.models import LeagueDivision, LeagueSeason
+
+
+class LeagueSeasonSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = LeagueSeason
+        fields = ["id", "year", "parent_league", "created_at", "updated_at"]
+        read_only_fields = fields
+
+
+class LeagueDivisionSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = LeagueDivision
+        fields = [
+            "id",
+            "name",
+            "season",
+            "parent_league",
+            "created_at",
+            "updated_at",
+        ]
+        read_only_fields = fields
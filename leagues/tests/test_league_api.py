@@ -0,0 +1,41 @@
+import pytest
+from leagues.tests.factories import LeagueDivisionFactory, LeagueSeasonFactory
+
+
+@pytest.mark.django_db
+def test_seasons_conditional_get(client, django_assert_num_queries):
+    season = LeagueSeasonFactory()
+    url = f"/api/v1/seasons/{season.pk}/"
+    response = client.get(url)
+    assert response.json()["year"] == season.year
+
+    with django_assert_num_queries(1):
+        not_modified = client.get(
+            url, HTTP_IF_MODIFIED_SINCE=response["Last-Modified"]
+        )
+    assert not_modified.status_code == 304
+
+    season.year += 100
+    season.save()
+    assert client.get(url, HTTP_IF_NONE_MATCH=response["ETag"]).status_code == 200
+
+
+@pytest.mark.django_db
+def test_divisions_filtered_by_season(client):
+    division = LeagueDivisionFactory()
+    LeagueDivisionFactory()
+    url = f"/api/v1/divisions/?season={division.season_id}"
+    response = client.get(url)
+
+    assert [row["id"] for row in response.json()["results"]] == [str(division.pk)]
+    assert client.get(url, HTTP_IF_NONE_MATCH=response["ETag"]).status_code == 304
+
+    # Uma divisão nova de outra temporada não invalida a listagem filtrada.
+    LeagueDivisionFactory()
+    assert client.get(url, HTTP_IF_NONE_MATCH=response["ETag"]).status_code == 304
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("url", ["/api/v1/seasons/xyz/", "/api/v1/divisions/xyz/"])
+def test_malformed_id_returns_404(client, url):
+    assert client.get(url).status_code == 404
@@ -0,0 +1,9 @@
+from rest_framework.routers import SimpleRouter
+
+from leagues.views import LeagueDivisionViewSet, LeagueSeasonViewSet
+
+router = SimpleRouter()
+router.register("seasons", LeagueSeasonViewSet, basename="season")
+router.register("divisions", LeagueDivisionViewSet, basename="division")
+
+urlpatterns = router.urls
@@ -1,3 +1,16 @@
-from django.shortcuts import render
+from rest_framework import viewsets
 
-# Create your views here.
+from core.mixins import ConditionalGetMixin
+from leagues.models import LeagueDivision, LeagueSeason
+from leagues.serializers import LeagueDivisionSerializer, LeagueSeasonSerializer
+
+
+class LeagueSeasonViewSet(ConditionalGetMixin, viewsets.ReadOnlyModelViewSet):
+    queryset = LeagueSeason.objects.order_by("-year")
+    serializer_class = LeagueSeasonSerializer
+
+
+class LeagueDivisionViewSet(ConditionalGetMixin, viewsets.ReadOnlyModelViewSet):
+    queryset = LeagueDivision.objects.order_by("name")
+    serializer_class = LeagueDivisionSerializer
+    filterset_fields = ["season"]
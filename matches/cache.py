@@ -0,0 +1,106 @@
+import hashlib
+import time
+from typing import Any, Callable, Iterable, Mapping, Optional, Tuple
+
+from django.core.cache import cache as default_cache
+from django.db import transaction
+
+
+class CacheVersion:
+    """
+    Número de versão guardado no cache, para entrar nas chaves dos valores
+    derivados dele: trocar a versão descarta todos de uma vez.
+    """
+
+    def __init__(self, key: str, cache=None):
+        self.key = key
+        self.cache = cache or default_cache
+
+    def get(self) -> int:
+        version = self.cache.get(self.key)
+        if version is None:
+            # Começa no relógio para não reaproveitar versões se a chave for
+            # descartada pelo backend.
+            version = time.time_ns()
+            if not self.cache.add(self.key, version, None):
+                version = self.cache.get(self.key, version)
+        return version
+
+    def bump(self) -> Tuple[int, int]:
+        """Incrementa a versão e retorna ``(anterior, nova)``."""
+        old = self.get()
+        try:
+            new = self.cache.incr(self.key)
+        except ValueError:
+            new = old + 1
+            self.cache.set(self.key, new, None)
+        return old, new
+
+    def bump_on_commit(self, after: Optional[Callable[[int, int], Any]] = None):
+        """
+        Troca a versão depois do commit, para que nenhuma leitura concorrente
+        guarde de novo o estado anterior à escrita. ``after`` recebe
+        ``(anterior, nova)``.
+        """
+
+        def bump():
+            old, new = self.bump()
+            if after is not None:
+                after(old, new)
+
+        transaction.on_commit(bump)
+
+
+class DivisionCache:
+    """
+    Cache das leituras de uma divisão (confrontos, resultados, tabela),
+    com chaves por divisão e recurso.
+
+    Cada divisão tem um número de versão que entra em todas as suas chaves;
+    invalidar é trocar a versão (``CacheVersion``, depois do commit), o que
+    descarta de uma vez só as entradas daquela divisão e preserva as das
+    demais.
+    """
+
+    PREFIX = "division-cache"
+    TIMEOUT = 60 * 5
+
+    def __init__(self, league_division_id, cache=None):
+        self.league_division_id = league_division_id
+        self.cache = cache or default_cache
+
+    def get_or_set(
+        self, resource: str, params: Mapping[str, Any], compute: Callable[[], Any]
+    ) -> Any:
+        key = self.key(resource, params)
+        value = self.cache.get(key)
+        if value is None:
+            value = compute()
+            self.cache.set(key, value, self.TIMEOUT)
+        return value
+
+    def key(self, resource: str, params: Mapping[str, Any]) -> str:
+        encoded = "&".join(
+            f"{name}={value}"
+            for name, values in sorted(params.items())
+            for value in (values if isinstance(values, list) else [values])
+        )
+        digest = hashlib.md5(encoded.encode()).hexdigest()
+        return (
+            f"{self.PREFIX}:{self.league_division_id}:v{self.version()}:"
+            f"{resource}:{digest}"
+        )
+
+    def version(self) -> int:
+        return CacheVersion(
+            self._version_key(self.league_division_id), self.cache
+        ).get()
+
+    @classmethod
+    def invalidate(cls, league_division_ids: Iterable, cache=None):
+        for pk in set(league_division_ids):
+            CacheVersion(cls._version_key(pk), cache).bump_on_commit()
+
+    @classmethod
+    def _version_key(cls, league_division_id) -> str:
+        return f"{cls.PREFIX}:{league_division_id}:version"
@@ -0,0 +1,18 @@
+import django_filters
+from django.db.models import Q
+
+from matches.models import Match, Status
+
+
+class MatchFilter(django_filters.FilterSet):
+    division = django_filters.UUIDFilter(field_name="league_division")
+    team = django_filters.UUIDFilter(method="filter_team", label="Time (casa ou fora)")
+    status = django_filters.MultipleChoiceFilter(choices=Status.choices)
+    date = django_filters.IsoDateTimeFromToRangeFilter()
+
+    class Meta:
+        model = Match
+        fields = ["division", "team", "status", "round", "date"]
+
+    def filter_team(self, queryset, name, value):
+        return queryset.filter(Q(home_team=value) | Q(away_team=value))
@@ -0,0 +1,140 @@
+import asyncio
+import json
+import threading
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import AsyncContextManager, Dict, Iterable, Set, Tuple
+
+from django.conf import settings
+from django.db import transaction
+from django.utils.module_loading import import_string
+from matches.models import Match
+
+
+@dataclass(frozen=True)
+class LiveEvent:
+    """Evento de placar ao vivo, já no formato enviado por Server-Sent Events."""
+
+    event: str
+    data: dict
+
+    def encode(self) -> str:
+        return f"event: {self.event}\ndata: {json.dumps(self.data)}\n\n"
+
+
+def match_channel(match_id) -> str:
+    return f"match:{match_id}"
+
+
+def division_channel(league_division_id) -> str:
+    return f"division:{league_division_id}"
+
+
+class BaseBroker:
+    """
+    Distribui eventos entre publicadores (código síncrono, após o commit) e
+    assinantes (streams assíncronos). Uma implementação entre processos
+    (Redis, Postgres ``LISTEN``) só precisa destes dois métodos.
+    """
+
+    def publish(self, channel: str, event: LiveEvent):
+        raise NotImplementedError
+
+    def subscribe(self, channel: str) -> AsyncContextManager[asyncio.Queue]:
+        """Gerenciador de contexto assíncrono que entrega a fila do assinante."""
+        raise NotImplementedError
+
+
+class InMemoryBroker(BaseBroker):
+    """
+    Fan-out dentro do processo: cada assinante tem uma fila limitada no seu
+    event loop, e ``publish`` pode ser chamado de qualquer thread. Assinantes
+    lentos perdem os eventos mais antigos em vez de acumular memória.
+    """
+
+    QUEUE_SIZE = 100
+
+    def __init__(self):
+        self._subscribers: Dict[
+            str, Set[Tuple[asyncio.AbstractEventLoop, asyncio.Queue]]
+        ] = defaultdict(set)
+        self._lock = threading.Lock()
+
+    def publish(self, channel: str, event: LiveEvent):
+        with self._lock:
+            subscribers = list(self._subscribers.get(channel, ()))
+        for loop, queue in subscribers:
+            try:
+                loop.call_soon_threadsafe(self._put, queue, event)
+            except RuntimeError:
+                # Event loop já encerrado; o assinante sai no próximo unsubscribe.
+                pass
+
+    @asynccontextmanager
+    async def subscribe(self, channel: str):
+        subscriber = (asyncio.get_running_loop(), asyncio.Queue(self.QUEUE_SIZE))
+        with self._lock:
+            self._subscribers[channel].add(subscriber)
+        try:
+            yield subscriber[1]
+        finally:
+            with self._lock:
+                self._subscribers[channel].discard(subscriber)
+                if not self._subscribers[channel]:
+                    del self._subscribers[channel]
+
+    def subscriber_count(self, channel: str) -> int:
+        with self._lock:
+            return len(self._subscribers.get(channel, ()))
+
+    @staticmethod
+    def _put(queue: asyncio.Queue, event: LiveEvent):
+        if queue.full():
+            queue.get_nowait()
+        queue.put_nowait(event)
+
+
+@lru_cache(maxsize=None)
+def get_broker() -> BaseBroker:
+    """Broker configurado em ``LIVE_SCORE_BROKER``, um por processo."""
+    return import_string(settings.LIVE_SCORE_BROKER)()
+
+
+def publish_match_events(event: str, matches: Iterable):
+    """
+    Publica o estado das partidas nos canais da partida e da divisão depois
+    do commit, para que nenhum assinante veja uma escrita desfeita.
+
+    O estado é relido do banco no momento da publicação: a instância em
+    memória pode não ter os gols registrados por outros processos.
+    """
+    match_ids = [match.pk for match in matches]
+
+    def publish():
+        broker = get_broker()
+        for row in Match.objects.filter(pk__in=match_ids).values(
+            "id",
+            "league_division_id",
+            "status",
+            "home_score",
+            "away_score",
+            "home_points",
+            "away_points",
+        ):
+            live_event = LiveEvent(
+                event,
+                {
+                    "id": str(row.pop("id")),
+                    "league_division": str(row.pop("league_division_id")),
+                    **row,
+                },
+            )
+            for channel in (
+                match_channel(live_event.data["id"]),
+                division_channel(live_event.data["league_division"]),
+            ):
+                broker.publish(channel, live_event)
+
+    transaction.on_commit(publish)
@@ -0,0 +1,140 @@
+import json
+import platform
+import time
+import tracemalloc
+from datetime import datetime
+
+import django
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from clubs.models import Team
+from leagues.models import LeagueDivision, LeagueSeason
+from matches.services import FixtureGeneratorService
+
+
+class Command(BaseCommand):
+    help = (
+        "Mede tempo, queries e pico de memória da geração e da gravação de "
+        "confrontos para vários tamanhos de divisão. Tudo roda numa transação "
+        "desfeita ao final; o banco não é alterado."
+    )
+
+    DEFAULT_TEAM_COUNTS = [4, 20, 64, 128, 256]
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--teams",
+            type=int,
+            nargs="+",
+            default=self.DEFAULT_TEAM_COUNTS,
+            help="Quantidades de times a medir.",
+        )
+        parser.add_argument(
+            "--output",
+            default="fixture_benchmark.json",
+            help="Arquivo JSON com os resultados.",
+        )
+        parser.add_argument(
+            "--label",
+            default="",
+            help="Identificador livre da execução (ex.: hash do commit).",
+        )
+
+    def handle(self, *args, **options):
+        results = []
+        for team_count in options["teams"]:
+            self.stdout.write(self.style.NOTICE(f"Medindo {team_count} times..."))
+            result = self._run(team_count)
+            results.append(result)
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f" [+] {team_count} times, {result['matches']} partidas: "
+                    f"geração {result['generation']['seconds']:.3f}s, "
+                    f"gravação {result['persistence']['seconds']:.3f}s "
+                    f"({result['persistence']['queries']} queries)"
+                )
+            )
+
+        report = {
+            "label": options["label"],
+            "generated_at": timezone.now().isoformat(),
+            "python": platform.python_version(),
+            "django": django.get_version(),
+            "database": connection.vendor,
+            "results": results,
+        }
+        with open(options["output"], "w", encoding="utf-8") as fp:
+            json.dump(report, fp, indent=2)
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Resultados gravados em {options['output']}.")
+        )
+
+    def _run(self, team_count: int) -> dict:
+        with transaction.atomic():
+            service = FixtureGeneratorService(
+                self._create_division(team_count),
+                start_date=timezone.make_aware(datetime(2025, 4, 1)),
+            )
+
+            def generate():
+                service.matches_created = []
+                service._schedule_matches(service._generate_round_robin())
+
+            def persist():
+                service._clear_existing_matches()
+                service.bulk_create_matches()
+
+            generation = self._measure(generate)
+            persistence = self._measure(persist)
+
+            transaction.set_rollback(True)
+
+        return {
+            "teams": team_count,
+            "matches": len(service.matches_created),
+            "generation": generation,
+            "persistence": persistence,
+        }
+
+    def _create_division(self, team_count: int) -> LeagueDivision:
+        last_year = (
+            LeagueSeason.objects.order_by("-year")
+            .values_list("year", flat=True)
+            .first()
+        )
+        year = (last_year or 2000) + 1
+        season = LeagueSeason.objects.create(year=year)
+        division = LeagueDivision.objects.create(
+            name=f"Benchmark {year}-{team_count}", season=season
+        )
+        teams = Team.objects.bulk_create(
+            Team(name=f"Benchmark {year}-{team_count} #{i}")
+            for i in range(team_count)
+        )
+        division.teams.add(*teams)
+        return division
+
+    def _measure(self, phase) -> dict:
+        # O tracemalloc distorce o tempo, então a memória é medida numa
+        # segunda execução da mesma fase.
+        with CaptureQueriesContext(connection) as queries:
+            started = time.perf_counter()
+            phase()
+            seconds = time.perf_counter() - started
+
+        tracemalloc.start()
+        try:
+            phase()
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+        return {
+            "seconds": seconds,
+            "queries": len(queries),
+            "peak_memory_bytes": peak,
+        }
@@ -0,0 +1,192 @@
+import json
+import time
+from datetime import datetime, timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from clubs.models import Team
+from leagues.models import LeagueDivision, LeagueSeason
+from matches.models import Match, Status
+from matches.services import generate_round_robin
+
+
+class Command(BaseCommand):
+    help = (
+        "Popula partidas sintéticas numa transação desfeita ao final, executa "
+        "as consultas mais comuns sobre Match e verifica, pelo plano de "
+        "execução, se elas usam os índices compostos."
+    )
+
+    TEAMS_PER_DIVISION = 20
+    TEAM_POOL = 200
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--matches",
+            type=int,
+            default=100_000,
+            help="Quantidade aproximada de partidas sintéticas.",
+        )
+        parser.add_argument(
+            "--output",
+            default="match_queries_benchmark.json",
+            help="Arquivo JSON com planos e tempos.",
+        )
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            total = self._populate(options["matches"])
+            self.stdout.write(
+                self.style.NOTICE(f"{total} partidas sintéticas criadas.")
+            )
+            results = [self._run(name, *query) for name, *query in self._queries()]
+            transaction.set_rollback(True)
+
+        with open(options["output"], "w", encoding="utf-8") as fp:
+            json.dump(
+                {
+                    "database": connection.vendor,
+                    "matches": total,
+                    "results": results,
+                },
+                fp,
+                indent=2,
+            )
+
+        missing = [r["query"] for r in results if not r["uses_index"]]
+        if missing:
+            raise CommandError(
+                f"Consultas sem o índice esperado: {', '.join(missing)}."
+            )
+        self.stdout.write(
+            self.style.SUCCESS(f"Resultados gravados em {options['output']}.")
+        )
+
+    def _queries(self):
+        division, teams = self.division_teams[len(self.division_teams) // 2]
+        team = teams[0]
+        # Janela que cruza a "data atual" sintética: há jogos finalizados e
+        # agendados dentro dela.
+        window_start = self.now - timedelta(days=15)
+        window_end = self.now + timedelta(days=15)
+
+        return [
+            (
+                "division_by_date",
+                Match.objects.filter(league_division=division).order_by("date"),
+                {"match_division_date_idx", "match_div_status_date_idx"},
+            ),
+            (
+                "team_in_division",
+                Match.objects.filter(
+                    Q(home_team=team) | Q(away_team=team),
+                    league_division=division,
+                ).order_by("date"),
+                {
+                    "match_division_date_idx",
+                    "match_div_status_date_idx",
+                    "match_home_date_idx",
+                    "match_away_date_idx",
+                },
+            ),
+            (
+                "team_by_date",
+                Match.objects.filter(
+                    Q(home_team=team) | Q(away_team=team)
+                ).order_by("date"),
+                {"match_home_date_idx", "match_away_date_idx"},
+            ),
+            (
+                "division_status_window",
+                Match.objects.filter(
+                    league_division=division,
+                    status=Status.SCHEDULED,
+                    date__gte=window_start,
+                    date__lt=window_end,
+                ).order_by("date"),
+                {"match_div_status_date_idx"},
+            ),
+            (
+                "status_window",
+                Match.objects.filter(
+                    status=Status.FINISHED,
+                    date__gte=window_start,
+                    date__lt=window_end,
+                ).order_by("date"),
+                {"match_status_date_idx", "match_div_status_date_idx"},
+            ),
+        ]
+
+    def _run(self, name, queryset, expected_indexes) -> dict:
+        plan = queryset.explain()
+        started = time.perf_counter()
+        rows = len(list(queryset.values_list("pk", flat=True)))
+        seconds = time.perf_counter() - started
+        used = sorted(index for index in expected_indexes if index in plan)
+
+        style = self.style.SUCCESS if used else self.style.ERROR
+        self.stdout.write(
+            style(
+                f" [{'+' if used else '!'}] {name}: {rows} linhas em {seconds:.4f}s"
+            )
+        )
+        return {
+            "query": name,
+            "rows": rows,
+            "seconds": seconds,
+            "plan": plan,
+            "indexes_used": used,
+            "uses_index": bool(used),
+        }
+
+    def _populate(self, match_count: int) -> int:
+        self.start = timezone.make_aware(datetime(2020, 1, 1))
+        per_division = self.TEAMS_PER_DIVISION * (self.TEAMS_PER_DIVISION - 1)
+        division_count = max(1, -(-match_count // per_division))
+
+        last_year = (
+            LeagueSeason.objects.order_by("-year")
+            .values_list("year", flat=True)
+            .first()
+        )
+        season = LeagueSeason.objects.create(year=(last_year or 2000) + 1)
+        self.teams = Team.objects.bulk_create(
+            Team(name=f"Benchmark {season.year} #{i}")
+            for i in range(self.TEAM_POOL)
+        )
+        self.divisions = LeagueDivision.objects.bulk_create(
+            LeagueDivision(name=f"Benchmark {season.year}-{d}", season=season)
+            for d in range(division_count)
+        )
+
+        total = 0
+        self.now = self.start + timedelta(days=60)
+        self.division_teams = []
+        for d, division in enumerate(self.divisions):
+            offset = (d * self.TEAMS_PER_DIVISION) % self.TEAM_POOL
+            teams = (self.teams * 2)[offset : offset + self.TEAMS_PER_DIVISION]
+            self.division_teams.append((division, teams))
+            matches = []
+            for home, away, round_num in generate_round_robin(teams):
+                date = self.start + timedelta(days=3 * round_num, hours=d % 48)
+                matches.append(
+                    Match(
+                        home_team=home,
+                        away_team=away,
+                        league_division=division,
+                        date=date,
+                        status=(
+                            Status.FINISHED if date < self.now else Status.SCHEDULED
+                        ),
+                    )
+                )
+            Match.objects.bulk_create(matches, batch_size=1000)
+            total += len(matches)
+
+        with connection.cursor() as cursor:
+            if connection.vendor in ("sqlite", "postgresql"):
+                cursor.execute("ANALYZE")
+        return total
@@ -0,0 +1,65 @@
+from datetime import datetime
+
+from django.core.exceptions import ValidationError
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from leagues.models import LeagueSeason
+from matches.services import SeasonFixtureGeneratorService
+
+
+class Command(BaseCommand):
+    help = "Gera os confrontos de todas as divisões de uma temporada em paralelo."
+
+    def add_arguments(self, parser):
+        parser.add_argument("year", type=int, help="Ano da temporada.")
+        parser.add_argument(
+            "--start-date",
+            help="Data da primeira rodada (AAAA-MM-DD). Padrão: daqui a 7 dias.",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=None,
+            help="Número de processos usados no cálculo dos calendários.",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            season = LeagueSeason.objects.get(year=options["year"])
+        except LeagueSeason.DoesNotExist:
+            raise CommandError(f"Temporada {options['year']} não encontrada.")
+
+        start_date = None
+        if options["start_date"]:
+            try:
+                start_date = timezone.make_aware(
+                    datetime.strptime(options["start_date"], "%Y-%m-%d")
+                )
+            except ValueError:
+                raise CommandError("Data inválida. Use o formato AAAA-MM-DD.")
+
+        self.stdout.write(
+            self.style.MIGRATE_HEADING(f"Gerando confrontos da temporada {season}...")
+        )
+
+        service = SeasonFixtureGeneratorService(
+            season, start_date=start_date, max_workers=options["workers"]
+        )
+        try:
+            results = service.generate_fixtures()
+        except ValueError as exc:
+            raise CommandError(str(exc))
+        except ValidationError as exc:
+            raise CommandError(" ".join(exc.messages))
+
+        for result in results:
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f" [+] {result.division.name}: {len(result.matches)} partidas "
+                    f"(cálculo {result.compute_seconds:.3f}s, "
+                    f"gravação {result.persist_seconds:.3f}s)"
+                )
+            )
+
+        self.stdout.write(self.style.SUCCESS("Confrontos gerados com sucesso."))
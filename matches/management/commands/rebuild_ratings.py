@@ -0,0 +1,27 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from matches.services import EloRatingService
+
+
+class Command(BaseCommand):
+    help = (
+        "Recalcula as avaliações Elo de todos os times repetindo as partidas "
+        "finalizadas em ordem de data."
+    )
+
+    def handle(self, *args, **options):
+        self.stdout.write(
+            self.style.MIGRATE_HEADING("Recalculando avaliações Elo...")
+        )
+
+        started = time.perf_counter()
+        teams, matches = EloRatingService.rebuild()
+        elapsed = time.perf_counter() - started
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f" [+] {matches} partidas aplicadas a {teams} times em {elapsed:.2f}s"
+            )
+        )
@@ -0,0 +1,69 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from leagues.models import LeagueDivision
+from matches.services import StandingsQueryService, StandingsService
+
+
+class Command(BaseCommand):
+    help = "Recalcula a tabela materializada a partir das partidas finalizadas."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "divisions",
+            nargs="*",
+            help="Nomes das divisões. Padrão: todas.",
+        )
+        parser.add_argument(
+            "--check",
+            action="store_true",
+            help=(
+                "Apenas compara a tabela materializada com a calculada a partir "
+                "das partidas, sem gravar nada."
+            ),
+        )
+
+    def handle(self, *args, **options):
+        divisions = LeagueDivision.objects.order_by("name")
+        if options["divisions"]:
+            divisions = divisions.filter(name__in=options["divisions"])
+            missing = set(options["divisions"]) - {d.name for d in divisions}
+            if missing:
+                raise CommandError(
+                    f"Divisões não encontradas: {', '.join(sorted(missing))}."
+                )
+
+        if options["check"]:
+            return self._check(divisions)
+
+        for division in divisions:
+            standings = StandingsService.rebuild(division)
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f" [+] {division.name}: {len(standings)} times recalculados"
+                )
+            )
+
+    def _check(self, divisions):
+        drifted = []
+        for division in divisions:
+            materialized = {
+                (s.team_id, s.points, s.games, s.goals_for, s.goals_against)
+                for s in StandingsService.table(division).filter(games__gt=0)
+            }
+            computed = {
+                (r.team_id, r.points, r.games, r.goals_for, r.goals_against)
+                for r in StandingsQueryService(division).table()
+            }
+            if materialized == computed:
+                self.stdout.write(self.style.SUCCESS(f" [+] {division.name}: ok"))
+            else:
+                drifted.append(division.name)
+                self.stdout.write(
+                    self.style.ERROR(f" [!] {division.name}: divergente")
+                )
+
+        if drifted:
+            raise CommandError(
+                f"Tabelas divergentes: {', '.join(drifted)}. "
+                "Rode o comando sem --check para recalculá-las."
+            )
@@ -0,0 +1,65 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from leagues.models import LeagueDivision
+from matches.services import SeasonSimulationService
+
+
+class Command(BaseCommand):
+    help = (
+        "Simula o restante da temporada de uma divisão e mostra as chances de "
+        "título, Libertadores, acesso e rebaixamento de cada time."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("division", help="Nome da divisão.")
+        parser.add_argument(
+            "--simulations",
+            type=int,
+            default=10_000,
+            help="Quantidade de temporadas simuladas.",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=None,
+            help="Número de processos usados nas simulações.",
+        )
+        parser.add_argument(
+            "--seed", type=int, default=None, help="Semente para reprodutibilidade."
+        )
+
+    def handle(self, *args, **options):
+        try:
+            division = LeagueDivision.objects.get(name=options["division"])
+        except LeagueDivision.DoesNotExist:
+            raise CommandError(f"Divisão {options['division']} não encontrada.")
+        if options["simulations"] < 1:
+            raise CommandError("É necessário pelo menos uma simulação.")
+
+        self.stdout.write(
+            self.style.MIGRATE_HEADING(
+                f"Simulando {options['simulations']} temporadas de {division}..."
+            )
+        )
+
+        started = time.perf_counter()
+        odds = SeasonSimulationService(
+            division,
+            simulations=options["simulations"],
+            max_workers=options["workers"],
+            seed=options["seed"],
+        ).simulate()
+        elapsed = time.perf_counter() - started
+
+        for team in odds:
+            self.stdout.write(
+                f" [+] {team.team_name}: {team.expected_points:.1f} pts | "
+                f"título {team.title:.1%} | Libertadores {team.libertadores:.1%} | "
+                f"acesso {team.promotion:.1%} | rebaixamento {team.relegation:.1%}"
+            )
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Simulação concluída em {elapsed:.2f}s.")
+        )
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-18 13:24
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('clubs', '0001_initial'),
+        ('leagues', '0001_initial'),
+        ('matches', '0002_match_away_points_match_home_points'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='match',
+            constraint=models.UniqueConstraint(condition=models.Q(('status', 'CANCELLED'), _negated=True), fields=('home_team', 'away_team', 'league_division'), name='unique_active_match_per_division', violation_error_message='Já existe uma partida entre estes times (casa e fora) nesta divisão.'),
+        ),
+    ]
@@ -0,0 +1,51 @@
+# Generated by Django 5.2.18 on 2026-10-18 13:25
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('clubs', '0001_initial'),
+        ('leagues', '0001_initial'),
+        ('matches', '0003_match_unique_active_match_per_division'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='match',
+            name='away_team',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.PROTECT, related_name='away_matches', to='clubs.team'),
+        ),
+        migrations.AlterField(
+            model_name='match',
+            name='home_team',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.PROTECT, related_name='home_matches', to='clubs.team'),
+        ),
+        migrations.AlterField(
+            model_name='match',
+            name='league_division',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.PROTECT, related_name='matches', to='leagues.leaguedivision'),
+        ),
+        migrations.AddIndex(
+            model_name='match',
+            index=models.Index(fields=['league_division', 'date'], name='match_division_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='match',
+            index=models.Index(fields=['league_division', 'status', 'date'], name='match_div_status_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='match',
+            index=models.Index(fields=['home_team', 'date'], name='match_home_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='match',
+            index=models.Index(fields=['away_team', 'date'], name='match_away_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='match',
+            index=models.Index(fields=['status', 'date'], name='match_status_date_idx'),
+        ),
+    ]
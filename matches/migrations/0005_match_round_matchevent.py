@@ -0,0 +1,42 @@
+# Generated by Django 5.2.18 on 2026-10-18 13:28
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('clubs', '0001_initial'),
+        ('leagues', '0001_initial'),
+        ('matches', '0004_match_access_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='match',
+            name='round',
+            field=models.PositiveSmallIntegerField(blank=True, null=True),
+        ),
+        migrations.CreateModel(
+            name='MatchEvent',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('round', models.PositiveSmallIntegerField(blank=True, null=True)),
+                ('sequence', models.PositiveIntegerField()),
+                ('type', models.PositiveSmallIntegerField(choices=[(1, 'Início'), (2, 'Fim'), (3, 'Gol'), (4, 'Gol contra'), (5, 'Cartão amarelo'), (6, 'Cartão vermelho'), (7, 'Substituição')])),
+                ('minute', models.PositiveSmallIntegerField()),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('league_division', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='leagues.leaguedivision')),
+                ('match', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='events', to='matches.match')),
+                ('team', models.ForeignKey(blank=True, db_index=False, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='clubs.team')),
+            ],
+            options={
+                'verbose_name': 'Evento da partida',
+                'verbose_name_plural': 'Eventos da partida',
+                'ordering': ['match', 'sequence'],
+                'indexes': [models.Index(fields=['league_division', 'round', 'match', 'sequence'], name='event_division_round_idx')],
+                'constraints': [models.UniqueConstraint(fields=('match', 'sequence'), name='unique_match_event_sequence')],
+            },
+        ),
+    ]
@@ -0,0 +1,42 @@
+# Generated by Django 5.2.18 on 2026-10-18 13:29
+
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('clubs', '0001_initial'),
+        ('leagues', '0001_initial'),
+        ('matches', '0005_match_round_matchevent'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Standing',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid7, editable=False, primary_key=True, serialize=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('points', models.PositiveIntegerField(default=0)),
+                ('games', models.PositiveIntegerField(default=0)),
+                ('wins', models.PositiveIntegerField(default=0)),
+                ('draws', models.PositiveIntegerField(default=0)),
+                ('losses', models.PositiveIntegerField(default=0)),
+                ('goals_for', models.PositiveIntegerField(default=0)),
+                ('goals_against', models.PositiveIntegerField(default=0)),
+                ('goal_difference', models.IntegerField(default=0)),
+                ('league_division', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='standings', to='leagues.leaguedivision')),
+                ('team', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='standings', to='clubs.team')),
+            ],
+            options={
+                'verbose_name': 'Classificação',
+                'verbose_name_plural': 'Classificações',
+                'ordering': ['-points', '-wins', '-goal_difference', '-goals_for'],
+                'indexes': [models.Index(fields=['league_division', '-points', '-wins', '-goal_difference', '-goals_for'], name='standing_table_idx')],
+                'constraints': [models.UniqueConstraint(fields=('league_division', 'team'), name='unique_standing_per_division')],
+            },
+        ),
+    ]
@@ -0,0 +1,52 @@
+# Generated by Django 5.2.18 on 2026-10-18 13:39
+
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('clubs', '0001_initial'),
+        ('matches', '0006_standing'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EloRating',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid7, editable=False, primary_key=True, serialize=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('rating', models.FloatField()),
+                ('games', models.PositiveIntegerField(default=0)),
+                ('team', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='elo_rating', to='clubs.team')),
+            ],
+            options={
+                'verbose_name': 'Avaliação Elo',
+                'verbose_name_plural': 'Avaliações Elo',
+                'ordering': ['-rating'],
+            },
+        ),
+        migrations.CreateModel(
+            name='EloRatingChange',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateTimeField()),
+                ('home_rating', models.FloatField()),
+                ('away_rating', models.FloatField()),
+                ('delta', models.FloatField()),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('away_team', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='clubs.team')),
+                ('home_team', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='clubs.team')),
+                ('match', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='elo_change', to='matches.match')),
+            ],
+            options={
+                'verbose_name': 'Variação Elo',
+                'verbose_name_plural': 'Variações Elo',
+                'ordering': ['date'],
+                'indexes': [models.Index(fields=['home_team', 'date'], name='elo_home_date_idx'), models.Index(fields=['away_team', 'date'], name='elo_away_date_idx')],
+            },
+        ),
+    ]
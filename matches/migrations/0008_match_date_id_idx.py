@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-18 13:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('clubs', '0001_initial'),
+        ('leagues', '0001_initial'),
+        ('matches', '0007_elo_rating'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='match',
+            index=models.Index(fields=['date', 'id'], name='match_date_id_idx'),
+        ),
+    ]
@@ -1,6 +1,10 @@
-from django.db import models
+from typing import Optional
+from django.db import IntegrityError, models, transaction
+from django.db.models import Case, F, Max, Q, Value, When
 from django.core.exceptions import ValidationError
+from django.utils import timezone
 from core.models import BaseModel
+from matches.signals import match_cancelled, match_finished, match_started
 
 
 class Status(models.TextChoices):
@@ -10,22 +14,101 @@ class Status(models.TextChoices):
     CANCELLED = "CANCELLED", "Cancelado"
 
 
+def points_expression(score_field: str, opponent_field: str) -> Case:
+    """Pontos de um lado calculados no banco, mesma regra de ``_calculate_points``."""
+    return Case(
+        When(**{f"{score_field}__gt": F(opponent_field)}, then=Value(3)),
+        When(**{score_field: F(opponent_field)}, then=Value(1)),
+        default=Value(0),
+    )
+
+
+class MatchQuerySet(models.QuerySet):
+    def finish(self) -> dict:
+        """
+        Finaliza todas as partidas do queryset com um único UPDATE baseado em
+        ``CASE`` e grava o evento de fim de cada uma num INSERT em lote. Todas
+        precisam estar em andamento; caso contrário nada é alterado. Retorna
+        ``{partida: vencedor ou None}``.
+        """
+        with transaction.atomic():
+            matches = list(
+                self.select_related("home_team", "away_team").select_for_update(
+                    of=("self",)
+                )
+            )
+            if any(match.status != Status.IN_PROGRESS for match in matches):
+                raise ValidationError(
+                    "A partida precisa estar em andamento para ser finalizada."
+                )
+
+            updated = Match.objects.filter(
+                pk__in=[match.pk for match in matches], status=Status.IN_PROGRESS
+            ).update(
+                status=Status.FINISHED,
+                home_points=points_expression("home_score", "away_score"),
+                away_points=points_expression("away_score", "home_score"),
+                updated_at=timezone.now(),
+            )
+            if updated != len(matches):
+                raise ValidationError(
+                    "A partida precisa estar em andamento para ser finalizada."
+                )
+
+            last = dict(
+                MatchEvent.objects.filter(match__in=matches)
+                .values("match")
+                .annotate(last=Max("sequence"))
+                .values_list("match", "last")
+            )
+            MatchEvent.objects.bulk_create(
+                MatchEvent(
+                    match=match,
+                    league_division_id=match.league_division_id,
+                    round=match.round,
+                    sequence=last.get(match.pk, 0) + 1,
+                    type=EventType.END,
+                    minute=match._elapsed_minute(),
+                )
+                for match in matches
+            )
+
+            for match in matches:
+                match.status = Status.FINISHED
+                match._calculate_points()
+
+            match_finished.send(sender=Match, matches=matches)
+
+        return {match: match.get_winner() for match in matches}
+
+
 class Match(BaseModel):
+    # Campos cobertos pela constraint de confronto único por divisão.
+    FIXTURE_FIELDS = {"home_team", "away_team", "league_division", "status"}
+    # Minuto máximo atribuído a um gol sem minuto informado.
+    MAX_MINUTE = 120
+
+    # Os índices implícitos das FKs são dispensados: os índices compostos
+    # abaixo começam por essas colunas.
     home_team = models.ForeignKey(
         "clubs.Team",
         on_delete=models.PROTECT,
         related_name="home_matches",
+        db_index=False,
     )
     away_team = models.ForeignKey(
         "clubs.Team",
         on_delete=models.PROTECT,
         related_name="away_matches",
+        db_index=False,
     )
     league_division = models.ForeignKey(
         "leagues.LeagueDivision",
         on_delete=models.PROTECT,
         related_name="matches",
+        db_index=False,
     )
+    round = models.PositiveSmallIntegerField(null=True, blank=True)
     date = models.DateTimeField()
     status = models.CharField(
         max_length=20,
@@ -37,6 +120,8 @@ class Match(BaseModel):
     home_points = models.PositiveIntegerField(default=0)
     away_points = models.PositiveIntegerField(default=0)
 
+    objects = MatchQuerySet.as_manager()
+
     def __str__(self):
         return f"{self.home_team.name} vs {self.away_team.name}"
 
@@ -49,58 +134,127 @@ class Match(BaseModel):
         ):
             raise ValidationError("Um time não pode jogar contra si mesmo.")
 
-        if self.home_team_id and self.away_team_id and self.league_division_id:
-            existing_match = (
-                Match.objects.filter(
-                    home_team_id=self.home_team_id,
-                    away_team_id=self.away_team_id,
-                    league_division_id=self.league_division_id,
-                )
-                .exclude(status=Status.CANCELLED)
-                .exclude(pk=self.pk)
-                .first()
-            )
+    def save(self, *args, **kwargs):
+        """
+        Valida os campos alterados e deixa a unicidade do confronto por
+        divisão para a constraint do banco, traduzindo a violação para o
+        mesmo ``ValidationError`` de antes.
+        """
+        update_fields = kwargs.get("update_fields")
+        exclude = None
+        if update_fields is not None:
+            exclude = [
+                field.name
+                for field in self._meta.concrete_fields
+                if field.name not in update_fields
+                and field.attname not in update_fields
+            ]
+        self.full_clean(exclude=exclude, validate_constraints=False)
 
-            if existing_match:
+        if update_fields is not None and not (
+            self.FIXTURE_FIELDS & {name.removesuffix("_id") for name in update_fields}
+        ):
+            super().save(*args, **kwargs)
+            return
+
+        try:
+            with transaction.atomic():
+                super().save(*args, **kwargs)
+        except IntegrityError as exc:
+            if self._has_active_duplicate():
                 raise ValidationError(
                     f"Já existe uma partida entre {self.home_team.name} (casa) "
                     f"e {self.away_team.name} (fora) nesta divisão."
-                )
+                ) from exc
+            raise
 
-    def save(self, *args, **kwargs):
-        self.full_clean()
-        super().save(*args, **kwargs)
+    def _has_active_duplicate(self) -> bool:
+        return (
+            Match.objects.filter(
+                home_team_id=self.home_team_id,
+                away_team_id=self.away_team_id,
+                league_division_id=self.league_division_id,
+            )
+            .exclude(status=Status.CANCELLED)
+            .exclude(pk=self.pk)
+            .exists()
+        )
 
     def start(self):
-        if self.status == Status.IN_PROGRESS:
-            raise ValidationError("A partida já está em andamento.")
-        if self.status == Status.FINISHED:
-            raise ValidationError("A partida já está finalizada.")
-        self.status = Status.IN_PROGRESS
-        self.save(update_fields=["status"])
-
-    def record_a_goal(self, type: str = "home"):
-        if self.status != Status.IN_PROGRESS:
+        with transaction.atomic():
+            if not self._transition(Status.IN_PROGRESS, [Status.SCHEDULED]):
+                if self.status == Status.IN_PROGRESS:
+                    raise ValidationError("A partida já está em andamento.")
+                if self.status == Status.FINISHED:
+                    raise ValidationError("A partida já está finalizada.")
+                raise ValidationError(
+                    "Não é possível iniciar uma partida cancelada."
+                )
+            # Partidas agendadas ainda não têm eventos: o início abre a linha
+            # do tempo, sem passar pela leitura da última sequência.
+            MatchEvent.objects.create(
+                match=self,
+                league_division_id=self.league_division_id,
+                round=self.round,
+                sequence=1,
+                type=EventType.START,
+                minute=0,
+            )
+        match_started.send(sender=Match, match=self)
+
+    def record_a_goal(self, type: str = "home", minute: Optional[int] = None):
+        """
+        Registra o gol como evento da partida (``MatchEventService``), que
+        incrementa o placar com um UPDATE condicional no banco: gols
+        simultâneos não se perdem, a partida precisa estar em andamento no
+        momento da escrita e a linha do tempo continua batendo com o placar.
+        Sem ``minute``, usa os minutos desde o horário marcado, limitados a
+        ``MAX_MINUTE``.
+        """
+        from matches.services.match_events import EventInput, MatchEventService
+
+        if type not in ("home", "away"):
+            raise ValidationError("Tipo de gol desconhecido. Use 'home' ou 'away'.")
+
+        if minute is None:
+            minute = self._elapsed_minute()
+        team_id = self.home_team_id if type == "home" else self.away_team_id
+        event = EventInput(EventType.GOAL, minute, team_id)
+        try:
+            MatchEventService(self).append([event])
+        except ValidationError:
             raise ValidationError(
                 "A partida deve estar em andamento para registrar gols."
             )
-        if type == "home":
-            self.home_score = (self.home_score or 0) + 1
-            self.save(update_fields=["home_score"])
-        elif type == "away":
-            self.away_score = (self.away_score or 0) + 1
-            self.save(update_fields=["away_score"])
-        else:
-            raise ValidationError("Tipo de gol desconhecido. Use 'home' ou 'away'.")
 
     def finish(self):
-        if self.status != Status.IN_PROGRESS:
-            raise ValidationError(
-                "A partida precisa estar em andamento para ser finalizada."
+        from matches.services.match_events import EventInput, MatchEventService
+
+        with transaction.atomic():
+            # O UPDATE do evento de fim já trava a linha em andamento.
+            try:
+                MatchEventService(self).append(
+                    [EventInput(EventType.END, self._elapsed_minute())]
+                )
+            except ValidationError:
+                self.refresh_from_db(fields=["status"])
+                raise ValidationError(
+                    "A partida precisa estar em andamento para ser finalizada."
+                )
+            updated = self._transition(
+                Status.FINISHED,
+                [Status.IN_PROGRESS],
+                home_points=points_expression("home_score", "away_score"),
+                away_points=points_expression("away_score", "home_score"),
+            )
+            if not updated:
+                raise ValidationError(
+                    "A partida precisa estar em andamento para ser finalizada."
+                )
+            self.refresh_from_db(
+                fields=["home_score", "away_score", "home_points", "away_points"]
             )
-        self.status = Status.FINISHED
-        self._calculate_points()
-        self.save(update_fields=["status", "home_points", "away_points"])
+            match_finished.send(sender=Match, matches=[self])
         return self.get_winner()
 
     def get_winner(self):
@@ -114,10 +268,32 @@ class Match(BaseModel):
         return self.home_score == self.away_score
 
     def cancel(self):
-        if self.status == Status.FINISHED:
+        cancellable = [Status.SCHEDULED, Status.IN_PROGRESS, Status.CANCELLED]
+        if not self._transition(Status.CANCELLED, cancellable):
             raise ValidationError("Não é possível cancelar uma partida já finalizada.")
-        self.status = Status.CANCELLED
-        self.save(update_fields=["status"])
+        match_cancelled.send(sender=Match, match=self)
+
+    def _elapsed_minute(self) -> int:
+        elapsed = (timezone.now() - self.date).total_seconds() // 60
+        return min(max(int(elapsed), 0), self.MAX_MINUTE)
+
+    def _transition(self, target: str, expected: list, **changes) -> bool:
+        """
+        Troca o status com um UPDATE condicionado ao status atual no banco
+        (compare-and-swap), sem depender do valor em memória nem de
+        ``full_clean()``. Em caso de falha, ``self.status`` passa a refletir o
+        valor do banco.
+        """
+        now = timezone.now()
+        updated = Match.objects.filter(pk=self.pk, status__in=expected).update(
+            status=target, updated_at=now, **changes
+        )
+        if updated:
+            self.status = target
+            self.updated_at = now
+        else:
+            self.refresh_from_db(fields=["status"])
+        return bool(updated)
 
     def _calculate_points(self):
         if self.is_draw():
@@ -134,3 +310,210 @@ class Match(BaseModel):
         verbose_name = "Partida"
         verbose_name_plural = "Partidas"
         ordering = ["-date"]
+        indexes = [
+            # Jogos de uma divisão em ordem de data.
+            models.Index(
+                fields=["league_division", "date"], name="match_division_date_idx"
+            ),
+            # Jogos de uma divisão por status numa janela de datas.
+            models.Index(
+                fields=["league_division", "status", "date"],
+                name="match_div_status_date_idx",
+            ),
+            # Jogos de um time (mandante ou visitante) em ordem de data.
+            models.Index(fields=["home_team", "date"], name="match_home_date_idx"),
+            models.Index(fields=["away_team", "date"], name="match_away_date_idx"),
+            # Jogos por status numa janela de datas, em todas as divisões.
+            models.Index(fields=["status", "date"], name="match_status_date_idx"),
+            # Paginação por cursor da API: ``(date, id) > (x, y)`` sem filtros.
+            models.Index(fields=["date", "id"], name="match_date_id_idx"),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["home_team", "away_team", "league_division"],
+                condition=~Q(status=Status.CANCELLED),
+                name="unique_active_match_per_division",
+                violation_error_message=(
+                    "Já existe uma partida entre estes times (casa e fora) "
+                    "nesta divisão."
+                ),
+            ),
+        ]
+
+
+class Standing(BaseModel):
+    """
+    Linha materializada da tabela de uma divisão, atualizada de forma
+    incremental a cada partida finalizada.
+    """
+
+    league_division = models.ForeignKey(
+        "leagues.LeagueDivision",
+        on_delete=models.CASCADE,
+        related_name="standings",
+        db_index=False,
+    )
+    team = models.ForeignKey(
+        "clubs.Team",
+        on_delete=models.PROTECT,
+        related_name="standings",
+    )
+    points = models.PositiveIntegerField(default=0)
+    games = models.PositiveIntegerField(default=0)
+    wins = models.PositiveIntegerField(default=0)
+    draws = models.PositiveIntegerField(default=0)
+    losses = models.PositiveIntegerField(default=0)
+    goals_for = models.PositiveIntegerField(default=0)
+    goals_against = models.PositiveIntegerField(default=0)
+    goal_difference = models.IntegerField(default=0)
+
+    def __str__(self):
+        return f"{self.team.name}: {self.points} pts"
+
+    class Meta:
+        verbose_name = "Classificação"
+        verbose_name_plural = "Classificações"
+        ordering = ["-points", "-wins", "-goal_difference", "-goals_for"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["league_division", "team"],
+                name="unique_standing_per_division",
+            ),
+        ]
+        indexes = [
+            models.Index(
+                fields=[
+                    "league_division",
+                    "-points",
+                    "-wins",
+                    "-goal_difference",
+                    "-goals_for",
+                ],
+                name="standing_table_idx",
+            ),
+        ]
+
+
+class EventType(models.IntegerChoices):
+    START = 1, "Início"
+    END = 2, "Fim"
+    GOAL = 3, "Gol"
+    OWN_GOAL = 4, "Gol contra"
+    YELLOW_CARD = 5, "Cartão amarelo"
+    RED_CARD = 6, "Cartão vermelho"
+    SUBSTITUTION = 7, "Substituição"
+
+
+class MatchEvent(models.Model):
+    """
+    Evento da linha do tempo de uma partida, gravado apenas por inserção.
+
+    A chave ``(match, sequence)`` deixa a linha do tempo de uma partida numa
+    única faixa do índice; ``league_division`` e ``round`` são copiados da
+    partida para que os eventos de uma rodada também sejam uma faixa só.
+    """
+
+    # Os índices implícitos das FKs são dispensados: as consultas usam os
+    # índices compostos abaixo.
+    match = models.ForeignKey(
+        Match, on_delete=models.CASCADE, related_name="events", db_index=False
+    )
+    league_division = models.ForeignKey(
+        "leagues.LeagueDivision",
+        on_delete=models.PROTECT,
+        related_name="+",
+        db_index=False,
+    )
+    round = models.PositiveSmallIntegerField(null=True, blank=True)
+    sequence = models.PositiveIntegerField()
+    type = models.PositiveSmallIntegerField(choices=EventType.choices)
+    minute = models.PositiveSmallIntegerField()
+    team = models.ForeignKey(
+        "clubs.Team",
+        on_delete=models.PROTECT,
+        null=True,
+        blank=True,
+        related_name="+",
+        db_index=False,
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f"{self.minute}' {self.get_type_display()}"
+
+    class Meta:
+        verbose_name = "Evento da partida"
+        verbose_name_plural = "Eventos da partida"
+        ordering = ["match", "sequence"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["match", "sequence"], name="unique_match_event_sequence"
+            ),
+        ]
+        indexes = [
+            models.Index(
+                fields=["league_division", "round", "match", "sequence"],
+                name="event_division_round_idx",
+            ),
+        ]
+
+
+class EloRating(BaseModel):
+    """
+    Avaliação Elo atual de um time, única entre divisões: o time leva a
+    avaliação consigo quando sobe ou desce de série.
+    """
+
+    team = models.OneToOneField(
+        "clubs.Team", on_delete=models.CASCADE, related_name="elo_rating"
+    )
+    rating = models.FloatField()
+    games = models.PositiveIntegerField(default=0)
+
+    def __str__(self):
+        return f"{self.team.name}: {self.rating:.0f}"
+
+    class Meta:
+        verbose_name = "Avaliação Elo"
+        verbose_name_plural = "Avaliações Elo"
+        ordering = ["-rating"]
+
+
+class EloRatingChange(models.Model):
+    """
+    Histórico de avaliações, apenas por inserção: uma linha por partida com
+    as avaliações anteriores dos dois times e a variação aplicada (somada ao
+    mandante e subtraída do visitante).
+    """
+
+    match = models.OneToOneField(
+        Match, on_delete=models.CASCADE, related_name="elo_change"
+    )
+    home_team = models.ForeignKey(
+        "clubs.Team", on_delete=models.CASCADE, related_name="+", db_index=False
+    )
+    away_team = models.ForeignKey(
+        "clubs.Team", on_delete=models.CASCADE, related_name="+", db_index=False
+    )
+    date = models.DateTimeField()
+    home_rating = models.FloatField()
+    away_rating = models.FloatField()
+    delta = models.FloatField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    @property
+    def home_rating_after(self) -> float:
+        return self.home_rating + self.delta
+
+    @property
+    def away_rating_after(self) -> float:
+        return self.away_rating - self.delta
+
+    class Meta:
+        verbose_name = "Variação Elo"
+        verbose_name_plural = "Variações Elo"
+        ordering = ["date"]
+        indexes = [
+            models.Index(fields=["home_team", "date"], name="elo_home_date_idx"),
+            models.Index(fields=["away_team", "date"], name="elo_away_date_idx"),
+        ]
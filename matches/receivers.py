@@ -0,0 +1,111 @@
+from collections import defaultdict
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+from leagues.models import LeagueDivision
+from matches.cache import DivisionCache
+from matches.live import publish_match_events
+from matches.models import Match, Status
+from matches.services.prediction import MatchPredictionModel
+from matches.services.ratings import EloRatingService
+from matches.services.standings import StandingsService
+from matches.services.standings_history import StandingsHistoryService
+from matches.signals import (
+    fixtures_changed,
+    goal_recorded,
+    match_cancelled,
+    match_finished,
+    match_started,
+)
+
+
+@receiver(match_finished, sender=Match)
+def update_standings(sender, matches, **kwargs):
+    StandingsService.apply(matches)
+
+
+@receiver(match_finished, sender=Match)
+def update_elo_ratings(sender, matches, **kwargs):
+    EloRatingService.apply(matches)
+
+
+@receiver(match_finished, sender=Match)
+def update_prediction_models(sender, matches, **kwargs):
+    MatchPredictionModel.apply_finished(matches)
+
+
+@receiver(match_finished, sender=Match)
+def invalidate_standings_history(sender, matches, **kwargs):
+    rounds = defaultdict(set)
+    for match in matches:
+        rounds[match.league_division_id].add(match.round)
+    for division_id, division_rounds in rounds.items():
+        StandingsHistoryService.invalidate(
+            division_id, None if None in division_rounds else min(division_rounds)
+        )
+
+
+@receiver(post_save, sender=Match)
+@receiver(post_delete, sender=Match)
+def invalidate_corrected_result(sender, instance, **kwargs):
+    # Resultados corrigidos (ou partidas finalizadas removidas) mudam a
+    # tabela a partir da rodada da partida.
+    if instance.status == Status.FINISHED:
+        StandingsHistoryService.invalidate(
+            instance.league_division_id, instance.round
+        )
+        MatchPredictionModel.invalidate(instance.league_division_id)
+
+
+@receiver(post_save, sender=Match)
+@receiver(post_delete, sender=Match)
+@receiver(match_started, sender=Match)
+@receiver(match_cancelled, sender=Match)
+@receiver(goal_recorded, sender=Match)
+def invalidate_division_cache(sender, instance=None, match=None, **kwargs):
+    DivisionCache.invalidate([(instance or match).league_division_id])
+
+
+@receiver(match_finished, sender=Match)
+def invalidate_finished_divisions_cache(sender, matches, **kwargs):
+    DivisionCache.invalidate(match.league_division_id for match in matches)
+
+
+@receiver(fixtures_changed, sender=Match)
+def invalidate_fixtures_cache(sender, league_division_ids, **kwargs):
+    DivisionCache.invalidate(league_division_ids)
+
+
+@receiver(m2m_changed, sender=LeagueDivision.teams.through)
+def invalidate_membership_cache(sender, instance, action, reverse, pk_set, **kwargs):
+    if action not in ("post_add", "post_remove", "pre_clear"):
+        return
+    if not reverse:
+        DivisionCache.invalidate([instance.pk])
+    elif action == "pre_clear":
+        # ``team.league_divisions.clear()``: as divisões só são conhecidas
+        # antes da remoção.
+        DivisionCache.invalidate(
+            instance.league_divisions.values_list("pk", flat=True)
+        )
+    else:
+        DivisionCache.invalidate(pk_set)
+
+
+@receiver(match_started, sender=Match)
+def publish_started(sender, match, **kwargs):
+    publish_match_events("started", [match])
+
+
+@receiver(goal_recorded, sender=Match)
+def publish_goal(sender, match, **kwargs):
+    publish_match_events("goal", [match])
+
+
+@receiver(match_finished, sender=Match)
+def publish_finished(sender, matches, **kwargs):
+    publish_match_events("finished", matches)
+
+
+@receiver(match_cancelled, sender=Match)
+def publish_cancelled(sender, match, **kwargs):
+    publish_match_events("cancelled", [match])
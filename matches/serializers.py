@@ -0,0 +1,62 @@
+from rest_framework import serializers
+
+from clubs.models import Team
+from leagues.models import LeagueDivision
+from matches.models import Match, Standing
+
+
+class TeamSummarySerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Team
+        fields = ["id", "name"]
+
+
+class DivisionSummarySerializer(serializers.ModelSerializer):
+    class Meta:
+        model = LeagueDivision
+        fields = ["id", "name"]
+
+
+class MatchSerializer(serializers.ModelSerializer):
+    title = serializers.CharField(source="__str__", read_only=True)
+    home_team = TeamSummarySerializer(read_only=True)
+    away_team = TeamSummarySerializer(read_only=True)
+    league_division = DivisionSummarySerializer(read_only=True)
+
+    class Meta:
+        model = Match
+        fields = [
+            "id",
+            "title",
+            "league_division",
+            "round",
+            "date",
+            "status",
+            "home_team",
+            "away_team",
+            "home_score",
+            "away_score",
+            "home_points",
+            "away_points",
+            "updated_at",
+        ]
+        read_only_fields = fields
+
+
+class StandingSerializer(serializers.ModelSerializer):
+    team = TeamSummarySerializer(read_only=True)
+
+    class Meta:
+        model = Standing
+        fields = [
+            "team",
+            "points",
+            "games",
+            "wins",
+            "draws",
+            "losses",
+            "goals_for",
+            "goals_against",
+            "goal_difference",
+        ]
+        read_only_fields = fields
@@ -1,3 +1,50 @@
-from .fixture_generator import FixtureGeneratorService
+from .fixture_generator import (
+    FixtureGeneratorService,
+    FixturePreview,
+    FixtureRound,
+    ProposedFixture,
+)
+from .match_events import EventInput, MatchEventService
+from .prediction import MatchPrediction, MatchPredictionModel, TeamRating
+from .ratings import EloRatingService
+from .rescheduler import FixtureRescheduleService
+from .scheduler import MatchScheduler, generate_round_robin, iter_round_robin
+from .slot_calendar import SlotCalendar
+from .standings import StandingsService
+from .standings_engine import StandingsArrays, StandingsEngine
+from .standings_history import RoundSnapshot, StandingsHistoryService
+from .standings_query import StandingRow, StandingsQueryService
+from .season_simulator import SeasonSimulationService, TeamOdds
+from .season_fixture_generator import (
+    DivisionFixtureResult,
+    SeasonFixtureGeneratorService,
+)
 
-__all__ = ["FixtureGeneratorService"]
+__all__ = [
+    "DivisionFixtureResult",
+    "EloRatingService",
+    "EventInput",
+    "FixtureGeneratorService",
+    "FixturePreview",
+    "FixtureRescheduleService",
+    "FixtureRound",
+    "MatchEventService",
+    "MatchPrediction",
+    "MatchPredictionModel",
+    "MatchScheduler",
+    "ProposedFixture",
+    "RoundSnapshot",
+    "SeasonFixtureGeneratorService",
+    "SeasonSimulationService",
+    "SlotCalendar",
+    "StandingRow",
+    "StandingsArrays",
+    "StandingsEngine",
+    "StandingsHistoryService",
+    "StandingsQueryService",
+    "StandingsService",
+    "TeamOdds",
+    "TeamRating",
+    "generate_round_robin",
+    "iter_round_robin",
+]
@@ -1,15 +1,40 @@
+from collections import defaultdict
 from datetime import datetime, timedelta
-from typing import List, Optional
+from typing import Iterator, List, NamedTuple, Optional, Sequence
+from uuid import UUID
+from django.core.exceptions import ValidationError
 from django.db import transaction
 from django.utils import timezone
 from matches.models import Match, Status
+from matches.services.scheduler import MatchScheduler, generate_round_robin
+from matches.signals import fixtures_changed
 from leagues.models import LeagueDivision
 
 
+class FixtureRound(NamedTuple):
+    number: int
+    matches: List[Match]
+
+
+class ProposedFixture(NamedTuple):
+    home_team_id: UUID
+    away_team_id: UUID
+    round: int
+    date: datetime
+
+
+class FixturePreview(NamedTuple):
+    fixtures: List[ProposedFixture]
+    calendar_days: int
+    max_gap: timedelta
+    min_rest: timedelta
+
+
 class FixtureGeneratorService:
     DAYS_BETWEEN_MATCHES = 3
     MAX_MATCHES_PER_DAY = 5
     MATCH_TIME_SLOTS = ["16:00", "18:30", "21:00"]
+    BULK_BATCH_SIZE = 500
 
     def __init__(
         self, league_division: LeagueDivision, start_date: Optional[datetime] = None
@@ -19,7 +44,13 @@ class FixtureGeneratorService:
         self.teams = list(league_division.teams.all())
         self.matches_created = []
 
-    def generate_fixtures(self) -> List[Match]:
+    def generate_fixtures(self, bulk: bool = False) -> List[Match]:
+        """
+        Gera e persiste os confrontos da divisão.
+
+        Com ``bulk=True`` a lista completa é validada em memória e gravada com
+        inserts em lote, sem o ``full_clean()`` por partida.
+        """
         if len(self.teams) < 2:
             raise ValueError("É necessário pelo menos 2 times para gerar confrontos.")
 
@@ -27,125 +58,170 @@ class FixtureGeneratorService:
             self._clear_existing_matches()
             round_robin_matches = self._generate_round_robin()
             self._schedule_matches(round_robin_matches)
+            if bulk:
+                self.bulk_create_matches()
+            else:
+                self._create_matches()
+            fixtures_changed.send(
+                sender=Match, league_division_ids=[self.league_division.pk]
+            )
 
         return self.matches_created
 
+    def iter_rounds(self) -> Iterator[FixtureRound]:
+        """
+        Produz o calendário rodada a rodada, com partidas ainda não salvas,
+        sem montar a lista completa nem tocar no banco. Quem consome decide
+        como transmitir ou persistir cada rodada (ex.: ``bulk_create`` em
+        blocos).
+        """
+        if len(self.teams) < 2:
+            raise ValueError("É necessário pelo menos 2 times para gerar confrontos.")
+
+        teams_by_id = {team.id: team for team in self.teams}
+        scheduler = MatchScheduler(**self.scheduler_options())
+        for round_num, fixtures in scheduler.iter_rounds(list(teams_by_id)):
+            yield FixtureRound(
+                round_num,
+                [
+                    Match(
+                        home_team=teams_by_id[home_id],
+                        away_team=teams_by_id[away_id],
+                        league_division=self.league_division,
+                        round=round_num,
+                        date=slot_dt,
+                        status=Status.SCHEDULED,
+                    )
+                    for home_id, away_id, slot_dt in fixtures
+                ],
+            )
+
+    def preview(
+        self,
+        start_date: Optional[datetime] = None,
+        rest_days: Optional[int] = None,
+        max_matches_per_day: Optional[int] = None,
+        time_slots: Optional[Sequence[str]] = None,
+    ) -> FixturePreview:
+        """
+        Simula o calendário sem gravar nada, permitindo comparar configurações
+        diferentes. Usa apenas os times já carregados, sem queries.
+        """
+        if len(self.teams) < 2:
+            raise ValueError("É necessário pelo menos 2 times para gerar confrontos.")
+
+        options = self.scheduler_options()
+        overrides = {
+            "start_date": start_date,
+            "rest_days": rest_days,
+            "max_matches_per_day": max_matches_per_day,
+            "time_slots": time_slots,
+        }
+        options.update({k: v for k, v in overrides.items() if v is not None})
+
+        fixtures = sorted(
+            (
+                ProposedFixture(*fixture)
+                for fixture in MatchScheduler(**options).schedule_round_robin(
+                    [team.id for team in self.teams]
+                )
+            ),
+            key=lambda fixture: fixture.date,
+        )
+
+        team_dates = defaultdict(list)
+        for fixture in fixtures:
+            team_dates[fixture.home_team_id].append(fixture.date)
+            team_dates[fixture.away_team_id].append(fixture.date)
+        gaps = [
+            current - previous
+            for dates in team_dates.values()
+            for previous, current in zip(dates, dates[1:])
+        ]
+
+        first_day = timezone.localtime(fixtures[0].date).date()
+        last_day = timezone.localtime(fixtures[-1].date).date()
+        return FixturePreview(
+            fixtures=fixtures,
+            calendar_days=(last_day - first_day).days + 1,
+            max_gap=max(gaps, default=timedelta(0)),
+            min_rest=min(gaps, default=timedelta(0)),
+        )
+
     def _clear_existing_matches(self):
         Match.objects.filter(
             league_division=self.league_division, status=Status.SCHEDULED
         ).delete()
 
     def _generate_round_robin(self) -> List[tuple]:
-        teams = self.teams.copy()
-        has_bye = len(teams) % 2 != 0
-        if has_bye:
-            teams.append(None)
+        return generate_round_robin(self.teams)
 
-        n = len(teams)
-        first_leg = []
-
-        cur = teams
-        for round_num in range(n - 1):
-            for i in range(n // 2):
-                t1 = cur[i]
-                t2 = cur[n - 1 - i]
-                if t1 is None or t2 is None:
-                    continue
-                first_leg.append((t1, t2, round_num + 1))
-            cur = [cur[0]] + [cur[-1]] + cur[1:-1]
-
-        second_leg = [(a, h, r + (n - 1)) for (h, a, r) in first_leg]
-
-        return first_leg + second_leg
+    def scheduler_options(self) -> dict:
+        return {
+            "start_date": self.start_date,
+            "rest_days": self.DAYS_BETWEEN_MATCHES,
+            "max_matches_per_day": self.MAX_MATCHES_PER_DAY,
+            "time_slots": list(self.MATCH_TIME_SLOTS),
+            "tz": timezone.get_current_timezone(),
+        }
 
     def _schedule_matches(self, round_robin_matches: List[tuple]):
-        REST_DAYS = self.DAYS_BETWEEN_MATCHES
-        MAX_PER_DAY = self.MAX_MATCHES_PER_DAY
-        SLOTS = self.MATCH_TIME_SLOTS
-
-        start_dt = self.start_date
-        current_day = start_dt.date()
-
-        last_play_dt = {}
-        remaining = list(round_robin_matches)
-
-        while remaining:
-            matches_today = 0
-            teams_used_today = set()
-
-            daily_slots = []
-            if current_day == start_dt.date():
-                for s in SLOTS:
-                    h, m = map(int, s.split(":"))
-                    slot_dt = timezone.make_aware(
-                        datetime(
-                            current_day.year,
-                            current_day.month,
-                            current_day.day,
-                            h,
-                            m,
-                            0,
-                        )
-                    )
-                    if slot_dt >= start_dt:
-                        daily_slots.append((s, slot_dt))
-            else:
-                for s in SLOTS:
-                    h, m = map(int, s.split(":"))
-                    slot_dt = timezone.make_aware(
-                        datetime(
-                            current_day.year,
-                            current_day.month,
-                            current_day.day,
-                            h,
-                            m,
-                            0,
-                        )
-                    )
-                    daily_slots.append((s, slot_dt))
-
-            if not daily_slots:
-                current_day += timedelta(days=1)
-                continue
-
-            for i in range(len(remaining) - 1, -1, -1):
-                if matches_today >= MAX_PER_DAY or not daily_slots:
-                    break
-
-                home_team, away_team, _round = remaining[i]
-                h_id, a_id = home_team.id, away_team.id
-
-                if h_id in teams_used_today or a_id in teams_used_today:
-                    continue
-
-                slot_str, slot_dt = daily_slots[0]
-
-                h_last = last_play_dt.get(h_id)
-                a_last = last_play_dt.get(a_id)
-                if h_last is not None and (slot_dt - h_last) < timedelta(
-                    days=REST_DAYS
-                ):
-                    continue
-                if a_last is not None and (slot_dt - a_last) < timedelta(
-                    days=REST_DAYS
-                ):
-                    continue
-
-                daily_slots.pop(0)
-
-                match = Match.objects.create(
-                    home_team=home_team,
-                    away_team=away_team,
+        schedule = MatchScheduler(**self.scheduler_options()).schedule(
+            (home.id, away.id, round_num)
+            for home, away, round_num in round_robin_matches
+        )
+        self.build_matches(schedule)
+
+    def build_matches(self, schedule: List[tuple]):
+        """
+        Monta (sem gravar) as partidas de um calendário de
+        ``MatchScheduler.schedule`` em ``matches_created``.
+        """
+        teams_by_id = {team.id: team for team in self.teams}
+        schedule = sorted(schedule, key=lambda fixture: fixture[3])
+
+        for home_id, away_id, round_num, slot_dt in schedule:
+            self.matches_created.append(
+                Match(
+                    home_team=teams_by_id[home_id],
+                    away_team=teams_by_id[away_id],
                     league_division=self.league_division,
+                    round=round_num,
                     date=slot_dt,
                     status=Status.SCHEDULED,
                 )
-
-                self.matches_created.append(match)
-                last_play_dt[h_id] = slot_dt
-                last_play_dt[a_id] = slot_dt
-                teams_used_today.update((h_id, a_id))
-                remaining.pop(i)
-                matches_today += 1
-
-            current_day += timedelta(days=1)
+            )
+
+    def _create_matches(self):
+        for match in self.matches_created:
+            match.save(force_insert=True)
+
+    def bulk_create_matches(self):
+        """
+        Valida ``matches_created`` contra as partidas da divisão e grava tudo
+        em lote. Levanta ``ValidationError`` em caso de confronto repetido.
+        """
+        self._validate_fixtures(self.matches_created)
+        Match.objects.bulk_create(self.matches_created, batch_size=self.BULK_BATCH_SIZE)
+
+    def _validate_fixtures(self, matches: List[Match]):
+        """
+        Replica em memória as regras de ``Match.clean()`` para a lista inteira,
+        consultando as partidas já existentes na divisão uma única vez.
+        """
+        seen = set(
+            Match.objects.filter(league_division=self.league_division)
+            .exclude(status=Status.CANCELLED)
+            .values_list("home_team_id", "away_team_id")
+        )
+        for match in matches:
+            if match.home_team_id == match.away_team_id:
+                raise ValidationError("Um time não pode jogar contra si mesmo.")
+
+            pair = (match.home_team_id, match.away_team_id)
+            if pair in seen:
+                raise ValidationError(
+                    f"Já existe uma partida entre {match.home_team.name} (casa) "
+                    f"e {match.away_team.name} (fora) nesta divisão."
+                )
+            seen.add(pair)
@@ -0,0 +1,124 @@
+from typing import Iterable, List, NamedTuple, Optional, Tuple
+from uuid import UUID
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.db.models import F, Max, QuerySet
+from django.utils import timezone
+from matches.models import EventType, Match, MatchEvent, Status
+from matches.signals import goal_recorded
+from leagues.models import LeagueDivision
+
+
+class EventInput(NamedTuple):
+    type: int
+    minute: int
+    team_id: Optional[UUID] = None
+
+
+class MatchEventService:
+    """
+    Ingestão em lote, apenas por inserção, dos eventos de uma partida em
+    andamento.
+
+    Cada lote custa um UPDATE na partida (placar incremental e trava da
+    linha), a leitura da última sequência pelo índice e um INSERT em lote.
+    """
+
+    TEAM_EVENTS = {
+        EventType.GOAL,
+        EventType.OWN_GOAL,
+        EventType.YELLOW_CARD,
+        EventType.RED_CARD,
+        EventType.SUBSTITUTION,
+    }
+
+    def __init__(self, match: Match):
+        self.match = match
+
+    def append(self, events: Iterable[EventInput]) -> List[MatchEvent]:
+        events = [EventInput(*event) for event in events]
+        if not events:
+            return []
+
+        home_goals, away_goals = self._score_delta(events)
+
+        with transaction.atomic():
+            updated = Match.objects.filter(
+                pk=self.match.pk, status=Status.IN_PROGRESS
+            ).update(
+                home_score=F("home_score") + home_goals,
+                away_score=F("away_score") + away_goals,
+                updated_at=timezone.now(),
+            )
+            if not updated:
+                raise ValidationError(
+                    "A partida deve estar em andamento para registrar eventos."
+                )
+
+            last = (
+                MatchEvent.objects.filter(match=self.match).aggregate(
+                    last=Max("sequence")
+                )["last"]
+                or 0
+            )
+            created = MatchEvent.objects.bulk_create(
+                MatchEvent(
+                    match=self.match,
+                    league_division_id=self.match.league_division_id,
+                    round=self.match.round,
+                    sequence=last + i,
+                    type=event.type,
+                    minute=event.minute,
+                    team_id=event.team_id,
+                )
+                for i, event in enumerate(events, start=1)
+            )
+
+        self.match.refresh_from_db(fields=["home_score", "away_score", "updated_at"])
+        if home_goals or away_goals:
+            goal_recorded.send(sender=Match, match=self.match)
+        return created
+
+    def timeline(self) -> QuerySet:
+        return MatchEvent.objects.filter(match=self.match).order_by("sequence")
+
+    def score_from_events(self) -> Tuple[int, int]:
+        """Reconstrói o placar a partir da linha do tempo gravada."""
+        return self._score_delta(
+            EventInput(type, minute, team_id)
+            for type, minute, team_id in self.timeline().values_list(
+                "type", "minute", "team_id"
+            )
+        )
+
+    @staticmethod
+    def round_events(league_division: LeagueDivision, round: int) -> QuerySet:
+        return MatchEvent.objects.filter(
+            league_division=league_division, round=round
+        ).order_by("match", "sequence")
+
+    def _score_delta(self, events: Iterable[EventInput]) -> Tuple[int, int]:
+        home_id, away_id = self.match.home_team_id, self.match.away_team_id
+        home_goals = away_goals = 0
+        for event in events:
+            if event.type not in EventType.values:
+                raise ValidationError(f"Tipo de evento desconhecido: {event.type}.")
+            if event.minute < 0:
+                raise ValidationError("O minuto do evento não pode ser negativo.")
+            if event.type in self.TEAM_EVENTS and event.team_id not in (
+                home_id,
+                away_id,
+            ):
+                raise ValidationError("O time do evento não está nesta partida.")
+
+            if event.type == EventType.GOAL:
+                scored_home = event.team_id == home_id
+            elif event.type == EventType.OWN_GOAL:
+                scored_home = event.team_id == away_id
+            else:
+                continue
+            if scored_home:
+                home_goals += 1
+            else:
+                away_goals += 1
+        return home_goals, away_goals
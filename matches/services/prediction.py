@@ -0,0 +1,227 @@
+import math
+from collections import defaultdict
+from typing import Dict, Iterable, List, NamedTuple, Sequence, Tuple
+from uuid import UUID
+import numpy as np
+from matches.cache import CacheVersion
+from matches.models import Match, Status
+from leagues.models import LeagueDivision
+
+
+class MatchPrediction(NamedTuple):
+    """Vetores alinhados com os confrontos passados para ``predict``."""
+
+    home_goals: np.ndarray
+    away_goals: np.ndarray
+    home_win: np.ndarray
+    draw: np.ndarray
+    away_win: np.ndarray
+
+
+class TeamRating(NamedTuple):
+    attack: float = 0.0
+    defence: float = 0.0
+    # Incrementada a cada resultado aplicado; invalida o cache de previsões.
+    version: int = 0
+
+
+class MatchPredictionModel:
+    """
+    Modelo de Poisson com força de ataque e de defesa por time.
+
+    Os gols esperados são ``exp(base + ataque - defesa do adversário)``, com
+    bases diferentes para mandante e visitante. O ajuste é incremental: cada
+    resultado aplica um passo de gradiente da verossimilhança de Poisson e só
+    altera os dois times da partida, então refazer o histórico é o mesmo que
+    aplicar as partidas uma a uma, em ordem.
+
+    ``predict`` calcula vários confrontos de uma vez e guarda cada previsão
+    até que a avaliação de um dos dois times mude.
+    """
+
+    HOME_GOALS = 1.5
+    AWAY_GOALS = 1.1
+    LEARNING_RATE = 0.05
+    MAX_GOALS = 10
+
+    # Modelo de cada divisão neste processo, com a versão de previsão que ele
+    # reflete.
+    _division_models: Dict[UUID, Tuple[int, "MatchPredictionModel"]] = {}
+
+    def __init__(self):
+        self.ratings: Dict[UUID, TeamRating] = {}
+        self._cache: Dict[Tuple[UUID, UUID], Tuple[int, int, tuple]] = {}
+
+    @classmethod
+    def fit(cls, matches: Iterable[Match]) -> "MatchPredictionModel":
+        model = cls()
+        model.apply(matches)
+        return model
+
+    @classmethod
+    def from_division(
+        cls, league_division: LeagueDivision
+    ) -> "MatchPredictionModel":
+        model = cls()
+        for row in (
+            Match.objects.filter(
+                league_division=league_division, status=Status.FINISHED
+            )
+            .order_by("date", "pk")
+            .values_list("home_team_id", "away_team_id", "home_score", "away_score")
+            .iterator()
+        ):
+            model.update(*row)
+        return model
+
+    @classmethod
+    def for_division(
+        cls, league_division: LeagueDivision
+    ) -> "MatchPredictionModel":
+        """
+        Modelo da divisão mantido neste processo.
+
+        Cada divisão tem uma versão de previsão, trocada depois do commit de
+        cada finalização e de cada correção de resultado. Quem finaliza aplica
+        os resultados ao próprio modelo de forma incremental
+        (``apply_finished``) e acompanha a versão; o modelo só é refeito a
+        partir das partidas gravadas quando a versão muda por outro caminho:
+        correções (``invalidate``) ou resultados gravados por outro processo.
+        Como tudo acontece depois do commit, resultados desfeitos nunca entram
+        no modelo.
+        """
+        version = cls._version(league_division.pk).get()
+        cached = cls._division_models.get(league_division.pk)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        model = cls.from_division(league_division)
+        cls._division_models[league_division.pk] = (version, model)
+        return model
+
+    @classmethod
+    def apply_finished(cls, matches: Iterable[Match]):
+        """Aplica, depois do commit, as partidas finalizadas aos modelos."""
+        by_division = defaultdict(list)
+        for match in matches:
+            by_division[match.league_division_id].append(match)
+
+        for division_id, division_matches in by_division.items():
+
+            def apply(old, new, division_id=division_id, finished=division_matches):
+                cached = cls._division_models.get(division_id)
+                if cached is None:
+                    return
+                if cached[0] != old or new != old + 1:
+                    # O modelo já estava atrás: refaz na próxima leitura.
+                    del cls._division_models[division_id]
+                    return
+                cached[1].apply(finished)
+                cls._division_models[division_id] = (new, cached[1])
+
+            cls._version(division_id).bump_on_commit(apply)
+
+    @classmethod
+    def invalidate(cls, league_division_id):
+        """Refaz os modelos da divisão depois do commit (resultado corrigido)."""
+        cls._version(league_division_id).bump_on_commit()
+
+    @staticmethod
+    def _version(league_division_id) -> CacheVersion:
+        return CacheVersion(f"match-prediction:{league_division_id}:version")
+
+    def rating(self, team_id: UUID) -> TeamRating:
+        return self.ratings.get(team_id, TeamRating())
+
+    def apply(self, matches: Iterable[Match]):
+        for match in matches:
+            self.update(
+                match.home_team_id,
+                match.away_team_id,
+                match.home_score,
+                match.away_score,
+            )
+
+    def update(self, home_id: UUID, away_id: UUID, home_score: int, away_score: int):
+        home, away = self.rating(home_id), self.rating(away_id)
+        home_goals, away_goals = self._expected_goals(home, away)
+        home_error = home_score - home_goals
+        away_error = away_score - away_goals
+
+        step = self.LEARNING_RATE
+        self.ratings[home_id] = TeamRating(
+            home.attack + step * home_error,
+            home.defence - step * away_error,
+            home.version + 1,
+        )
+        self.ratings[away_id] = TeamRating(
+            away.attack + step * away_error,
+            away.defence - step * home_error,
+            away.version + 1,
+        )
+
+    def predict(self, fixtures: Sequence[Tuple[UUID, UUID]]) -> MatchPrediction:
+        rows: List[tuple] = [None] * len(fixtures)
+        missing = []
+        for i, (home_id, away_id) in enumerate(fixtures):
+            cached = self._cache.get((home_id, away_id))
+            versions = (self.rating(home_id).version, self.rating(away_id).version)
+            if cached is not None and cached[:2] == versions:
+                rows[i] = cached[2]
+            else:
+                missing.append(i)
+
+        if missing:
+            computed = self._predict([fixtures[i] for i in missing])
+            for i, row in zip(missing, zip(*computed)):
+                home_id, away_id = fixtures[i]
+                rows[i] = row
+                self._cache[(home_id, away_id)] = (
+                    self.rating(home_id).version,
+                    self.rating(away_id).version,
+                    row,
+                )
+
+        if not rows:
+            return MatchPrediction(*(np.empty(0) for _ in MatchPrediction._fields))
+        return MatchPrediction(*map(np.array, zip(*rows)))
+
+    def _predict(self, fixtures: Sequence[Tuple[UUID, UUID]]) -> MatchPrediction:
+        home_attack, home_defence, away_attack, away_defence = np.array(
+            [
+                (
+                    self.rating(home_id).attack,
+                    self.rating(home_id).defence,
+                    self.rating(away_id).attack,
+                    self.rating(away_id).defence,
+                )
+                for home_id, away_id in fixtures
+            ]
+        ).T
+        home_goals = self.HOME_GOALS * np.exp(home_attack - away_defence)
+        away_goals = self.AWAY_GOALS * np.exp(away_attack - home_defence)
+
+        goals = np.arange(self.MAX_GOALS + 1)
+        factorials = np.array([math.factorial(g) for g in goals], dtype=float)
+
+        def pmf(rate):
+            return np.exp(-rate[:, None]) * rate[:, None] ** goals / factorials
+
+        # joint[f, h, a]: probabilidade do placar h x a no confronto f.
+        joint = pmf(home_goals)[:, :, None] * pmf(away_goals)[:, None, :]
+        joint /= joint.sum(axis=(1, 2), keepdims=True)
+        home_win = np.tril(np.ones((len(goals), len(goals))), -1).astype(bool)
+        return MatchPrediction(
+            home_goals,
+            away_goals,
+            joint[:, home_win].sum(axis=1),
+            np.trace(joint, axis1=1, axis2=2),
+            joint[:, home_win.T].sum(axis=1),
+        )
+
+    def _expected_goals(
+        self, home: TeamRating, away: TeamRating
+    ) -> Tuple[float, float]:
+        return (
+            self.HOME_GOALS * math.exp(home.attack - away.defence),
+            self.AWAY_GOALS * math.exp(away.attack - home.defence),
+        )
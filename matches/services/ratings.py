@@ -0,0 +1,193 @@
+from typing import Dict, Iterable, List, Optional, Tuple
+from uuid import UUID
+from django.db import transaction
+from django.db.models import QuerySet
+from django.utils import timezone
+from matches.models import EloRating, EloRatingChange, Match, Status
+from leagues.models import LeagueDivision
+
+
+class EloRatingService:
+    """
+    Avaliação Elo de cada time, atualizada dentro da transação que finaliza
+    as partidas.
+
+    Cada partida custa O(1): lê e atualiza apenas as linhas atuais dos dois
+    times e acrescenta uma linha ao histórico. Um lote de partidas usa um
+    número constante de consultas. A avaliação é única por time, então
+    continua válida quando ele muda de série; times novos começam em
+    ``INITIAL_RATING`` menos ``TIER_GAP`` por nível abaixo da divisão de topo.
+    """
+
+    INITIAL_RATING = 1500.0
+    TIER_GAP = 100.0
+    K_FACTOR = 20.0
+    HOME_ADVANTAGE = 60.0
+    REBUILD_BATCH_SIZE = 2000
+
+    @classmethod
+    def expected_home_score(cls, home_rating: float, away_rating: float) -> float:
+        difference = away_rating - (home_rating + cls.HOME_ADVANTAGE)
+        return 1 / (1 + 10 ** (difference / 400))
+
+    @classmethod
+    def delta(
+        cls, home_rating: float, away_rating: float, home_score: int, away_score: int
+    ) -> float:
+        if home_score > away_score:
+            result = 1.0
+        elif home_score == away_score:
+            result = 0.5
+        else:
+            result = 0.0
+        return cls.K_FACTOR * (
+            result - cls.expected_home_score(home_rating, away_rating)
+        )
+
+    @classmethod
+    def apply(cls, matches: Iterable[Match]) -> List[EloRatingChange]:
+        matches = sorted(matches, key=lambda m: (m.date, m.pk))
+        if not matches:
+            return []
+
+        team_ids = {m.home_team_id for m in matches}
+        team_ids.update(m.away_team_id for m in matches)
+        with transaction.atomic():
+            ratings = {
+                row.team_id: row
+                for row in EloRating.objects.select_for_update().filter(
+                    team_id__in=team_ids
+                )
+            }
+            missing = team_ids - ratings.keys()
+            if missing:
+                cls._create_missing(matches, missing)
+                ratings.update(
+                    (row.team_id, row)
+                    for row in EloRating.objects.select_for_update().filter(
+                        team_id__in=missing
+                    )
+                )
+
+            changes = [cls._play(match, ratings) for match in matches]
+            now = timezone.now()
+            for row in ratings.values():
+                row.updated_at = now
+            EloRating.objects.bulk_update(
+                ratings.values(), ["rating", "games", "updated_at"]
+            )
+            return EloRatingChange.objects.bulk_create(changes)
+
+    @classmethod
+    def rebuild(cls) -> Tuple[int, int]:
+        """
+        Refaz todas as avaliações a partir das partidas finalizadas, em ordem
+        de data. As partidas são lidas em fluxo, sem consultas por partida.
+        Retorna ``(times, partidas)``.
+        """
+        tiers = cls._division_tiers()
+        ratings: Dict[UUID, EloRating] = {}
+        played = 0
+
+        with transaction.atomic():
+            EloRatingChange.objects.all().delete()
+            EloRating.objects.all().delete()
+
+            batch = []
+            for match in cls._finished_matches().iterator(
+                chunk_size=cls.REBUILD_BATCH_SIZE
+            ):
+                for team_id in (match.home_team_id, match.away_team_id):
+                    if team_id not in ratings:
+                        ratings[team_id] = EloRating(
+                            team_id=team_id,
+                            rating=cls._initial_rating(
+                                tiers.get(match.league_division_id, 0)
+                            ),
+                        )
+                batch.append(cls._play(match, ratings))
+                played += 1
+                if len(batch) >= cls.REBUILD_BATCH_SIZE:
+                    EloRatingChange.objects.bulk_create(batch)
+                    batch = []
+            EloRatingChange.objects.bulk_create(batch)
+            EloRating.objects.bulk_create(
+                ratings.values(), batch_size=cls.REBUILD_BATCH_SIZE
+            )
+
+        return len(ratings), played
+
+    @classmethod
+    def _play(cls, match: Match, ratings: Dict[UUID, EloRating]) -> EloRatingChange:
+        home, away = ratings[match.home_team_id], ratings[match.away_team_id]
+        delta = cls.delta(home.rating, away.rating, match.home_score, match.away_score)
+        change = EloRatingChange(
+            match_id=match.pk,
+            home_team_id=match.home_team_id,
+            away_team_id=match.away_team_id,
+            date=match.date,
+            home_rating=home.rating,
+            away_rating=away.rating,
+            delta=delta,
+        )
+        home.rating += delta
+        away.rating -= delta
+        home.games += 1
+        away.games += 1
+        return change
+
+    @classmethod
+    def _create_missing(cls, matches: List[Match], missing: set):
+        division_ids = {}
+        for match in matches:
+            for team_id in (match.home_team_id, match.away_team_id):
+                if team_id in missing:
+                    division_ids.setdefault(team_id, match.league_division_id)
+
+        tiers = cls._division_tiers()
+        EloRating.objects.bulk_create(
+            [
+                EloRating(
+                    team_id=team_id,
+                    rating=cls._initial_rating(tiers.get(division_id, 0)),
+                )
+                for team_id, division_id in division_ids.items()
+            ],
+            ignore_conflicts=True,
+        )
+
+    @classmethod
+    def _initial_rating(cls, tier: int) -> float:
+        return cls.INITIAL_RATING - cls.TIER_GAP * tier
+
+    @staticmethod
+    def _division_tiers() -> Dict[UUID, int]:
+        """Nível de cada divisão (0 = topo) a partir de ``parent_league``."""
+        parents: Dict[UUID, Optional[UUID]] = dict(
+            LeagueDivision.objects.values_list("pk", "parent_league_id")
+        )
+        tiers = {}
+        for division_id in parents:
+            depth, current, seen = 0, division_id, {division_id}
+            while parents.get(current) is not None and parents[current] not in seen:
+                current = parents[current]
+                seen.add(current)
+                depth += 1
+            tiers[division_id] = depth
+        return tiers
+
+    @staticmethod
+    def _finished_matches() -> QuerySet:
+        return (
+            Match.objects.filter(status=Status.FINISHED)
+            .order_by("date", "pk")
+            .only(
+                "pk",
+                "home_team_id",
+                "away_team_id",
+                "league_division_id",
+                "date",
+                "home_score",
+                "away_score",
+            )
+        )
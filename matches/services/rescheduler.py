@@ -0,0 +1,132 @@
+from bisect import bisect_left, insort
+from collections import Counter, defaultdict
+from datetime import date, datetime, timedelta
+from itertools import count
+from typing import Iterable, List, Optional
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.utils import timezone
+from matches.models import Match, Status
+from matches.services.fixture_generator import FixtureGeneratorService
+from matches.services.slot_calendar import SlotCalendar
+from matches.signals import fixtures_changed
+from leagues.models import LeagueDivision
+
+
+class FixtureRescheduleService:
+    """
+    Remarca apenas as partidas informadas (canceladas ou adiadas, isto é,
+    ainda agendadas) sem regenerar o calendário da divisão.
+
+    As demais partidas são lidas uma única vez para montar a ocupação de
+    horários e times; as remarcadas são gravadas com um único UPDATE em lote.
+    """
+
+    DAYS_BETWEEN_MATCHES = FixtureGeneratorService.DAYS_BETWEEN_MATCHES
+    MAX_MATCHES_PER_DAY = FixtureGeneratorService.MAX_MATCHES_PER_DAY
+    MATCH_TIME_SLOTS = FixtureGeneratorService.MATCH_TIME_SLOTS
+
+    def __init__(
+        self,
+        league_division: LeagueDivision,
+        not_before: Optional[datetime] = None,
+        calendar: Optional[SlotCalendar] = None,
+    ):
+        self.league_division = league_division
+        self.calendar = calendar or SlotCalendar(
+            not_before or timezone.now(), self.MATCH_TIME_SLOTS
+        )
+        self.not_before = not_before or self.calendar.start
+        self.rest = timedelta(days=self.DAYS_BETWEEN_MATCHES)
+        self.day_capacity = min(
+            self.MAX_MATCHES_PER_DAY, self.calendar.slots_per_day
+        )
+
+    def reschedule(self, matches: Iterable[Match]) -> List[Match]:
+        matches = sorted(matches, key=lambda m: m.date)
+        for match in matches:
+            if match.league_division_id != self.league_division.pk:
+                raise ValidationError("A partida não pertence a esta divisão.")
+            if match.status not in (Status.SCHEDULED, Status.CANCELLED):
+                raise ValidationError(
+                    "Apenas partidas agendadas ou canceladas podem ser remarcadas."
+                )
+
+        with transaction.atomic():
+            self._load_occupancy(exclude=[m.pk for m in matches])
+
+            now = timezone.now()
+            for match in matches:
+                self._check_duplicate(match)
+                slot_dt = self._find_slot(match.home_team_id, match.away_team_id)
+                self._occupy(match.home_team_id, match.away_team_id, slot_dt)
+                match.date = slot_dt
+                match.status = Status.SCHEDULED
+                match.updated_at = now
+
+            Match.objects.bulk_update(matches, ["date", "status", "updated_at"])
+            fixtures_changed.send(
+                sender=Match, league_division_ids=[self.league_division.pk]
+            )
+
+        return matches
+
+    def _load_occupancy(self, exclude: List):
+        self.team_dates = defaultdict(list)
+        self.taken_slots = set()
+        self.day_count = Counter()
+        self.pairs = set()
+
+        active = (
+            Match.objects.filter(league_division=self.league_division)
+            .exclude(status=Status.CANCELLED)
+            .exclude(pk__in=exclude)
+            .values_list("home_team_id", "away_team_id", "date")
+        )
+        for home_id, away_id, match_dt in active:
+            self.pairs.add((home_id, away_id))
+            self._occupy(home_id, away_id, match_dt)
+
+    def _occupy(self, home_id, away_id, match_dt: datetime):
+        insort(self.team_dates[home_id], match_dt)
+        insort(self.team_dates[away_id], match_dt)
+        self.taken_slots.add(match_dt)
+        self.day_count[self._local_date(match_dt)] += 1
+
+    def _check_duplicate(self, match: Match):
+        pair = (match.home_team_id, match.away_team_id)
+        if pair in self.pairs:
+            raise ValidationError(
+                f"Já existe uma partida entre {match.home_team.name} (casa) "
+                f"e {match.away_team.name} (fora) nesta divisão."
+            )
+        self.pairs.add(pair)
+
+    def _find_slot(self, home_id, away_id) -> datetime:
+        first_day = self.calendar.day_of(
+            self.calendar.first_at_or_after(self.not_before)
+        )
+        for day in count(first_day):
+            if self.day_count[self.calendar.day_date(day)] >= self.day_capacity:
+                continue
+            for slot_dt in self.calendar.day_slots(day):
+                if slot_dt < self.not_before or slot_dt in self.taken_slots:
+                    continue
+                if self._is_rested(home_id, slot_dt) and self._is_rested(
+                    away_id, slot_dt
+                ):
+                    return slot_dt
+
+    def _is_rested(self, team_id, slot_dt: datetime) -> bool:
+        dates = self.team_dates[team_id]
+        i = bisect_left(dates, slot_dt)
+        for neighbour in dates[max(i - 1, 0) : i + 1]:
+            if abs(slot_dt - neighbour) < self.rest:
+                return False
+            if self._local_date(neighbour) == self._local_date(slot_dt):
+                return False
+        return True
+
+    def _local_date(self, match_dt: datetime) -> date:
+        # Dias no fuso do calendário, o mesmo de ``SlotCalendar.day_date``.
+        return timezone.localtime(match_dt, self.calendar.tz).date()
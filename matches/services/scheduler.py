@@ -0,0 +1,174 @@
+from datetime import datetime, timedelta, tzinfo
+from typing import (
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
+
+from matches.services.slot_calendar import SlotCalendar
+
+T = TypeVar("T", bound=Hashable)
+
+
+def iter_round_robin(teams: Sequence[T]) -> Iterator[Tuple[int, List[Tuple[T, T]]]]:
+    """
+    Gera os confrontos de ida e volta pelo método do círculo, uma rodada por
+    vez: ``(rodada, [(mandante, visitante), ...])``. Apenas a rotação atual
+    fica em memória; com número ímpar de times, cada rodada tem uma folga.
+    """
+    teams = list(teams)
+    if len(teams) % 2 != 0:
+        teams.append(None)
+
+    n = len(teams)
+    for leg in range(2):
+        cur = teams
+        for round_num in range(n - 1):
+            fixtures = []
+            for i in range(n // 2):
+                t1 = cur[i]
+                t2 = cur[n - 1 - i]
+                if t1 is None or t2 is None:
+                    continue
+                fixtures.append((t1, t2) if leg == 0 else (t2, t1))
+            yield round_num + 1 + leg * (n - 1), fixtures
+            cur = [cur[0]] + [cur[-1]] + cur[1:-1]
+
+
+def generate_round_robin(teams: Sequence[T]) -> List[Tuple[T, T, int]]:
+    """Lista completa ``(mandante, visitante, rodada)`` de ``iter_round_robin``."""
+    return [
+        (home, away, round_num)
+        for round_num, fixtures in iter_round_robin(teams)
+        for home, away in fixtures
+    ]
+
+
+class MatchScheduler:
+    """
+    Motor de agendamento em memória, sem acesso ao banco.
+
+    Os horários formam uma sequência global de slots (dia a dia, na ordem de
+    ``time_slots``). Cada time guarda o índice do primeiro slot em que pode
+    voltar a jogar e os slots ocupados (ou de dias lotados) são pulados por
+    ponteiros com compressão de caminho, então cada confronto é posicionado
+    sem reescanear os pendentes.
+    """
+
+    def __init__(
+        self,
+        start_date: datetime,
+        rest_days: int = 3,
+        max_matches_per_day: int = 5,
+        time_slots: Sequence[str] = ("16:00", "18:30", "21:00"),
+        tz: Optional[tzinfo] = None,
+        calendar: Optional[SlotCalendar] = None,
+    ):
+        if max_matches_per_day < 1:
+            raise ValueError("O limite diário de partidas deve ser positivo.")
+
+        self._owns_calendar = calendar is None
+        self.calendar = calendar or SlotCalendar(start_date, time_slots, tz=tz)
+        self.tz = self.calendar.tz
+        self.start_date = self.calendar.start
+        self.rest = timedelta(days=rest_days)
+        self.day_capacity = min(max_matches_per_day, self.calendar.slots_per_day)
+
+        self._day_count: Dict[int, int] = {}
+        self._skip: Dict[int, int] = {}
+        self._next_available: Dict[Hashable, int] = {}
+
+    def schedule_round_robin(
+        self, team_ids: Sequence[T]
+    ) -> List[Tuple[T, T, int, datetime]]:
+        return self.schedule(generate_round_robin(team_ids))
+
+    def iter_rounds(
+        self, team_ids: Sequence[T]
+    ) -> Iterator[Tuple[int, List[Tuple[T, T, datetime]]]]:
+        """
+        Agenda o turno e o returno rodada a rodada, produzindo
+        ``(rodada, [(mandante, visitante, data), ...])`` sem montar a lista
+        completa de confrontos. Com calendário próprio, os slots que nenhum
+        time pode mais usar são descartados a cada rodada, então a memória
+        não cresce com o tamanho do campeonato.
+        """
+        team_ids = list(team_ids)
+        for round_num, fixtures in iter_round_robin(team_ids):
+            yield round_num, [
+                (home, away, slot_dt)
+                for home, away, _round, slot_dt in self.iter_schedule(
+                    (home, away, round_num) for home, away in fixtures
+                )
+            ]
+            if self._owns_calendar:
+                self._release_unreachable(team_ids)
+
+    def schedule(
+        self, fixtures: Iterable[Tuple[T, T, int]]
+    ) -> List[Tuple[T, T, int, datetime]]:
+        """
+        Posiciona cada confronto no primeiro slot livre em que os dois times
+        já cumpriram o descanso. Retorna ``(mandante, visitante, rodada, data)``
+        na ordem recebida.
+        """
+        return list(self.iter_schedule(fixtures))
+
+    def iter_schedule(
+        self, fixtures: Iterable[Tuple[T, T, int]]
+    ) -> Iterator[Tuple[T, T, int, datetime]]:
+        for home, away, round_num in fixtures:
+            index = self._find_free(
+                max(
+                    self._next_available.get(home, 0),
+                    self._next_available.get(away, 0),
+                )
+            )
+            slot_dt = self._occupy(index)
+            next_index = self._first_available_after(index)
+            self._next_available[home] = next_index
+            self._next_available[away] = next_index
+            yield home, away, round_num, slot_dt
+
+    def _release_unreachable(self, team_ids: Sequence[T]):
+        lowest = min(self._next_available.get(team, 0) for team in team_ids)
+        first_day = self.calendar.day_of(lowest)
+        self.calendar.release_before(lowest)
+        for index in [i for i in self._skip if i < lowest]:
+            del self._skip[index]
+        for day in [d for d in self._day_count if d < first_day]:
+            del self._day_count[day]
+
+    def _find_free(self, index: int) -> int:
+        path = []
+        while True:
+            nxt = self._skip.get(index)
+            if nxt is None:
+                break
+            path.append(index)
+            index = nxt
+        for visited in path:
+            self._skip[visited] = index
+        return index
+
+    def _occupy(self, index: int) -> datetime:
+        self._skip[index] = index + 1
+        day = self.calendar.day_of(index)
+        self._day_count[day] = self._day_count.get(day, 0) + 1
+        if self._day_count[day] >= self.day_capacity:
+            first, end = self.calendar.day_bounds(day)
+            for slot in range(first, end):
+                self._skip[slot] = end
+        return self.calendar.slot(index)
+
+    def _first_available_after(self, index: int) -> int:
+        # Nunca no mesmo dia, mesmo com descanso zero.
+        next_day_start = self.calendar.day_bounds(self.calendar.day_of(index))[1]
+        target = self.calendar.slot(index) + self.rest
+        return max(self.calendar.first_at_or_after(target), next_day_start)
@@ -0,0 +1,108 @@
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import List, Optional
+
+import django
+from django.db import transaction
+from django.utils import timezone
+from leagues.models import LeagueDivision, LeagueSeason
+from matches.models import Match, Status
+from matches.services.fixture_generator import FixtureGeneratorService
+from matches.services.scheduler import MatchScheduler
+from matches.signals import fixtures_changed
+
+
+def _compute_schedule(team_ids: list, options: dict) -> tuple:
+    # Executado nos processos do pool: apenas o motor em memória, sem ORM.
+    started = time.perf_counter()
+    schedule = MatchScheduler(**options).schedule_round_robin(team_ids)
+    return schedule, time.perf_counter() - started
+
+
+@dataclass
+class DivisionFixtureResult:
+    division: LeagueDivision
+    matches: List[Match]
+    compute_seconds: float
+    persist_seconds: float = 0.0
+
+
+class SeasonFixtureGeneratorService:
+    """
+    Gera os confrontos de todas as divisões de uma temporada.
+
+    Os calendários são calculados em paralelo num pool de processos e depois
+    gravados numa única transação, com inserts em lote por divisão.
+    """
+
+    def __init__(
+        self,
+        season: LeagueSeason,
+        start_date: Optional[datetime] = None,
+        max_workers: Optional[int] = None,
+    ):
+        self.season = season
+        self.start_date = start_date or timezone.now() + timedelta(days=7)
+        self.max_workers = max_workers
+        self.generators = [
+            FixtureGeneratorService(division, start_date=self.start_date)
+            for division in season.divisions.prefetch_related("teams").order_by(
+                "name"
+            )
+        ]
+
+    def generate_fixtures(self) -> List[DivisionFixtureResult]:
+        for generator in self.generators:
+            if len(generator.teams) < 2:
+                raise ValueError(
+                    f"A divisão {generator.league_division.name} precisa de pelo "
+                    "menos 2 times para gerar confrontos."
+                )
+
+        results = self._compute_schedules()
+        self._persist(results)
+        return results
+
+    def _compute_schedules(self) -> List[DivisionFixtureResult]:
+        with ProcessPoolExecutor(
+            max_workers=self.max_workers, initializer=django.setup
+        ) as pool:
+            futures = [
+                pool.submit(
+                    _compute_schedule,
+                    [team.id for team in generator.teams],
+                    generator.scheduler_options(),
+                )
+                for generator in self.generators
+            ]
+
+            results = []
+            for generator, future in zip(self.generators, futures):
+                schedule, elapsed = future.result()
+                generator.build_matches(schedule)
+                results.append(
+                    DivisionFixtureResult(
+                        division=generator.league_division,
+                        matches=generator.matches_created,
+                        compute_seconds=elapsed,
+                    )
+                )
+        return results
+
+    def _persist(self, results: List[DivisionFixtureResult]):
+        with transaction.atomic():
+            Match.objects.filter(
+                league_division__in=[r.division for r in results],
+                status=Status.SCHEDULED,
+            ).delete()
+
+            for generator, result in zip(self.generators, results):
+                started = time.perf_counter()
+                generator.bulk_create_matches()
+                result.persist_seconds = time.perf_counter() - started
+
+            fixtures_changed.send(
+                sender=Match, league_division_ids=[r.division.pk for r in results]
+            )
@@ -0,0 +1,212 @@
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+from uuid import UUID
+
+import django
+import numpy as np
+from leagues.models import LeagueDivision
+from matches.models import Match, Status
+from matches.services.prediction import MatchPredictionModel
+from matches.services.standings_engine import StandingsEngine
+
+
+def _simulate_chunk(
+    engine: StandingsEngine,
+    rates: Tuple[np.ndarray, np.ndarray],
+    simulations: int,
+    seed: np.random.SeedSequence,
+) -> Tuple[np.ndarray, np.ndarray]:
+    # Executado nos processos do pool: apenas NumPy, sem ORM.
+    rng = np.random.default_rng(seed)
+    remaining = np.flatnonzero(~engine.played)
+    home_scores = np.tile(engine.home_scores, (simulations, 1))
+    away_scores = np.tile(engine.away_scores, (simulations, 1))
+    # Os gols sorteados somam-se ao placar atual das partidas em andamento.
+    home_scores[:, remaining] += rng.poisson(rates[0], (simulations, len(remaining)))
+    away_scores[:, remaining] += rng.poisson(rates[1], (simulations, len(remaining)))
+
+    table = engine.table(home_scores, away_scores)
+    teams = len(engine.team_ids)
+    # positions[t, p]: quantas simulações terminaram com o time t na posição p.
+    cells = table.order * teams + np.arange(teams)
+    positions = np.bincount(cells.ravel(), minlength=teams * teams)
+    return positions.reshape(teams, teams), table.points.sum(axis=0)
+
+
+@dataclass
+class TeamOdds:
+    team_id: UUID
+    team_name: str
+    expected_points: float
+    title: float
+    libertadores: float
+    relegation: float
+    promotion: float
+    # Probabilidade de terminar em cada posição (índice 0 = campeão).
+    positions: np.ndarray
+
+
+class SeasonSimulationService:
+    """
+    Simula o restante da temporada de uma divisão pelo método de Monte Carlo.
+
+    Os resultados finalizados ficam fixos; cada partida agendada ou em
+    andamento recebe gols sorteados de distribuições de Poisson, com médias
+    estimadas pelo ataque e pela defesa de cada time nos jogos já disputados
+    ou, se informado, pelo ``MatchPredictionModel``. Nas partidas em
+    andamento os gols sorteados somam-se ao placar atual, com a média
+    reduzida ao tempo que falta (``StandingsEngine.remaining``). As simulações são
+    divididas em lotes vetorizados (``StandingsEngine``) e executadas num
+    pool de processos.
+
+    A vaga na Libertadores só existe para a divisão de topo (sem
+    ``parent_league``), o acesso só para divisões com uma divisão acima e o
+    rebaixamento só para divisões com uma divisão abaixo.
+    """
+
+    LIBERTADORES_PLACES = 6
+    RELEGATION_PLACES = 4
+    PROMOTION_PLACES = 4
+    CHUNK_SIZE = 5_000
+    # Jogos "virtuais" na média da liga somados a cada time, para que poucos
+    # resultados não produzam forças extremas.
+    PRIOR_GAMES = 5
+    DEFAULT_HOME_GOALS = 1.5
+    DEFAULT_AWAY_GOALS = 1.1
+
+    def __init__(
+        self,
+        league_division: LeagueDivision,
+        simulations: int = 10_000,
+        max_workers: Optional[int] = None,
+        seed: Optional[int] = None,
+        model: Optional[MatchPredictionModel] = None,
+    ):
+        self.league_division = league_division
+        self.simulations = simulations
+        self.max_workers = max_workers
+        self.seed = seed
+        self.model = model
+
+    def simulate(self) -> List[TeamOdds]:
+        engine = StandingsEngine.from_queryset(
+            Match.objects.filter(
+                league_division=self.league_division,
+                status__in=[Status.FINISHED, Status.IN_PROGRESS, Status.SCHEDULED],
+            )
+        )
+        positions, points = self._run(engine, self._goal_rates(engine))
+        teams = len(engine.team_ids)
+        probabilities = positions / self.simulations
+
+        has_lower = LeagueDivision.objects.filter(
+            parent_league=self.league_division
+        ).exists()
+        zones = {
+            "title": slice(0, 1),
+            "libertadores": (
+                slice(0, self.LIBERTADORES_PLACES)
+                if self.league_division.parent_league_id is None
+                else slice(0, 0)
+            ),
+            "relegation": (
+                slice(teams - self.RELEGATION_PLACES, teams)
+                if has_lower
+                else slice(0, 0)
+            ),
+            "promotion": (
+                slice(0, self.PROMOTION_PLACES)
+                if self.league_division.parent_league_id is not None
+                else slice(0, 0)
+            ),
+        }
+
+        odds = [
+            TeamOdds(
+                team_id=team_id,
+                team_name=engine.team_names[i],
+                expected_points=float(points[i] / self.simulations),
+                positions=probabilities[i],
+                **{
+                    zone: float(probabilities[i, places].sum())
+                    for zone, places in zones.items()
+                },
+            )
+            for i, team_id in enumerate(engine.team_ids)
+        ]
+        return sorted(odds, key=lambda o: (-o.expected_points, o.team_name))
+
+    def _run(self, engine, rates) -> Tuple[np.ndarray, np.ndarray]:
+        chunks = [
+            min(self.CHUNK_SIZE, self.simulations - start)
+            for start in range(0, self.simulations, self.CHUNK_SIZE)
+        ]
+        seeds = np.random.SeedSequence(self.seed).spawn(len(chunks))
+        args = [(engine, rates, size, seed) for size, seed in zip(chunks, seeds)]
+
+        if len(chunks) == 1 or self.max_workers == 1:
+            results = [_simulate_chunk(*a) for a in args]
+        else:
+            with ProcessPoolExecutor(
+                max_workers=self.max_workers, initializer=django.setup
+            ) as pool:
+                results = list(pool.map(_simulate_chunk, *zip(*args)))
+
+        positions = sum(r[0] for r in results)
+        points = sum(r[1] for r in results)
+        return positions, points
+
+    def _goal_rates(self, engine: StandingsEngine) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Médias de gols de mandante e visitante no tempo que falta de cada
+        partida restante.
+        """
+        remaining = np.flatnonzero(~engine.played)
+        home_rates, away_rates = self._match_rates(engine, remaining)
+        fraction = engine.remaining[remaining]
+        return home_rates * fraction, away_rates * fraction
+
+    def _match_rates(
+        self, engine: StandingsEngine, remaining: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Médias de gols de mandante e visitante numa partida inteira."""
+        played = engine.played
+        if self.model is not None:
+            team_ids = engine.team_ids
+            prediction = self.model.predict(
+                [
+                    (team_ids[engine.home[i]], team_ids[engine.away[i]])
+                    for i in remaining
+                ]
+            )
+            return prediction.home_goals, prediction.away_goals
+
+        home, away = engine.home[played], engine.away[played]
+        home_scores = engine.home_scores[played]
+        away_scores = engine.away_scores[played]
+        teams = len(engine.team_ids)
+
+        if played.any():
+            home_avg = max(home_scores.mean(), 0.1)
+            away_avg = max(away_scores.mean(), 0.1)
+        else:
+            home_avg, away_avg = self.DEFAULT_HOME_GOALS, self.DEFAULT_AWAY_GOALS
+        avg = (home_avg + away_avg) / 2
+
+        games = np.bincount(home, minlength=teams) + np.bincount(away, minlength=teams)
+        scored = np.bincount(home, home_scores, teams) + np.bincount(
+            away, away_scores, teams
+        )
+        conceded = np.bincount(home, away_scores, teams) + np.bincount(
+            away, home_scores, teams
+        )
+        prior = self.PRIOR_GAMES * avg
+        attack = (scored + prior) / ((games + self.PRIOR_GAMES) * avg)
+        defense = (conceded + prior) / ((games + self.PRIOR_GAMES) * avg)
+
+        home_team, away_team = engine.home[remaining], engine.away[remaining]
+        return (
+            home_avg * attack[home_team] * defense[away_team],
+            away_avg * attack[away_team] * defense[home_team],
+        )
@@ -0,0 +1,163 @@
+from bisect import bisect_left
+from datetime import date, datetime, time, timedelta, timezone as dt_timezone, tzinfo
+from typing import List, Optional, Sequence, Tuple
+
+from django.utils import timezone
+
+
+def parse_time_slots(time_slots: Sequence[str]) -> List[time]:
+    return sorted(time(*map(int, s.split(":"))) for s in time_slots)
+
+
+def make_slot(day: date, slot_time: time, tz: tzinfo) -> datetime:
+    """
+    Monta o horário local ``day`` + ``slot_time`` já com fuso.
+
+    Horários ambíguos (fim do horário de verão) usam a primeira ocorrência;
+    horários inexistentes (início do horário de verão) avançam para o
+    instante equivalente depois da mudança, ex.: 00:30 vira 01:30.
+    """
+    naive = datetime.combine(day, slot_time)
+    aware = naive.replace(tzinfo=tz)
+    normalized = aware.astimezone(dt_timezone.utc).astimezone(tz)
+    if normalized.replace(tzinfo=None) != naive:
+        return normalized
+    return aware
+
+
+class SlotCalendar:
+    """
+    Sequência de horários de partida (dia a dia, em ordem cronológica) a partir
+    de ``start``.
+
+    Os horários são convertidos uma única vez e cada dia é materializado sob
+    demanda, então o mesmo calendário pode ser compartilhado entre o
+    agendamento, a remarcação e consultas de calendário. Os índices de slot e
+    de dia são estáveis, inclusive depois de ``release_before``.
+    """
+
+    def __init__(
+        self,
+        start: datetime,
+        time_slots: Sequence[str],
+        tz: Optional[tzinfo] = None,
+        end: Optional[date] = None,
+    ):
+        if not time_slots:
+            raise ValueError("É necessário pelo menos um horário de partida.")
+
+        self.tz = tz or timezone.get_current_timezone()
+        if timezone.is_naive(start):
+            start = make_slot(start.date(), start.time(), self.tz)
+        self.start = start
+        self.times = parse_time_slots(time_slots)
+        self.first_date = timezone.localtime(start, self.tz).date()
+
+        # Slots e dias anteriores a ``_offset``/``_day_offset`` já foram
+        # descartados; as listas guardam só a janela ainda utilizável.
+        self._offset = 0
+        self._day_offset = 0
+        self._slots: List[datetime] = []
+        self._slot_day: List[int] = []
+        self._day_bounds: List[Tuple[int, int]] = []
+
+        if end is not None:
+            self._ensure_day((end - self.first_date).days)
+
+    @property
+    def slots_per_day(self) -> int:
+        return len(self.times)
+
+    @property
+    def first_slot(self) -> int:
+        """Menor índice de slot ainda disponível."""
+        return self._offset
+
+    @property
+    def end_slot(self) -> int:
+        """Índice seguinte ao último slot já materializado."""
+        return self._offset + len(self._slots)
+
+    def slot(self, index: int) -> datetime:
+        self._ensure_slot(index)
+        return self._slots[self._slot_position(index)]
+
+    def day_of(self, index: int) -> int:
+        self._ensure_slot(index)
+        return self._slot_day[self._slot_position(index)]
+
+    def day_bounds(self, day: int) -> Tuple[int, int]:
+        """Intervalo ``[início, fim)`` dos índices de slot do dia ``day``."""
+        self._ensure_day(day)
+        if day < self._day_offset:
+            raise IndexError(f"O dia {day} já foi descartado do calendário.")
+        return self._day_bounds[day - self._day_offset]
+
+    def day_date(self, day: int) -> date:
+        return self.first_date + timedelta(days=day)
+
+    def day_slots(self, day: int) -> List[datetime]:
+        first, end = self.day_bounds(day)
+        return self._slots[max(first - self._offset, 0) : end - self._offset]
+
+    def first_at_or_after(self, moment: datetime) -> int:
+        """Índice do primeiro slot (não descartado) em ``moment`` ou depois."""
+        while not self._slots or self._slots[-1] < moment:
+            self._add_day()
+        return self._offset + bisect_left(self._slots, moment)
+
+    def between(self, start: datetime, end: datetime) -> List[datetime]:
+        """Slots em ``[start, end)``."""
+        first = self.first_at_or_after(start) - self._offset
+        return self._slots[first : self.first_at_or_after(end) - self._offset]
+
+    def release_before(self, index: int):
+        """
+        Descarta os slots anteriores a ``index`` (e os dias que terminam antes
+        dele), mantendo a memória limitada à janela ainda utilizável.
+        """
+        drop = min(index, self.end_slot) - self._offset
+        if drop <= 0:
+            return
+        del self._slots[:drop]
+        del self._slot_day[:drop]
+        self._offset += drop
+
+        days = 0
+        while (
+            days < len(self._day_bounds) and self._day_bounds[days][1] <= self._offset
+        ):
+            days += 1
+        del self._day_bounds[:days]
+        self._day_offset += days
+
+    def _slot_position(self, index: int) -> int:
+        if index < self._offset:
+            raise IndexError(f"O slot {index} já foi descartado do calendário.")
+        return index - self._offset
+
+    def _add_day(self):
+        day_index = self._day_offset + len(self._day_bounds)
+        day = self.first_date + timedelta(days=day_index)
+        first = self.end_slot
+        # Um horário inexistente avançado por ``make_slot`` pode passar de um
+        # horário seguinte do mesmo dia: ordena para manter a busca binária.
+        slots = sorted(
+            (
+                slot_dt
+                for slot_dt in (make_slot(day, t, self.tz) for t in self.times)
+                if slot_dt >= self.start
+            ),
+            key=lambda slot_dt: slot_dt.astimezone(dt_timezone.utc),
+        )
+        self._slots.extend(slots)
+        self._slot_day.extend([day_index] * len(slots))
+        self._day_bounds.append((first, self.end_slot))
+
+    def _ensure_slot(self, index: int):
+        while self.end_slot <= index:
+            self._add_day()
+
+    def _ensure_day(self, day: int):
+        while self._day_offset + len(self._day_bounds) <= day:
+            self._add_day()
@@ -0,0 +1,141 @@
+from collections import Counter, defaultdict
+from typing import Dict, Iterable, List, Tuple
+from django.db import transaction
+from django.db.models import Case, F, Q, QuerySet, Value, When
+from django.utils import timezone
+from matches.cache import DivisionCache
+from matches.models import Match, Standing, Status
+from leagues.models import LeagueDivision
+
+STAT_FIELDS = (
+    "points",
+    "games",
+    "wins",
+    "draws",
+    "losses",
+    "goals_for",
+    "goals_against",
+    "goal_difference",
+)
+
+
+class StandingsService:
+    """
+    Mantém a tabela materializada (``Standing``) de cada divisão.
+
+    ``apply`` é chamado dentro da transação que finaliza as partidas e só
+    incrementa as linhas dos times envolvidos; ``rebuild`` recalcula uma
+    divisão do zero a partir das partidas finalizadas.
+
+    Cada ``apply`` custa um número constante de consultas (INSERT das linhas
+    que faltam, leitura das chaves e um único UPDATE com incrementos ``F``),
+    independentemente de quantas partidas foram finalizadas no lote.
+    """
+
+    @staticmethod
+    def table(league_division: LeagueDivision) -> QuerySet:
+        return Standing.objects.filter(league_division=league_division).order_by(
+            "-points", "-wins", "-goal_difference", "-goals_for"
+        )
+
+    @classmethod
+    def apply(cls, matches: Iterable[Match]):
+        deltas = cls._aggregate(
+            (
+                match.league_division_id,
+                match.home_team_id,
+                match.away_team_id,
+                match.home_score,
+                match.away_score,
+            )
+            for match in matches
+        )
+        if not deltas:
+            return
+
+        with transaction.atomic():
+            Standing.objects.bulk_create(
+                [
+                    Standing(league_division_id=division_id, team_id=team_id)
+                    for division_id, team_id in deltas
+                ],
+                ignore_conflicts=True,
+            )
+            keys = Q()
+            for division_id, team_id in deltas:
+                keys |= Q(league_division_id=division_id, team_id=team_id)
+            rows = {
+                (division_id, team_id): pk
+                for pk, division_id, team_id in Standing.objects.filter(keys)
+                .order_by()
+                .values_list("pk", "league_division_id", "team_id")
+            }
+            Standing.objects.filter(pk__in=rows.values()).update(
+                updated_at=timezone.now(),
+                **{
+                    field: F(field)
+                    + Case(
+                        *(
+                            When(pk=rows[key], then=Value(delta[field]))
+                            for key, delta in deltas.items()
+                            if delta[field]
+                        ),
+                        default=Value(0),
+                    )
+                    for field in STAT_FIELDS
+                },
+            )
+
+    @classmethod
+    def rebuild(cls, league_division: LeagueDivision) -> List[Standing]:
+        finished = (
+            Match.objects.filter(
+                league_division=league_division, status=Status.FINISHED
+            )
+            .order_by()
+            .values_list(
+                "league_division_id",
+                "home_team_id",
+                "away_team_id",
+                "home_score",
+                "away_score",
+            )
+        )
+        deltas = cls._aggregate(finished.iterator())
+        team_ids = set(league_division.teams.values_list("pk", flat=True))
+        team_ids.update(team_id for _division, team_id in deltas)
+
+        with transaction.atomic():
+            Standing.objects.filter(league_division=league_division).delete()
+            DivisionCache.invalidate([league_division.pk])
+            return Standing.objects.bulk_create(
+                Standing(
+                    league_division=league_division,
+                    team_id=team_id,
+                    **deltas.get((league_division.pk, team_id), {}),
+                )
+                for team_id in team_ids
+            )
+
+    @staticmethod
+    def _aggregate(results: Iterable[Tuple]) -> Dict[Tuple, Counter]:
+        deltas = defaultdict(Counter)
+        for division_id, home_id, away_id, home_score, away_score in results:
+            for team_id, scored, conceded in (
+                (home_id, home_score, away_score),
+                (away_id, away_score, home_score),
+            ):
+                delta = deltas[(division_id, team_id)]
+                delta["games"] += 1
+                delta["goals_for"] += scored
+                delta["goals_against"] += conceded
+                delta["goal_difference"] += scored - conceded
+                if scored > conceded:
+                    delta["wins"] += 1
+                    delta["points"] += 3
+                elif scored == conceded:
+                    delta["draws"] += 1
+                    delta["points"] += 1
+                else:
+                    delta["losses"] += 1
+        return deltas
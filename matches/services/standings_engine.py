@@ -0,0 +1,255 @@
+from datetime import datetime
+from typing import List, NamedTuple, Optional, Tuple
+from uuid import UUID
+import numpy as np
+from django.db.models import QuerySet
+from django.utils import timezone
+from matches.models import Match, Status
+from leagues.models import LeagueDivision
+
+
+class StandingsArrays(NamedTuple):
+    """
+    Totais por time, indexados como ``StandingsEngine.team_ids``. Com placares
+    em lote (``(simulações, partidas)``) cada campo ganha a mesma dimensão
+    inicial. ``order[..., k]`` é o índice do time na posição ``k``.
+    """
+
+    points: np.ndarray
+    games: np.ndarray
+    wins: np.ndarray
+    draws: np.ndarray
+    losses: np.ndarray
+    goals_for: np.ndarray
+    goals_against: np.ndarray
+    goal_difference: np.ndarray
+    order: np.ndarray
+
+
+class StandingsEngine:
+    """
+    Classificação vetorizada para análises que recalculam a tabela muitas
+    vezes com resultados diferentes.
+
+    As partidas são lidas uma única vez e guardadas como vetores de índices
+    de time; pontos, saldo e ordenação saem de operações NumPy, inclusive
+    para vários conjuntos de placares de uma vez. A pontuação é a mesma de
+    ``Match._calculate_points`` e a ordenação a mesma de
+    ``StandingsQueryService``: pontos, vitórias, saldo, gols marcados,
+    confronto direto (apenas entre dois clubes) e nome do time.
+    """
+
+    # Duração de referência de uma partida, para a fração ainda por disputar.
+    MATCH_MINUTES = 90
+
+    def __init__(
+        self,
+        team_ids: List[UUID],
+        home: np.ndarray,
+        away: np.ndarray,
+        home_scores: np.ndarray,
+        away_scores: np.ndarray,
+        team_names: Optional[List[str]] = None,
+        played: Optional[np.ndarray] = None,
+        remaining: Optional[np.ndarray] = None,
+    ):
+        self.team_ids = list(team_ids)
+        self.team_names = list(team_names or map(str, self.team_ids))
+        self.home = np.asarray(home, dtype=np.intp)
+        self.away = np.asarray(away, dtype=np.intp)
+        self.home_scores = np.asarray(home_scores, dtype=np.int64)
+        self.away_scores = np.asarray(away_scores, dtype=np.int64)
+        # Partidas já disputadas; as demais têm placar a definir.
+        self.played = (
+            np.ones(len(self.home), dtype=bool)
+            if played is None
+            else np.asarray(played, dtype=bool)
+        )
+        # Fração de cada partida ainda por disputar: 0 nas disputadas, 1 nas
+        # agendadas e o tempo restante nas em andamento.
+        self.remaining = (
+            np.where(self.played, 0.0, 1.0)
+            if remaining is None
+            else np.asarray(remaining, dtype=float)
+        )
+
+        teams = len(self.team_ids)
+        matches = len(self.home)
+        # Incidência partida x time: multiplica um vetor por partida e devolve
+        # a soma por time, para uma ou várias simulações. Em ponto flutuante
+        # para usar o BLAS; as somas de inteiros pequenos são exatas.
+        self._home_incidence = np.zeros((matches, teams))
+        self._away_incidence = np.zeros((matches, teams))
+        self._home_incidence[np.arange(matches), self.home] = 1
+        self._away_incidence[np.arange(matches), self.away] = 1
+
+    @classmethod
+    def from_division(
+        cls, league_division: LeagueDivision, until: Optional[datetime] = None
+    ) -> "StandingsEngine":
+        matches = Match.objects.filter(
+            league_division=league_division, status=Status.FINISHED
+        )
+        if until is not None:
+            matches = matches.filter(date__lte=until)
+        return cls.from_queryset(matches)
+
+    @classmethod
+    def from_queryset(cls, matches: QuerySet) -> "StandingsEngine":
+        """
+        Carrega as partidas com uma única consulta. As que não estão
+        finalizadas ficam marcadas em ``played`` como ainda por disputar, com
+        o placar atual e o tempo restante em ``remaining``; sem placares
+        explícitos, ``table`` conta todas as partidas carregadas.
+        """
+        rows = list(
+            matches.order_by().values_list(
+                "home_team_id",
+                "home_team__name",
+                "away_team_id",
+                "away_team__name",
+                "home_score",
+                "away_score",
+                "status",
+                "date",
+            )
+        )
+        now = timezone.now()
+
+        def remaining(status, date) -> float:
+            if status == Status.FINISHED:
+                return 0.0
+            if status != Status.IN_PROGRESS:
+                return 1.0
+            elapsed = (now - date).total_seconds() / 60
+            return min(max(1 - elapsed / cls.MATCH_MINUTES, 0.0), 1.0)
+
+        names = {}
+        for home_id, home_name, away_id, away_name, *_ in rows:
+            names[home_id] = home_name
+            names[away_id] = away_name
+        team_ids = sorted(names, key=names.get)
+        index = {team_id: i for i, team_id in enumerate(team_ids)}
+
+        return cls(
+            team_ids,
+            [index[row[0]] for row in rows],
+            [index[row[2]] for row in rows],
+            [row[4] for row in rows],
+            [row[5] for row in rows],
+            team_names=[names[team_id] for team_id in team_ids],
+            played=[row[6] == Status.FINISHED for row in rows],
+            remaining=[remaining(row[6], row[7]) for row in rows],
+        )
+
+    def points(
+        self,
+        home_scores: Optional[np.ndarray] = None,
+        away_scores: Optional[np.ndarray] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Pontos de mandante e visitante de cada partida."""
+        home_scores, away_scores = self._scores(home_scores, away_scores)
+        home_points = np.where(
+            home_scores > away_scores, 3, np.where(home_scores == away_scores, 1, 0)
+        )
+        return home_points, np.where(home_points == 1, 1, 3 - home_points)
+
+    def table(
+        self,
+        home_scores: Optional[np.ndarray] = None,
+        away_scores: Optional[np.ndarray] = None,
+    ) -> StandingsArrays:
+        home_scores, away_scores = self._scores(home_scores, away_scores)
+        home_points, away_points = self.points(home_scores, away_scores)
+
+        def per_team(home_values, away_values):
+            totals = home_values.astype(float) @ self._home_incidence
+            totals += away_values.astype(float) @ self._away_incidence
+            return totals.astype(np.int64)
+
+        points = per_team(home_points, away_points)
+        wins = per_team(home_points == 3, away_points == 3)
+        draws = per_team(home_points == 1, away_points == 1)
+        games = np.broadcast_to(
+            np.bincount(self.home, minlength=len(self.team_ids))
+            + np.bincount(self.away, minlength=len(self.team_ids)),
+            points.shape,
+        )
+        goals_for = per_team(home_scores, away_scores)
+        goals_against = per_team(away_scores, home_scores)
+        goal_difference = goals_for - goals_against
+
+        # lexsort usa a última chave como principal; o índice (ordem
+        # alfabética) é o critério final.
+        names = np.broadcast_to(np.arange(len(self.team_ids)), points.shape)
+        order = np.lexsort(
+            (names, -goals_for, -goal_difference, -wins, -points), axis=-1
+        )
+        criteria = np.stack([points, wins, goal_difference, goals_for], axis=-1)
+        order = self._head_to_head(order, criteria, home_points, away_points)
+
+        return StandingsArrays(
+            points,
+            games,
+            wins,
+            draws,
+            games - wins - draws,
+            goals_for,
+            goals_against,
+            goal_difference,
+            order,
+        )
+
+    def _scores(self, home_scores, away_scores):
+        if home_scores is None:
+            home_scores = self.home_scores
+        if away_scores is None:
+            away_scores = self.away_scores
+        return np.asarray(home_scores), np.asarray(away_scores)
+
+    def _head_to_head(self, order, criteria, home_points, away_points):
+        """
+        Troca as posições de pares empatados em todos os critérios gerais
+        quando o segundo fez mais pontos no confronto direto. Grupos de três
+        ou mais ficam na ordem alfabética.
+        """
+        teams = len(self.team_ids)
+        if teams < 2:
+            return order
+
+        batch = order.reshape(-1, teams).copy()
+        ranked = np.take_along_axis(
+            criteria.reshape(-1, teams, criteria.shape[-1]), batch[..., None], axis=1
+        )
+        tied = (ranked[:, 1:] == ranked[:, :-1]).all(axis=-1)
+        # Início de um grupo de exatamente dois: empata com o seguinte, mas
+        # não com o anterior nem o seguinte empata com o próximo.
+        padded = np.pad(tied, ((0, 0), (1, 1)))
+        pair = padded[:, 1:-1] & ~padded[:, :-2] & ~padded[:, 2:]
+        sims, positions = np.nonzero(pair)
+        if not len(sims):
+            return order
+
+        first = batch[sims, positions]
+        second = batch[sims, positions + 1]
+        h2h = self._pair_points(
+            home_points.reshape(-1, len(self.home)),
+            away_points.reshape(-1, len(self.home)),
+        )
+        swap = h2h[sims, second, first] > h2h[sims, first, second]
+        batch[sims[swap], positions[swap]] = second[swap]
+        batch[sims[swap], positions[swap] + 1] = first[swap]
+        return batch.reshape(order.shape)
+
+    def _pair_points(self, home_points, away_points) -> np.ndarray:
+        """``[simulação, i, j]``: pontos que ``i`` fez contra ``j``."""
+        sims = home_points.shape[0]
+        teams = len(self.team_ids)
+        size = teams * teams
+        offsets = (np.arange(sims) * size)[:, None]
+        home_cells = (offsets + self.home * teams + self.away).ravel()
+        away_cells = (offsets + self.away * teams + self.home).ravel()
+        totals = np.bincount(
+            home_cells, weights=home_points.ravel(), minlength=sims * size
+        ) + np.bincount(away_cells, weights=away_points.ravel(), minlength=sims * size)
+        return totals.reshape(sims, teams, teams)
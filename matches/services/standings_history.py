@@ -0,0 +1,241 @@
+from collections import defaultdict
+from copy import copy
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+from uuid import UUID
+from django.core.cache import cache as default_cache
+from django.db.models import Q
+from django.utils import timezone
+from matches.cache import CacheVersion
+from matches.models import Match, Status
+from matches.services.standings_query import StandingRow, rank_rows
+from leagues.models import LeagueDivision
+
+
+class RoundSnapshot(NamedTuple):
+    round: int
+    rows: List[StandingRow]
+    # Pontos de ``i`` contra ``j`` até esta rodada, para retomar o cálculo
+    # a partir do snapshot sem reler as rodadas anteriores.
+    head_to_head: Dict[Tuple[UUID, UUID], int]
+
+
+class StandingsHistoryService:
+    """
+    Classificação depois de cada rodada de uma divisão.
+
+    Todas as rodadas são calculadas numa única passada pelas partidas
+    finalizadas, acumulando os totais rodada a rodada. Cada snapshot fica em
+    cache por divisão e rodada; quando um resultado muda, só os snapshots a
+    partir da rodada alterada são descartados e o cálculo recomeça do último
+    snapshot válido.
+
+    As chaves levam uma versão por divisão (``CacheVersion``), trocada depois
+    do commit da escrita: snapshots calculados com dados
+    anteriores à escrita ficam na versão antiga e não são mais lidos.
+
+    As rodadas vêm de ``Match.round``. Divisões com partidas sem rodada
+    (criadas antes de a rodada ser gravada) usam os dias de jogo, em ordem,
+    como rodadas.
+    """
+
+    CACHE_TIMEOUT = 60 * 60 * 24
+
+    def __init__(self, league_division: LeagueDivision, cache=None):
+        self.league_division = league_division
+        self.cache = cache or default_cache
+
+    def snapshots(self) -> List[RoundSnapshot]:
+        version = self._version(self.cache, self.league_division.pk)
+        cached = self._cached_prefix(version)
+        resume = cached[-1] if cached else None
+
+        matches = Match.objects.filter(
+            league_division=self.league_division, status=Status.FINISHED
+        ).select_related("home_team", "away_team")
+        if resume is not None:
+            matches = matches.filter(
+                Q(round__gt=resume.round) | Q(round__isnull=True)
+            )
+        matches = list(matches.order_by("round", "date"))
+
+        if any(match.round is None for match in matches):
+            cached, resume = [], None
+            matches = list(
+                Match.objects.filter(
+                    league_division=self.league_division, status=Status.FINISHED
+                )
+                .select_related("home_team", "away_team")
+                .order_by("date")
+            )
+            by_round = self._group_by_day(matches)
+        else:
+            by_round = self._group_by_round(matches)
+
+        computed = list(self._accumulate(by_round, resume))
+        if computed:
+            self.cache.set_many(
+                {self._key(snap.round, version): snap for snap in computed},
+                self.CACHE_TIMEOUT,
+            )
+        snapshots = cached + computed
+        self.cache.set(
+            self._rounds_key(self.league_division.pk, version),
+            [snap.round for snap in snapshots],
+            self.CACHE_TIMEOUT,
+        )
+        return snapshots
+
+    def table_after(self, round: int) -> List[StandingRow]:
+        snapshot = self.cache.get(self._key(round))
+        if snapshot is None:
+            snapshot = next(
+                (snap for snap in self.snapshots() if snap.round == round), None
+            )
+        if snapshot is None:
+            raise LookupError(f"Rodada {round} sem partidas finalizadas.")
+        return snapshot.rows
+
+    @classmethod
+    def invalidate(
+        cls, league_division_id, from_round: Optional[int] = None, cache=None
+    ):
+        """
+        Descarta, depois do commit, os snapshots a partir de ``from_round``
+        (todos, se ``None``). A versão da divisão é trocada e os snapshots
+        anteriores a ``from_round`` são copiados para a nova versão.
+        """
+        cache = cache or default_cache
+
+        def keep_prefix(old: int, new: int):
+            if new != old + 1 or from_round is None:
+                # Outra invalidação entrou no meio: recalcula tudo.
+                return
+
+            rounds = cache.get(cls._rounds_key(league_division_id, old)) or []
+            kept = [r for r in rounds if r < from_round]
+            found = cache.get_many(
+                [cls._round_key(league_division_id, old, r) for r in kept]
+            )
+            prefix = {}
+            for r in kept:
+                snapshot = found.get(cls._round_key(league_division_id, old, r))
+                if snapshot is None:
+                    break
+                prefix[cls._round_key(league_division_id, new, r)] = snapshot
+            cache.set_many(prefix, cls.CACHE_TIMEOUT)
+            cache.set(
+                cls._rounds_key(league_division_id, new),
+                kept[: len(prefix)],
+                cls.CACHE_TIMEOUT,
+            )
+
+        CacheVersion(cls._version_key(league_division_id), cache).bump_on_commit(
+            keep_prefix
+        )
+
+    def _cached_prefix(self, version: int) -> List[RoundSnapshot]:
+        rounds = (
+            self.cache.get(self._rounds_key(self.league_division.pk, version)) or []
+        )
+        found = self.cache.get_many([self._key(r, version) for r in rounds])
+        prefix = []
+        for r in rounds:
+            if self._key(r, version) not in found:
+                break
+            prefix.append(found[self._key(r, version)])
+        return prefix
+
+    def _accumulate(
+        self,
+        by_round: Iterable[Tuple[int, List[Match]]],
+        resume: Optional[RoundSnapshot],
+    ) -> Iterable[RoundSnapshot]:
+        rows: Dict[UUID, StandingRow] = {}
+        head_to_head: Dict[Tuple[UUID, UUID], int] = defaultdict(int)
+        if resume is not None:
+            rows = {row.team_id: copy(row) for row in resume.rows}
+            head_to_head.update(resume.head_to_head)
+
+        def pair_points(groups):
+            points = defaultdict(int)
+            for a, b in groups:
+                points[a.team_id] = head_to_head.get((a.team_id, b.team_id), 0)
+                points[b.team_id] = head_to_head.get((b.team_id, a.team_id), 0)
+            return points
+
+        for round_num, matches in by_round:
+            for match in matches:
+                for team, scored, conceded, points, opponent in (
+                    (
+                        match.home_team,
+                        match.home_score,
+                        match.away_score,
+                        match.home_points,
+                        match.away_team_id,
+                    ),
+                    (
+                        match.away_team,
+                        match.away_score,
+                        match.home_score,
+                        match.away_points,
+                        match.home_team_id,
+                    ),
+                ):
+                    row = rows.get(team.pk)
+                    if row is None:
+                        row = rows[team.pk] = StandingRow(team.pk, team.name)
+                    row.points += points
+                    row.games += 1
+                    row.goals_for += scored
+                    row.goals_against += conceded
+                    if scored > conceded:
+                        row.wins += 1
+                    elif scored == conceded:
+                        row.draws += 1
+                    else:
+                        row.losses += 1
+                    head_to_head[(team.pk, opponent)] += points
+
+            yield RoundSnapshot(
+                round_num,
+                [copy(row) for row in rank_rows(rows.values(), pair_points)],
+                dict(head_to_head),
+            )
+
+    @staticmethod
+    def _group_by_round(matches: List[Match]) -> Iterable[Tuple[int, List[Match]]]:
+        grouped = defaultdict(list)
+        for match in matches:
+            grouped[match.round].append(match)
+        return sorted(grouped.items())
+
+    @staticmethod
+    def _group_by_day(matches: List[Match]) -> Iterable[Tuple[int, List[Match]]]:
+        grouped = defaultdict(list)
+        for match in matches:
+            grouped[timezone.localtime(match.date).date()].append(match)
+        return [
+            (round_num, grouped[day])
+            for round_num, day in enumerate(sorted(grouped), start=1)
+        ]
+
+    def _key(self, round: int, version: Optional[int] = None) -> str:
+        if version is None:
+            version = self._version(self.cache, self.league_division.pk)
+        return self._round_key(self.league_division.pk, version, round)
+
+    @classmethod
+    def _version(cls, cache, league_division_id) -> int:
+        return CacheVersion(cls._version_key(league_division_id), cache).get()
+
+    @staticmethod
+    def _version_key(league_division_id) -> str:
+        return f"standings-history:{league_division_id}:version"
+
+    @staticmethod
+    def _round_key(league_division_id, version: int, round: int) -> str:
+        return f"standings-history:{league_division_id}:v{version}:{round}"
+
+    @staticmethod
+    def _rounds_key(league_division_id, version: int) -> str:
+        return f"standings-history:{league_division_id}:v{version}:rounds"
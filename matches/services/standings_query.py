@@ -0,0 +1,139 @@
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import datetime
+from itertools import groupby
+from typing import Callable, Dict, Iterable, List, Optional
+from uuid import UUID
+from django.db.models import Case, Count, F, Q, Sum, When
+from matches.models import Match, Status
+from leagues.models import LeagueDivision
+
+
+@dataclass
+class StandingRow:
+    team_id: UUID
+    team_name: str
+    points: int = 0
+    games: int = 0
+    wins: int = 0
+    draws: int = 0
+    losses: int = 0
+    goals_for: int = 0
+    goals_against: int = 0
+
+    @property
+    def goal_difference(self) -> int:
+        return self.goals_for - self.goals_against
+
+    @property
+    def criteria(self) -> tuple:
+        return (self.points, self.wins, self.goal_difference, self.goals_for)
+
+
+def rank_rows(
+    rows: Iterable[StandingRow],
+    head_to_head: Callable[[List[List[StandingRow]]], Dict[UUID, int]],
+) -> List[StandingRow]:
+    """
+    Ordena pelos critérios gerais e pelo nome; ``head_to_head`` recebe os
+    pares empatados em todos eles e devolve os pontos de cada time nos
+    confrontos entre si. O confronto direto só desempata dois clubes; grupos
+    maiores seguem para os critérios seguintes (aqui, a ordem alfabética).
+    """
+    rows = sorted(
+        rows,
+        key=lambda row: (tuple(-value for value in row.criteria), row.team_name),
+    )
+    groups = [list(group) for _, group in groupby(rows, key=lambda row: row.criteria)]
+    tied = [group for group in groups if len(group) == 2]
+    if tied:
+        points = head_to_head(tied)
+        for group in tied:
+            group.sort(key=lambda row: -points.get(row.team_id, 0))
+    return [row for group in groups for row in group]
+
+
+class StandingsQueryService:
+    """
+    Calcula a classificação de uma divisão sob demanda, direto das partidas,
+    para qualquer data de corte.
+
+    Os totais vêm de uma única consulta agregada (mandantes e visitantes
+    agrupados e unidos). Os critérios de desempate seguem o regulamento:
+    pontos, vitórias, saldo de gols, gols marcados e confronto direto, este
+    último aplicado apenas aos grupos empatados, com uma consulta extra
+    para todos eles. Times sem partidas finalizadas até o corte não
+    aparecem na tabela.
+    """
+
+    def __init__(
+        self, league_division: LeagueDivision, until: Optional[datetime] = None
+    ):
+        self.league_division = league_division
+        self.until = until
+
+    def table(self) -> List[StandingRow]:
+        return rank_rows(self._aggregate().values(), self._head_to_head_points)
+
+    def _finished(self):
+        matches = Match.objects.filter(
+            league_division=self.league_division, status=Status.FINISHED
+        )
+        if self.until is not None:
+            matches = matches.filter(date__lte=self.until)
+        return matches.order_by()
+
+    def _aggregate(self) -> Dict[UUID, StandingRow]:
+        sides = [
+            self._finished()
+            .values(team_id=F(f"{side}_team_id"), team_name=F(f"{side}_team__name"))
+            .annotate(
+                points=Sum(f"{side}_points"),
+                games=Count("pk"),
+                wins=Sum(
+                    Case(
+                        When(**{f"{side}_score__gt": F(f"{other}_score")}, then=1),
+                        default=0,
+                    )
+                ),
+                draws=Sum(
+                    Case(When(home_score=F("away_score"), then=1), default=0)
+                ),
+                goals_for=Sum(f"{side}_score"),
+                goals_against=Sum(f"{other}_score"),
+            )
+            for side, other in (("home", "away"), ("away", "home"))
+        ]
+
+        # Sem ORDER BY na união: a ordem não importa aqui, e versões mais novas
+        # do Django recusam ordenações que não batem com as colunas do SELECT.
+        combined = sides[0].union(sides[1], all=True).order_by()
+        rows: Dict[UUID, StandingRow] = {}
+        for side in combined:
+            row = rows.setdefault(
+                side["team_id"], StandingRow(side["team_id"], side["team_name"])
+            )
+            row.points += side["points"]
+            row.games += side["games"]
+            row.wins += side["wins"]
+            row.draws += side["draws"]
+            row.losses += side["games"] - side["wins"] - side["draws"]
+            row.goals_for += side["goals_for"]
+            row.goals_against += side["goals_against"]
+        return rows
+
+    def _head_to_head_points(self, groups: List[List[StandingRow]]) -> Dict:
+        pairs = Q()
+        for group in groups:
+            team_ids = [row.team_id for row in group]
+            pairs |= Q(home_team_id__in=team_ids, away_team_id__in=team_ids)
+
+        points = defaultdict(int)
+        for home_id, away_id, home_points, away_points in (
+            self._finished()
+            .filter(pairs)
+            .values_list("home_team_id", "away_team_id", "home_points", "away_points")
+        ):
+            points[home_id] += home_points
+            points[away_id] += away_points
+        return points
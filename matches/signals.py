@@ -0,0 +1,17 @@
+from django.dispatch import Signal
+
+# As transições de ``Match`` são UPDATEs condicionais e não disparam
+# ``post_save``; estes sinais cobrem esses caminhos.
+
+# Enviado dentro da transação que finalizou as partidas, com
+# ``matches=[...]`` (uma ou várias, no caso da finalização em lote).
+match_finished = Signal()
+
+# Enviados com ``match=...`` depois da transição ou do gol gravado.
+match_started = Signal()
+match_cancelled = Signal()
+goal_recorded = Signal()
+
+# Enviado pelos caminhos em lote (geração e remarcação de confrontos), com
+# ``league_division_ids=[...]``.
+fixtures_changed = Signal()
@@ -0,0 +1,160 @@
+import pytest
+from datetime import timedelta
+from django.utils import timezone
+from django.utils.http import http_date
+from rest_framework.test import APIClient
+from clubs.tests.factories import TeamFactory
+from leagues.tests.factories import LeagueDivisionFactory
+from matches.models import Status
+from matches.tests.factories import MatchFactory
+
+URL = "/api/v1/matches/"
+
+
+def _pages(client, url):
+    while url:
+        body = client.get(url).json()
+        yield body["results"]
+        url = body["next"]
+
+
+@pytest.mark.django_db
+def test_requires_authentication():
+    assert APIClient().get(URL).status_code == 401
+
+
+@pytest.mark.django_db
+def test_list_serializes_without_extra_queries(client, django_assert_num_queries):
+    MatchFactory.create_batch(5)
+
+    # Validadores da ETag e SELECT da página (com JOINs); nenhuma consulta
+    # por partida.
+    with django_assert_num_queries(2):
+        response = client.get(URL)
+
+    assert response.status_code == 200
+    first = response.json()["results"][0]
+    home, away = first["home_team"]["name"], first["away_team"]["name"]
+    assert first["title"] == f"{home} vs {away}"
+    assert "count" not in response.json()
+
+
+@pytest.mark.django_db
+def test_cursor_walks_every_match_once_in_date_order(client):
+    base = timezone.now()
+    # Datas repetidas: o desempate pelo id mantém o cursor estável.
+    matches = [MatchFactory(date=base + timedelta(days=i // 3)) for i in range(11)]
+
+    pages = list(_pages(client, f"{URL}?page_size=4"))
+
+    assert [len(page) for page in pages] == [4, 4, 3]
+    ids = [row["id"] for page in pages for row in page]
+    expected = sorted(matches, key=lambda m: (m.date, m.pk))
+    assert ids == [str(m.pk) for m in expected]
+
+
+@pytest.mark.django_db
+def test_deep_page_costs_constant_queries(client, django_assert_num_queries):
+    MatchFactory.create_batch(30)
+    url = f"{URL}?page_size=5"
+    for _ in range(4):
+        url = client.get(url).json()["next"]
+
+    with django_assert_num_queries(2) as queries:
+        assert len(client.get(url).json()["results"]) == 5
+    # Os validadores leem só a janela da página, sem agregar a tabela toda.
+    validators = queries.captured_queries[0]["sql"]
+    assert "COUNT" not in validators.upper()
+    assert "LIMIT 6" in validators.upper()
+
+
+@pytest.mark.django_db
+def test_filters(client):
+    division = LeagueDivisionFactory()
+    team = TeamFactory()
+    now = timezone.now()
+    home = MatchFactory(league_division=division, home_team=team, date=now)
+    away = MatchFactory(
+        league_division=division,
+        away_team=team,
+        status=Status.FINISHED,
+        date=now + timedelta(days=10),
+    )
+    MatchFactory(league_division=division)
+    MatchFactory(home_team=team, date=now)
+
+    def ids(**params):
+        results = client.get(URL, params).json()["results"]
+        return {row["id"] for row in results}
+
+    assert ids(division=division.pk, team=team.pk) == {str(home.pk), str(away.pk)}
+    assert ids(division=division.pk, status=Status.FINISHED) == {str(away.pk)}
+    assert ids(
+        team=team.pk,
+        date_after=(now + timedelta(days=1)).isoformat(),
+        date_before=(now + timedelta(days=20)).isoformat(),
+    ) == {str(away.pk)}
+
+
+@pytest.mark.django_db
+def test_invalid_cursor_returns_404(client):
+    assert client.get(f"{URL}?cursor=invalido").status_code == 404
+
+
+@pytest.mark.django_db
+def test_retrieve(client):
+    match = MatchFactory()
+
+    response = client.get(f"{URL}{match.pk}/")
+
+    assert response.status_code == 200
+    assert response.json()["home_team"]["id"] == str(match.home_team_id)
+
+
+@pytest.mark.django_db
+def test_if_none_match_returns_304_before_serializing(
+    client, django_assert_num_queries
+):
+    MatchFactory.create_batch(3)
+    etag = client.get(URL)["ETag"]
+
+    # Apenas a consulta agregada dos validadores.
+    with django_assert_num_queries(1):
+        response = client.get(URL, HTTP_IF_NONE_MATCH=etag)
+
+    assert response.status_code == 304
+    assert response["ETag"] == etag
+    assert not response.content
+
+
+@pytest.mark.django_db
+def test_etag_follows_matches_and_related_teams(client):
+    match = MatchFactory()
+    etag = client.get(URL)["ETag"]
+
+    match.home_team.name = "Outro Nome"
+    match.home_team.save()
+    renamed = client.get(URL, HTTP_IF_NONE_MATCH=etag)
+    assert renamed.status_code == 200
+    assert renamed["ETag"] != etag
+
+    match.delete()
+    assert client.get(URL, HTTP_IF_NONE_MATCH=renamed["ETag"]).status_code == 200
+
+
+@pytest.mark.django_db
+def test_retrieve_honours_if_modified_since(client):
+    match = MatchFactory()
+    url = f"{URL}{match.pk}/"
+    last_modified = client.get(url)["Last-Modified"]
+
+    response = client.get(url, HTTP_IF_MODIFIED_SINCE=last_modified)
+
+    assert response.status_code == 304
+    earlier = http_date(match.updated_at.timestamp() - 60)
+    assert client.get(url, HTTP_IF_MODIFIED_SINCE=earlier).status_code == 200
+
+
+@pytest.mark.django_db
+def test_malformed_id_returns_404(client):
+    assert client.get(f"{URL}not-a-uuid/").status_code == 404
@@ -0,0 +1,35 @@
+import json
+import pytest
+from io import StringIO
+from django.core.management import call_command
+from clubs.models import Team
+from matches.models import Match
+
+
+@pytest.mark.django_db
+def test_benchmark_fixtures_writes_report_and_rolls_back(tmp_path):
+    output = tmp_path / "bench.json"
+
+    call_command(
+        "benchmark_fixtures",
+        "--teams",
+        "4",
+        "6",
+        f"--output={output}",
+        "--label=abc123",
+        stdout=StringIO(),
+    )
+
+    report = json.loads(output.read_text())
+    assert report["label"] == "abc123"
+    assert report["database"] == "sqlite"
+    assert [r["teams"] for r in report["results"]] == [4, 6]
+    assert [r["matches"] for r in report["results"]] == [12, 30]
+    for result in report["results"]:
+        for phase in ("generation", "persistence"):
+            assert set(result[phase]) == {"seconds", "queries", "peak_memory_bytes"}
+        assert result["generation"]["queries"] == 0
+        assert result["persistence"]["queries"] > 0
+
+    assert Match.objects.count() == 0
+    assert Team.objects.count() == 0
@@ -0,0 +1,25 @@
+import json
+import pytest
+from io import StringIO
+from django.core.management import call_command
+from matches.models import Match
+
+
+@pytest.mark.django_db
+def test_benchmark_match_queries_uses_composite_indexes(tmp_path):
+    output = tmp_path / "queries.json"
+
+    call_command(
+        "benchmark_match_queries",
+        "--matches=2000",
+        f"--output={output}",
+        stdout=StringIO(),
+    )
+
+    report = json.loads(output.read_text())
+    assert report["matches"] >= 2000
+    assert all(result["uses_index"] for result in report["results"])
+    plans = {result["query"]: result["indexes_used"] for result in report["results"]}
+    assert "match_div_status_date_idx" in plans["division_status_window"]
+    assert "match_status_date_idx" in plans["status_window"]
+    assert Match.objects.count() == 0
@@ -0,0 +1,145 @@
+import pytest
+from django.core.cache import cache
+from clubs.tests.factories import TeamFactory
+from leagues.tests.factories import LeagueDivisionFactory
+from matches.cache import CacheVersion, DivisionCache
+from matches.models import Status
+from matches.services import FixtureGeneratorService
+from matches.tests.factories import MatchFactory
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture
+def commit(django_capture_on_commit_callbacks):
+    """Executa a escrita e as invalidações agendadas para o commit."""
+
+    def run(write, *args, **kwargs):
+        with django_capture_on_commit_callbacks(execute=True):
+            return write(*args, **kwargs)
+
+    return run
+
+
+def _versions(*divisions):
+    return [DivisionCache(d.pk).version() for d in divisions]
+
+
+@pytest.mark.django_db
+def test_division_listing_is_served_from_cache(client, django_assert_num_queries):
+    division = LeagueDivisionFactory()
+    MatchFactory.create_batch(3, league_division=division)
+    url = f"/api/v1/matches/?division={division.pk}"
+    first = client.get(url).json()
+
+    # Só a autenticação forçada; nenhuma consulta de partidas.
+    with django_assert_num_queries(0):
+        assert client.get(url).json() == first
+
+
+@pytest.mark.django_db
+def test_lifecycle_writes_invalidate_only_their_division(commit):
+    serie_a, serie_d = LeagueDivisionFactory(), LeagueDivisionFactory()
+    match = MatchFactory(league_division=serie_a)
+    before_d = _versions(serie_d)
+
+    for write in (
+        match.start,
+        lambda: match.record_a_goal("home"),
+        match.finish,
+    ):
+        before = _versions(serie_a)
+        commit(write)
+        assert _versions(serie_a) != before
+
+    other = MatchFactory(league_division=serie_a)
+    before = _versions(serie_a)
+    commit(other.cancel)
+    assert _versions(serie_a) != before
+
+    before = _versions(serie_a)
+    other.date = other.date.replace(hour=10)
+    commit(other.save)
+    assert _versions(serie_a) != before
+
+    assert _versions(serie_d) == before_d
+
+
+@pytest.mark.django_db
+def test_membership_and_fixture_changes_invalidate(commit):
+    division, other = LeagueDivisionFactory(), LeagueDivisionFactory()
+    team, rival = TeamFactory.create_batch(2)
+    untouched = _versions(other)
+
+    before = _versions(division)
+    commit(division.teams.add, team, rival)
+    assert _versions(division) != before
+
+    before = _versions(division)
+    commit(FixtureGeneratorService(division).generate_fixtures, bulk=True)
+    assert _versions(division) != before
+
+    before = _versions(division)
+    commit(team.league_divisions.clear)
+    assert _versions(division) != before
+
+    assert _versions(other) == untouched
+
+
+def test_cache_version_survives_eviction():
+    version = CacheVersion("tests:version")
+    first = version.get()
+    assert version.bump() == (first, first + 1)
+
+    # Chave descartada pelo backend: recomeça do relógio, sem repetir versões.
+    cache.delete("tests:version")
+    assert version.get() > first + 1
+
+
+@pytest.mark.django_db
+def test_invalidation_waits_for_commit():
+    division = LeagueDivisionFactory()
+    match = MatchFactory(league_division=division, status=Status.IN_PROGRESS)
+    before = _versions(division)
+
+    match.record_a_goal("away")
+
+    assert _versions(division) == before
+
+
+@pytest.mark.django_db
+def test_standings_endpoint_is_cached_and_refreshed(client, commit):
+    division = LeagueDivisionFactory()
+    match = MatchFactory(
+        league_division=division, status=Status.IN_PROGRESS, home_score=1
+    )
+    url = f"/api/v1/divisions/{division.pk}/standings/"
+    assert client.get(url).json() == []
+
+    commit(match.finish)
+
+    table = client.get(url).json()
+    assert [row["points"] for row in table] == [3, 0]
+    assert table[0]["team"]["id"] == str(match.home_team_id)
+    assert client.get(f"/api/v1/divisions/{match.pk}/standings/").status_code == 404
+
+
+@pytest.mark.django_db
+def test_division_listing_revalidates_from_cache(
+    client, commit, django_assert_num_queries
+):
+    division = LeagueDivisionFactory()
+    match = MatchFactory(league_division=division)
+    url = f"/api/v1/matches/?division={division.pk}"
+    etag = client.get(url)["ETag"]
+
+    with django_assert_num_queries(0):
+        assert client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == 304
+
+    commit(match.start)
+    assert client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == 200
@@ -1,8 +1,10 @@
 import pytest
 from datetime import timedelta
+from django.core.exceptions import ValidationError
 from django.utils import timezone
 from matches.services import FixtureGeneratorService
 from matches.models import Match, Status
+from matches.tests.factories import MatchFactory
 from clubs.tests.factories import TeamFactory
 from leagues.tests.factories import LeagueDivisionFactory, LeagueSeasonFactory
 
@@ -176,3 +178,143 @@ def test_fixture_generator_respects_max_matches_per_day():
 
     for date, day_matches in matches_by_date.items():
         assert len(day_matches) <= FixtureGeneratorService.MAX_MATCHES_PER_DAY
+
+
+@pytest.mark.django_db
+def test_fixture_generator_bulk_creates_same_matches():
+    season = LeagueSeasonFactory(year=2024)
+    division = LeagueDivisionFactory(season=season)
+    teams = TeamFactory.create_batch(6)
+    division.teams.add(*teams)
+
+    generator = FixtureGeneratorService(division)
+    matches = generator.generate_fixtures(bulk=True)
+
+    assert len(matches) == 6 * (6 - 1)
+    assert Match.objects.filter(league_division=division).count() == len(matches)
+    assert {m.pk for m in matches} == set(
+        Match.objects.filter(league_division=division).values_list("pk", flat=True)
+    )
+
+
+@pytest.mark.django_db
+def test_fixture_generator_bulk_query_count_is_constant(
+    django_assert_max_num_queries,
+):
+    season = LeagueSeasonFactory(year=2024)
+    division = LeagueDivisionFactory(season=season)
+    teams = TeamFactory.create_batch(20)
+    division.teams.add(*teams)
+
+    generator = FixtureGeneratorService(division)
+
+    # delete + validação + savepoint/release + poucos inserts em lote
+    # (o SQLite limita o número de parâmetros por INSERT). O caminho
+    # tradicional faria ao menos 2 queries por partida (760+).
+    with django_assert_max_num_queries(10):
+        matches = generator.generate_fixtures(bulk=True)
+
+    assert len(matches) == 20 * (20 - 1)
+
+
+@pytest.mark.django_db
+def test_fixture_generator_bulk_rejects_existing_active_match():
+    season = LeagueSeasonFactory(year=2024)
+    division = LeagueDivisionFactory(season=season)
+    teams = TeamFactory.create_batch(2)
+    division.teams.add(*teams)
+    MatchFactory(
+        home_team=teams[0],
+        away_team=teams[1],
+        league_division=division,
+        status=Status.FINISHED,
+    )
+
+    generator = FixtureGeneratorService(division)
+
+    with pytest.raises(ValidationError) as exc_info:
+        generator.generate_fixtures(bulk=True)
+
+    assert "já existe" in str(exc_info.value).lower()
+    assert Match.objects.filter(league_division=division).count() == 1
+
+
+@pytest.mark.django_db
+def test_fixture_generator_iter_rounds_streams_unsaved_matches(
+    django_assert_num_queries,
+):
+    season = LeagueSeasonFactory(year=2024)
+    division = LeagueDivisionFactory(season=season)
+    teams = TeamFactory.create_batch(4)
+    division.teams.add(*teams)
+    generator = FixtureGeneratorService(division)
+
+    with django_assert_num_queries(0):
+        rounds = list(generator.iter_rounds())
+
+    assert [r.number for r in rounds] == list(range(1, 7))
+    assert all(len(r.matches) == 2 for r in rounds)
+    assert all(m._state.adding for r in rounds for m in r.matches)
+    assert Match.objects.count() == 0
+
+    Match.objects.bulk_create(rounds[0].matches)
+    assert Match.objects.count() == 2
+
+
+@pytest.mark.django_db
+def test_fixture_generator_preview_does_not_touch_database(
+    django_assert_num_queries,
+):
+    season = LeagueSeasonFactory(year=2024)
+    division = LeagueDivisionFactory(season=season)
+    teams = TeamFactory.create_batch(4)
+    division.teams.add(*teams)
+    generator = FixtureGeneratorService(division)
+
+    with django_assert_num_queries(0):
+        preview = generator.preview()
+
+    assert len(preview.fixtures) == 4 * 3
+    assert Match.objects.count() == 0
+    assert preview.fixtures == sorted(preview.fixtures, key=lambda f: f.date)
+    assert preview.min_rest >= timedelta(
+        days=FixtureGeneratorService.DAYS_BETWEEN_MATCHES
+    )
+    assert preview.max_gap >= preview.min_rest
+    assert preview.calendar_days >= 1
+
+
+@pytest.mark.django_db
+def test_fixture_generator_preview_accepts_alternative_settings():
+    season = LeagueSeasonFactory(year=2024)
+    division = LeagueDivisionFactory(season=season)
+    teams = TeamFactory.create_batch(6)
+    division.teams.add(*teams)
+    generator = FixtureGeneratorService(division)
+    start_date = timezone.now() + timedelta(days=60)
+
+    default = generator.preview()
+    relaxed = generator.preview(
+        start_date=start_date,
+        rest_days=1,
+        time_slots=["11:00", "16:00", "18:30", "21:00"],
+    )
+
+    assert relaxed.fixtures[0].date >= start_date
+    assert relaxed.min_rest >= timedelta(days=1)
+    assert relaxed.calendar_days < default.calendar_days
+
+
+@pytest.mark.django_db
+def test_fixture_generator_stores_round_number():
+    season = LeagueSeasonFactory(year=2024)
+    division = LeagueDivisionFactory(season=season)
+    teams = TeamFactory.create_batch(4)
+    division.teams.add(*teams)
+
+    FixtureGeneratorService(division).generate_fixtures(bulk=True)
+
+    rounds = Match.objects.filter(league_division=division).values_list(
+        "round", flat=True
+    )
+    assert sorted(set(rounds)) == list(range(1, 7))
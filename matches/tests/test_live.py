@@ -0,0 +1,187 @@
+import asyncio
+import threading
+import pytest
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models import F
+from django.test import AsyncClient
+from rest_framework_simplejwt.tokens import AccessToken
+from matches.live import (
+    BaseBroker,
+    InMemoryBroker,
+    LiveEvent,
+    division_channel,
+    get_broker,
+    match_channel,
+)
+from matches.models import Match, Status
+from matches.tests.factories import MatchFactory
+
+
+class RecordingBroker(BaseBroker):
+    """Broker de teste configurado por ``LIVE_SCORE_BROKER``."""
+
+    def __init__(self):
+        self.published = []
+
+    def publish(self, channel, event):
+        self.published.append((channel, event))
+
+
+@pytest.fixture
+def broker(settings):
+    get_broker.cache_clear()
+    settings.LIVE_SCORE_BROKER = "matches.tests.test_live.RecordingBroker"
+    yield get_broker()
+    get_broker.cache_clear()
+
+
+@pytest.fixture
+def token():
+    user = get_user_model().objects.create_user("live", password="x")
+    return str(AccessToken.for_user(user))
+
+
+def test_in_memory_broker_fans_out_per_channel():
+    broker = InMemoryBroker()
+    event = LiveEvent("goal", {"home_score": 1})
+
+    async def main():
+        async with broker.subscribe("a") as first, broker.subscribe("a") as second:
+            async with broker.subscribe("b") as other:
+                # Publicação a partir de outra thread, como no on_commit.
+                thread = threading.Thread(target=broker.publish, args=("a", event))
+                thread.start()
+                thread.join()
+                received = [
+                    await asyncio.wait_for(queue.get(), 1) for queue in (first, second)
+                ]
+                assert other.empty()
+                return received
+
+    assert asyncio.run(main()) == [event, event]
+    assert broker.subscriber_count("a") == broker.subscriber_count("b") == 0
+
+
+def test_slow_subscriber_keeps_only_latest_events():
+    broker = InMemoryBroker()
+    broker.QUEUE_SIZE = 2
+
+    async def main():
+        async with broker.subscribe("a") as queue:
+            for score in range(3):
+                broker.publish("a", LiveEvent("goal", {"home_score": score}))
+            await asyncio.sleep(0)
+            return [queue.get_nowait().data["home_score"] for _ in range(2)]
+
+    assert asyncio.run(main()) == [1, 2]
+
+
+def test_event_encoding():
+    event = LiveEvent("finished", {"id": "x", "home_score": 2})
+
+    assert event.encode() == (
+        'event: finished\ndata: {"id": "x", "home_score": 2}\n\n'
+    )
+
+
+@pytest.mark.django_db
+def test_lifecycle_publishes_to_match_and_division_after_commit(
+    broker, django_capture_on_commit_callbacks
+):
+    match = MatchFactory()
+    channels = [match_channel(match.pk), division_channel(match.league_division_id)]
+
+    with django_capture_on_commit_callbacks(execute=True):
+        match.start()
+        match.record_a_goal("away")
+        assert broker.published == []
+    with django_capture_on_commit_callbacks(execute=True):
+        Match.objects.filter(pk=match.pk).finish()
+
+    assert [channel for channel, _ in broker.published] == channels * 3
+    events = [event for _, event in broker.published[::2]]
+    assert [event.event for event in events] == ["started", "goal", "finished"]
+    assert events[-1].data["away_score"] == 1
+    assert events[-1].data["away_points"] == 3
+
+
+@pytest.mark.django_db
+def test_goal_event_carries_the_stored_score(
+    broker, django_capture_on_commit_callbacks
+):
+    match = MatchFactory()
+    match.start()
+
+    with django_capture_on_commit_callbacks(execute=True):
+        # Gol do visitante registrado por outro processo.
+        Match.objects.filter(pk=match.pk).update(away_score=F("away_score") + 1)
+        match.record_a_goal("home")
+
+    _, event = broker.published[0]
+    assert (event.data["home_score"], event.data["away_score"]) == (1, 1)
+    assert event.data["status"] == Status.IN_PROGRESS
+
+
+@pytest.mark.django_db
+def test_rolled_back_write_publishes_nothing(
+    broker, django_capture_on_commit_callbacks
+):
+    match = MatchFactory()
+
+    with django_capture_on_commit_callbacks(execute=True):
+        with pytest.raises(RuntimeError), transaction.atomic():
+            match.cancel()
+            raise RuntimeError
+
+    assert broker.published == []
+
+
+@pytest.mark.django_db
+def test_stream_requires_token(token):
+    match = MatchFactory()
+    url = f"/api/v1/matches/{match.pk}/events/"
+
+    async def status(**kwargs):
+        return (await AsyncClient().get(url, **kwargs)).status_code
+
+    assert asyncio.run(status()) == 401
+    assert asyncio.run(status(data={"token": "invalido"})) == 401
+
+
+@pytest.mark.django_db(transaction=True)
+def test_unknown_match_returns_404(token):
+    match = MatchFactory()
+    url = f"/api/v1/matches/{match.pk}/events/"
+    match.delete()
+
+    async def status():
+        response = await AsyncClient().get(
+            url, headers={"Authorization": f"Bearer {token}"}
+        )
+        return response.status_code
+
+    assert asyncio.run(status()) == 404
+
+
+@pytest.mark.django_db(transaction=True)
+def test_division_stream_pushes_published_events(token):
+    get_broker.cache_clear()
+    match = MatchFactory()
+    url = f"/api/v1/divisions/{match.league_division_id}/events/"
+    channel = division_channel(match.league_division_id)
+    event = LiveEvent("goal", {"id": str(match.pk), "home_score": 1})
+
+    async def main():
+        response = await AsyncClient().get(url, {"token": token})
+        assert response["Content-Type"] == "text/event-stream"
+        chunks = response.streaming_content
+        assert await anext(chunks) == b": conectado\n\n"
+
+        get_broker().publish(channel, event)
+        received = await asyncio.wait_for(anext(chunks), 1)
+        await chunks.aclose()
+        return received
+
+    assert asyncio.run(main()) == event.encode().encode()
+    assert get_broker().subscriber_count(channel) == 0
@@ -0,0 +1,104 @@
+import pytest
+from django.core.exceptions import ValidationError
+from matches.models import EventType, MatchEvent, Status
+from matches.services import EventInput, MatchEventService
+from matches.tests.factories import MatchFactory
+
+
+@pytest.mark.django_db
+def test_append_derives_score_incrementally():
+    match = MatchFactory(status=Status.IN_PROGRESS, round=3)
+    service = MatchEventService(match)
+
+    service.append(
+        [
+            EventInput(EventType.GOAL, 10, match.home_team_id),
+            EventInput(EventType.YELLOW_CARD, 20, match.away_team_id),
+            EventInput(EventType.OWN_GOAL, 35, match.home_team_id),
+        ]
+    )
+    service.append([EventInput(EventType.GOAL, 80, match.home_team_id)])
+
+    assert (match.home_score, match.away_score) == (2, 1)
+    assert service.score_from_events() == (2, 1)
+    assert list(service.timeline().values_list("sequence", "minute")) == [
+        (1, 10),
+        (2, 20),
+        (3, 35),
+        (4, 80),
+    ]
+    assert set(MatchEvent.objects.values_list("round", flat=True)) == {3}
+
+
+@pytest.mark.django_db
+def test_append_batch_costs_a_handful_of_queries(django_assert_num_queries):
+    match = MatchFactory(status=Status.IN_PROGRESS)
+    events = [EventInput(EventType.GOAL, m, match.home_team_id) for m in range(10)]
+
+    # savepoint + UPDATE + última sequência + INSERT + release + placar
+    with django_assert_num_queries(6):
+        MatchEventService(match).append(events)
+
+    assert match.home_score == 10
+
+
+@pytest.mark.django_db
+def test_append_goal_requires_match_in_progress():
+    match = MatchFactory(status=Status.SCHEDULED)
+
+    with pytest.raises(ValidationError) as exc_info:
+        MatchEventService(match).append(
+            [EventInput(EventType.GOAL, 1, match.home_team_id)]
+        )
+
+    assert "em andamento" in str(exc_info.value).lower()
+    assert not MatchEvent.objects.exists()
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "status", [Status.SCHEDULED, Status.CANCELLED, Status.FINISHED]
+)
+def test_append_rejects_any_event_outside_match_in_progress(status):
+    match = MatchFactory(status=status)
+
+    for event in (
+        EventInput(EventType.YELLOW_CARD, 30, match.away_team_id),
+        EventInput(EventType.END, 90),
+    ):
+        with pytest.raises(ValidationError):
+            MatchEventService(match).append([event])
+
+    assert not MatchEvent.objects.exists()
+
+
+@pytest.mark.django_db
+def test_append_start_event_without_team():
+    match = MatchFactory(status=Status.IN_PROGRESS)
+
+    (event,) = MatchEventService(match).append([EventInput(EventType.START, 0)])
+
+    assert event.team_id is None
+    assert event.sequence == 1
+
+
+@pytest.mark.django_db
+def test_append_rejects_team_outside_match():
+    match = MatchFactory(status=Status.IN_PROGRESS)
+    other = MatchFactory()
+
+    with pytest.raises(ValidationError):
+        MatchEventService(match).append(
+            [EventInput(EventType.RED_CARD, 50, other.home_team_id)]
+        )
+
+
+@pytest.mark.django_db
+def test_round_events_use_a_single_index_range():
+    match = MatchFactory(status=Status.IN_PROGRESS, round=1)
+    MatchEventService(match).append([EventInput(EventType.START, 0)])
+
+    queryset = MatchEventService.round_events(match.league_division, 1)
+
+    assert list(queryset) == list(MatchEvent.objects.all())
+    assert "event_division_round_idx" in queryset.explain()
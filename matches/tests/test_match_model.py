@@ -1,7 +1,10 @@
 import pytest
 from django.core.exceptions import ValidationError
+from django.db import IntegrityError, connection, transaction
+from django.test.utils import CaptureQueriesContext
 from matches.tests.factories import MatchFactory
-from matches.models import Status
+from matches.models import EventType, Match, Status
+from matches.services import MatchEventService
 from clubs.tests.factories import TeamFactory
 from leagues.tests.factories import LeagueDivisionFactory
 
@@ -340,3 +343,276 @@ def test_can_have_matches_in_different_divisions():
 
     assert match1.pk is not None
     assert match2.pk is not None
+
+
+@pytest.mark.django_db
+def test_record_a_goal_does_not_lose_concurrent_updates():
+    match = MatchFactory(status=Status.IN_PROGRESS)
+    stale = Match.objects.get(pk=match.pk)
+
+    match.record_a_goal(type="home")
+    stale.record_a_goal(type="home")
+
+    match.refresh_from_db()
+    assert match.home_score == 2
+    assert stale.home_score == 2
+
+
+@pytest.mark.django_db
+def test_record_a_goal_checks_status_in_database():
+    match = MatchFactory(status=Status.IN_PROGRESS)
+    Match.objects.filter(pk=match.pk).update(status=Status.FINISHED)
+
+    with pytest.raises(ValidationError) as exc_info:
+        match.record_a_goal(type="away")
+
+    assert "em andamento" in str(exc_info.value).lower()
+    match.refresh_from_db()
+    assert match.away_score == 0
+
+
+@pytest.mark.django_db
+def test_record_a_goal_costs_constant_queries(django_assert_num_queries):
+    match = MatchFactory(status=Status.IN_PROGRESS)
+
+    # savepoint + UPDATE condicional + última sequência + INSERT do evento +
+    # release + leitura do placar atualizado
+    with django_assert_num_queries(6):
+        match.record_a_goal(type="home")
+
+
+@pytest.mark.django_db
+def test_record_a_goal_appends_to_the_timeline():
+    match = MatchFactory(status=Status.IN_PROGRESS)
+
+    match.record_a_goal(type="home", minute=12)
+    match.record_a_goal(type="away")
+
+    service = MatchEventService(match)
+    assert service.score_from_events() == (match.home_score, match.away_score)
+    assert [e.minute for e in service.timeline()] == [12, 0]
+
+
+@pytest.mark.django_db
+def test_record_a_goal_unknown_type():
+    match = MatchFactory(status=Status.IN_PROGRESS)
+
+    with pytest.raises(ValidationError) as exc_info:
+        match.record_a_goal(type="penalty")
+
+    assert "desconhecido" in str(exc_info.value).lower()
+
+
+@pytest.mark.django_db
+def test_save_without_fixture_fields_skips_duplicate_check(django_assert_num_queries):
+    match = MatchFactory(status=Status.IN_PROGRESS)
+    match.home_score = 1
+
+    with django_assert_num_queries(1):
+        match.save(update_fields=["home_score"])
+
+
+@pytest.mark.django_db
+def test_duplicate_match_is_rejected_by_database_constraint():
+    team1 = TeamFactory(name="Fortaleza")
+    team2 = TeamFactory(name="Ceará")
+    division = LeagueDivisionFactory()
+    MatchFactory(home_team=team1, away_team=team2, league_division=division)
+
+    duplicate = MatchFactory.build(
+        home_team=team1, away_team=team2, league_division=division
+    )
+    with pytest.raises(IntegrityError):
+        with transaction.atomic():
+            Match.objects.bulk_create([duplicate])
+
+
+@pytest.mark.django_db
+def test_reactivating_cancelled_duplicate_raises_validation_error():
+    team1 = TeamFactory(name="Sport")
+    team2 = TeamFactory(name="Náutico")
+    division = LeagueDivisionFactory()
+    cancelled = MatchFactory(
+        home_team=team1,
+        away_team=team2,
+        league_division=division,
+        status=Status.CANCELLED,
+    )
+    MatchFactory(home_team=team1, away_team=team2, league_division=division)
+
+    cancelled.status = Status.SCHEDULED
+    with pytest.raises(ValidationError) as exc_info:
+        cancelled.save(update_fields=["status"])
+
+    assert "já existe" in str(exc_info.value).lower()
+
+
+@pytest.mark.django_db
+def test_bulk_finish_sets_points_and_returns_winners():
+    home_win = MatchFactory(status=Status.IN_PROGRESS, home_score=2, away_score=0)
+    away_win = MatchFactory(status=Status.IN_PROGRESS, home_score=0, away_score=1)
+    draw = MatchFactory(status=Status.IN_PROGRESS, home_score=1, away_score=1)
+
+    winners = Match.objects.filter(pk__in=[home_win.pk, away_win.pk, draw.pk]).finish()
+
+    assert {m.pk: w for m, w in winners.items()} == {
+        home_win.pk: home_win.home_team,
+        away_win.pk: away_win.away_team,
+        draw.pk: None,
+    }
+    rows = Match.objects.filter(status=Status.FINISHED).values_list(
+        "pk", "home_points", "away_points"
+    )
+    points = {pk: (home, away) for pk, home, away in rows}
+    assert points == {
+        home_win.pk: (3, 0),
+        away_win.pk: (0, 3),
+        draw.pk: (1, 1),
+    }
+
+
+@pytest.mark.django_db
+def test_bulk_finish_uses_a_single_update():
+    division = LeagueDivisionFactory()
+    MatchFactory.create_batch(10, status=Status.IN_PROGRESS, league_division=division)
+
+    # Os receptores de ``match_finished`` fazem suas próprias consultas; aqui
+    # contam só as que tocam a tabela de partidas.
+    with CaptureQueriesContext(connection) as ctx:
+        Match.objects.filter(league_division=division).finish()
+
+    match_queries = [
+        q["sql"].split()[0]
+        for q in ctx.captured_queries
+        if '"matches_match"' in q["sql"].split(" WHERE ")[0]
+    ]
+    assert match_queries == ["SELECT", "UPDATE"]
+
+    assert Match.objects.filter(status=Status.FINISHED).count() == 10
+
+
+@pytest.mark.django_db
+def test_bulk_finish_rejects_matches_not_in_progress():
+    division = LeagueDivisionFactory()
+    MatchFactory(status=Status.IN_PROGRESS, league_division=division)
+    MatchFactory(status=Status.SCHEDULED, league_division=division)
+
+    with pytest.raises(ValidationError) as exc_info:
+        Match.objects.filter(league_division=division).finish()
+
+    assert "em andamento" in str(exc_info.value).lower()
+    assert not Match.objects.filter(status=Status.FINISHED).exists()
+
+
+@pytest.mark.django_db
+def test_concurrent_start_only_succeeds_once():
+    match = MatchFactory(status=Status.SCHEDULED)
+    stale = Match.objects.get(pk=match.pk)
+
+    match.start()
+    with pytest.raises(ValidationError) as exc_info:
+        stale.start()
+
+    assert "já está em andamento" in str(exc_info.value).lower()
+    assert stale.status == Status.IN_PROGRESS
+
+
+@pytest.mark.django_db
+def test_cannot_cancel_match_finished_by_another_worker():
+    match = MatchFactory(status=Status.IN_PROGRESS, home_score=1)
+    stale = Match.objects.get(pk=match.pk)
+
+    match.finish()
+    with pytest.raises(ValidationError) as exc_info:
+        stale.cancel()
+
+    assert "finalizada" in str(exc_info.value).lower()
+    match.refresh_from_db()
+    assert match.status == Status.FINISHED
+
+
+@pytest.mark.django_db
+def test_cannot_finish_match_cancelled_by_another_worker():
+    match = MatchFactory(status=Status.IN_PROGRESS)
+    stale = Match.objects.get(pk=match.pk)
+
+    match.cancel()
+    with pytest.raises(ValidationError):
+        stale.finish()
+
+    assert stale.status == Status.CANCELLED
+
+
+@pytest.mark.django_db
+def test_finish_uses_scores_from_database():
+    match = MatchFactory(status=Status.IN_PROGRESS)
+    Match.objects.filter(pk=match.pk).update(away_score=2)
+
+    winner = match.finish()
+
+    assert winner == match.away_team
+    assert (match.home_points, match.away_points) == (0, 3)
+
+
+@pytest.mark.django_db
+def test_cannot_start_cancelled_match():
+    match = MatchFactory(status=Status.CANCELLED)
+
+    with pytest.raises(ValidationError) as exc_info:
+        match.start()
+
+    assert "cancelada" in str(exc_info.value).lower()
+
+
+@pytest.mark.django_db
+def test_start_is_a_single_update_plus_start_event():
+    match = MatchFactory(status=Status.SCHEDULED)
+
+    with CaptureQueriesContext(connection) as ctx:
+        match.start()
+
+    statements = [q["sql"].split()[0] for q in ctx.captured_queries]
+    assert [s for s in statements if s not in ("SAVEPOINT", "RELEASE")] == [
+        "UPDATE",
+        "INSERT",
+    ]
+
+
+@pytest.mark.django_db
+def test_lifecycle_writes_start_and_end_events():
+    match = MatchFactory(status=Status.SCHEDULED)
+
+    match.start()
+    match.record_a_goal("home", minute=10)
+    match.finish()
+
+    timeline = list(
+        MatchEventService(match).timeline().values_list("sequence", "type")
+    )
+    assert timeline == [(1, EventType.START), (2, EventType.GOAL), (3, EventType.END)]
+
+
+@pytest.mark.django_db
+def test_bulk_finish_writes_end_events():
+    division = LeagueDivisionFactory()
+    matches = MatchFactory.create_batch(
+        3, status=Status.SCHEDULED, league_division=division
+    )
+    for match in matches:
+        match.start()
+
+    Match.objects.filter(league_division=division).finish()
+
+    for match in matches:
+        types = MatchEventService(match).timeline().values_list("type", flat=True)
+        assert list(types) == [EventType.START, EventType.END]
+
+
+@pytest.mark.django_db
+def test_goal_on_finished_match_keeps_goal_message():
+    match = MatchFactory(status=Status.FINISHED)
+
+    with pytest.raises(ValidationError) as exc_info:
+        match.record_a_goal("home")
+
+    assert "registrar gols" in str(exc_info.value)
@@ -0,0 +1,125 @@
+import numpy as np
+import pytest
+from datetime import timedelta
+from uuid import uuid4
+from django.db import transaction
+from django.utils import timezone
+from clubs.tests.factories import TeamFactory
+from leagues.tests.factories import LeagueDivisionFactory
+from matches.models import Status
+from matches.services import MatchPredictionModel, SeasonSimulationService
+from matches.tests.factories import MatchFactory
+
+
+def test_predict_returns_normalized_probabilities():
+    strong, weak = uuid4(), uuid4()
+    model = MatchPredictionModel()
+    for _ in range(20):
+        model.update(strong, weak, 3, 0)
+        model.update(weak, strong, 0, 2)
+
+    prediction = model.predict([(strong, weak), (weak, strong), (uuid4(), uuid4())])
+
+    total = prediction.home_win + prediction.draw + prediction.away_win
+    assert np.allclose(total, 1)
+    assert prediction.home_win[0] > prediction.away_win[0]
+    assert prediction.away_win[1] > prediction.home_win[1]
+    assert prediction.home_goals[2] == pytest.approx(model.HOME_GOALS)
+
+
+def test_cache_is_kept_until_a_team_rating_changes(monkeypatch):
+    a, b, c, d = (uuid4() for _ in range(4))
+    model = MatchPredictionModel()
+    model.predict([(a, b), (c, d)])
+
+    computed = []
+    original = model._predict
+    monkeypatch.setattr(
+        model,
+        "_predict",
+        lambda fixtures: computed.append(fixtures) or original(fixtures),
+    )
+
+    model.predict([(a, b), (c, d)])
+    assert computed == []
+
+    model.update(a, c, 2, 0)
+    model.predict([(a, b), (c, d), (b, d)])
+    assert computed == [[(a, b), (c, d), (b, d)]]
+
+    model.update(a, b, 1, 1)
+    computed.clear()
+    first = model.predict([(c, d), (a, b)])
+    assert computed == [[(a, b)]]
+    assert first.home_win[0] == model.predict([(c, d)]).home_win[0]
+
+
+@pytest.mark.django_db
+def test_division_model_follows_committed_results(
+    django_capture_on_commit_callbacks,
+):
+    division = LeagueDivisionFactory()
+    teams = TeamFactory.create_batch(4)
+    day = timezone.now() - timedelta(days=30)
+    for i, (home, away) in enumerate(zip(teams, teams[1:] + teams[:1])):
+        MatchFactory(
+            league_division=division,
+            home_team=home,
+            away_team=away,
+            status=Status.FINISHED,
+            home_score=i % 3,
+            date=day + timedelta(days=i),
+        )
+    match = MatchFactory(
+        league_division=division,
+        home_team=teams[0],
+        away_team=teams[2],
+        status=Status.IN_PROGRESS,
+        away_score=3,
+        date=timezone.now(),
+    )
+    model = MatchPredictionModel.for_division(division)
+    assert MatchPredictionModel.for_division(division) is model
+
+    # Finalização desfeita: o modelo continua o mesmo.
+    with pytest.raises(RuntimeError), transaction.atomic():
+        match.finish()
+        raise RuntimeError
+    assert MatchPredictionModel.for_division(division) is model
+    assert model.rating(teams[2].pk).version == 2
+
+    # Finalização confirmada: aplicada ao mesmo modelo, sem refazer.
+    with django_capture_on_commit_callbacks(execute=True):
+        match.finish()
+
+    assert MatchPredictionModel.for_division(division) is model
+    assert model.rating(teams[2].pk).version == 3
+    assert model.ratings == MatchPredictionModel.from_division(division).ratings
+
+    # Resultado corrigido: o modelo é refeito a partir das partidas gravadas.
+    match.away_score = 0
+    with django_capture_on_commit_callbacks(execute=True):
+        match.save()
+
+    refit = MatchPredictionModel.for_division(division)
+    assert refit is not model
+    assert refit.ratings == MatchPredictionModel.from_division(division).ratings
+
+
+@pytest.mark.django_db
+def test_simulator_uses_prediction_model():
+    division = LeagueDivisionFactory()
+    strong, weak = TeamFactory.create_batch(2)
+    MatchFactory(league_division=division, home_team=strong, away_team=weak)
+    MatchFactory(league_division=division, home_team=weak, away_team=strong)
+    model = MatchPredictionModel()
+    for _ in range(50):
+        model.update(strong.pk, weak.pk, 4, 0)
+        model.update(weak.pk, strong.pk, 0, 4)
+
+    odds = SeasonSimulationService(
+        division, simulations=500, seed=1, model=model
+    ).simulate()
+
+    assert odds[0].team_id == strong.pk
+    assert odds[0].title > 0.9
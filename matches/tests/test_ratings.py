@@ -0,0 +1,125 @@
+import pytest
+from datetime import timedelta
+from io import StringIO
+from django.core.management import call_command
+from django.utils import timezone
+from clubs.tests.factories import TeamFactory
+from leagues.tests.factories import LeagueDivisionFactory
+from matches.models import EloRating, EloRatingChange, Match, Status
+from matches.services import EloRatingService
+from matches.tests.factories import MatchFactory
+
+
+def _finish(division, home, away, home_score, away_score, days_ago=1):
+    match = MatchFactory(
+        league_division=division,
+        home_team=home,
+        away_team=away,
+        status=Status.IN_PROGRESS,
+        home_score=home_score,
+        away_score=away_score,
+        date=timezone.now() - timedelta(days=days_ago),
+    )
+    match.finish()
+    return match
+
+
+def _ratings():
+    return {row.team_id: row.rating for row in EloRating.objects.all()}
+
+
+@pytest.mark.django_db
+def test_finish_updates_both_ratings_and_appends_history():
+    division = LeagueDivisionFactory()
+    home, away = TeamFactory.create_batch(2)
+
+    match = _finish(division, home, away, 2, 0)
+
+    change = EloRatingChange.objects.get(match=match)
+    assert change.home_rating == change.away_rating == EloRatingService.INITIAL_RATING
+    assert change.delta > 0
+    assert _ratings() == {
+        home.pk: change.home_rating_after,
+        away.pk: change.away_rating_after,
+    }
+    assert EloRating.objects.get(team=home).games == 1
+
+
+@pytest.mark.django_db
+def test_finish_touches_only_the_two_rating_rows(django_assert_num_queries):
+    division = LeagueDivisionFactory()
+    home, away, other = TeamFactory.create_batch(3)
+    _finish(division, home, other, 1, 0, days_ago=3)
+    _finish(division, away, other, 1, 0, days_ago=2)
+    match = MatchFactory(
+        league_division=division,
+        home_team=home,
+        away_team=away,
+        status=Status.IN_PROGRESS,
+    )
+    other_rating = EloRating.objects.get(team=other).rating
+
+    # savepoint + SELECT FOR UPDATE + UPDATE + INSERT + release
+    with django_assert_num_queries(5):
+        EloRatingService.apply([match])
+
+    assert EloRating.objects.get(team=other).rating == other_rating
+
+
+@pytest.mark.django_db
+def test_new_teams_start_by_division_tier():
+    serie_a = LeagueDivisionFactory()
+    serie_b = LeagueDivisionFactory(parent_league=serie_a)
+    serie_c = LeagueDivisionFactory(parent_league=serie_b)
+    home, away = TeamFactory.create_batch(2)
+
+    change = EloRatingChange.objects.get(match=_finish(serie_c, home, away, 0, 0))
+
+    expected = EloRatingService.INITIAL_RATING - 2 * EloRatingService.TIER_GAP
+    assert change.home_rating == change.away_rating == expected
+
+
+@pytest.mark.django_db
+def test_rating_follows_team_across_divisions():
+    serie_a = LeagueDivisionFactory()
+    serie_b = LeagueDivisionFactory(parent_league=serie_a)
+    promoted, rival_b, rival_a = TeamFactory.create_batch(3)
+    _finish(serie_b, promoted, rival_b, 3, 0, days_ago=10)
+    before = EloRating.objects.get(team=promoted).rating
+
+    match = _finish(serie_a, promoted, rival_a, 0, 0)
+
+    assert EloRatingChange.objects.get(match=match).home_rating == before
+
+
+@pytest.mark.django_db
+def test_rebuild_replays_history_in_date_order(django_assert_max_num_queries):
+    division = LeagueDivisionFactory()
+    teams = TeamFactory.create_batch(4)
+    days = 20
+    for h, home in enumerate(teams):
+        for a, away in enumerate(teams):
+            if home != away:
+                _finish(division, home, away, (h + a) % 3, h % 2, days_ago=days)
+                days -= 1
+    expected = _ratings()
+    EloRating.objects.update(rating=0)
+
+    with django_assert_max_num_queries(10):
+        teams_count, matches = EloRatingService.rebuild()
+
+    assert (teams_count, matches) == (4, Match.objects.count())
+    assert _ratings() == pytest.approx(expected)
+    assert EloRatingChange.objects.count() == matches
+
+
+@pytest.mark.django_db
+def test_rebuild_ratings_command():
+    division = LeagueDivisionFactory()
+    home, away = TeamFactory.create_batch(2)
+    _finish(division, home, away, 1, 0)
+    out = StringIO()
+
+    call_command("rebuild_ratings", stdout=out)
+
+    assert "1 partidas aplicadas a 2 times" in out.getvalue()
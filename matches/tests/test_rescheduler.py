@@ -0,0 +1,154 @@
+import pytest
+from collections import Counter
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
+from django.core.exceptions import ValidationError
+from django.utils import timezone
+from matches.services import FixtureGeneratorService, FixtureRescheduleService
+from matches.models import Match, Status
+from matches.services.slot_calendar import SlotCalendar
+from matches.tests.factories import MatchFactory
+from clubs.tests.factories import TeamFactory
+from leagues.tests.factories import LeagueDivisionFactory, LeagueSeasonFactory
+
+
+@pytest.fixture
+def division_with_fixtures(db):
+    season = LeagueSeasonFactory(year=2024)
+    division = LeagueDivisionFactory(season=season)
+    division.teams.add(*TeamFactory.create_batch(6))
+    FixtureGeneratorService(division).generate_fixtures(bulk=True)
+    return division
+
+
+def _snapshot(division, exclude):
+    return dict(
+        Match.objects.filter(league_division=division)
+        .exclude(pk__in=exclude)
+        .values_list("pk", "date")
+    )
+
+
+@pytest.mark.django_db
+def test_reschedule_moves_only_given_matches(division_with_fixtures):
+    division = division_with_fixtures
+    match = Match.objects.filter(league_division=division).order_by("date").first()
+    match.cancel()
+    before = _snapshot(division, [match.pk])
+
+    FixtureRescheduleService(division).reschedule([match])
+
+    match.refresh_from_db()
+    assert match.status == Status.SCHEDULED
+    assert _snapshot(division, [match.pk]) == before
+
+
+@pytest.mark.django_db
+def test_reschedule_respects_rest_and_daily_limit(division_with_fixtures):
+    division = division_with_fixtures
+    postponed = list(
+        Match.objects.filter(league_division=division).order_by("date")[:3]
+    )
+
+    FixtureRescheduleService(division).reschedule(postponed)
+
+    matches = list(Match.objects.filter(league_division=division))
+    per_day = Counter(timezone.localtime(m.date).date() for m in matches)
+    assert max(per_day.values()) <= FixtureGeneratorService.MAX_MATCHES_PER_DAY
+    assert len({m.date for m in matches}) == len(matches)
+
+    for match in postponed:
+        for team_id in (match.home_team_id, match.away_team_id):
+            for other in matches:
+                if other.pk == match.pk:
+                    continue
+                if team_id in (other.home_team_id, other.away_team_id):
+                    assert abs(other.date - match.date) >= timedelta(
+                        days=FixtureGeneratorService.DAYS_BETWEEN_MATCHES
+                    )
+
+
+@pytest.mark.django_db
+def test_reschedule_uses_constant_number_of_queries(
+    division_with_fixtures, django_assert_max_num_queries
+):
+    division = division_with_fixtures
+    postponed = list(
+        Match.objects.filter(league_division=division).order_by("date")[:4]
+    )
+
+    # leitura da ocupação + 1 UPDATE em lote + savepoint/release
+    with django_assert_max_num_queries(4):
+        FixtureRescheduleService(division).reschedule(postponed)
+
+
+@pytest.mark.django_db
+def test_reschedule_not_before(division_with_fixtures):
+    division = division_with_fixtures
+    match = Match.objects.filter(league_division=division).first()
+    not_before = timezone.now() + timedelta(days=400)
+
+    (rescheduled,) = FixtureRescheduleService(
+        division, not_before=not_before
+    ).reschedule([match])
+
+    assert rescheduled.date >= not_before
+
+
+@pytest.mark.django_db
+def test_reschedule_rejects_finished_match(division_with_fixtures):
+    division = division_with_fixtures
+    match = Match.objects.filter(league_division=division).first()
+    Match.objects.filter(pk=match.pk).update(status=Status.FINISHED)
+    match.refresh_from_db()
+
+    with pytest.raises(ValidationError):
+        FixtureRescheduleService(division).reschedule([match])
+
+
+@pytest.mark.django_db
+def test_reschedule_rejects_cancelled_match_already_replaced(division_with_fixtures):
+    division = division_with_fixtures
+    match = Match.objects.filter(league_division=division).first()
+    match.cancel()
+    Match.objects.create(
+        home_team=match.home_team,
+        away_team=match.away_team,
+        league_division=division,
+        date=match.date,
+    )
+
+    with pytest.raises(ValidationError) as exc_info:
+        FixtureRescheduleService(division).reschedule([match])
+
+    assert "já existe" in str(exc_info.value).lower()
+
+
+@pytest.mark.django_db
+def test_reschedule_counts_days_in_calendar_timezone(settings):
+    settings.TIME_ZONE = "UTC"
+    tz = ZoneInfo("America/Sao_Paulo")
+    start = datetime(2030, 5, 1, 12, tzinfo=tz)
+    calendar = SlotCalendar(start, FixtureGeneratorService.MATCH_TIME_SLOTS, tz=tz)
+    division = LeagueDivisionFactory()
+    a, b, c, d, e, f = TeamFactory.create_batch(6)
+    # 21:00 em São Paulo já é o dia seguinte em UTC.
+    for home, away, hour in ((a, b, 16), (c, d, 21)):
+        MatchFactory(
+            league_division=division,
+            home_team=home,
+            away_team=away,
+            date=start.replace(hour=hour),
+        )
+    postponed = MatchFactory(
+        league_division=division, home_team=e, away_team=f, date=start
+    )
+
+    class TwoPerDay(FixtureRescheduleService):
+        MAX_MATCHES_PER_DAY = 2
+
+    (rescheduled,) = TwoPerDay(division, calendar=calendar).reschedule([postponed])
+
+    assert timezone.localtime(rescheduled.date, tz) == start.replace(
+        day=2, hour=16
+    )
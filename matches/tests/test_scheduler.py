@@ -0,0 +1,131 @@
+import pytest
+from collections import Counter, defaultdict
+from datetime import datetime, timedelta
+from django.utils import timezone
+from matches.services import MatchScheduler, generate_round_robin, iter_round_robin
+
+
+def _start():
+    return timezone.make_aware(datetime(2025, 4, 1, 12, 0))
+
+
+def _assert_valid_schedule(schedule, rest_days, max_per_day):
+    by_team = defaultdict(list)
+    by_day = Counter()
+    slots = Counter()
+    for home, away, _round, slot_dt in schedule:
+        assert home != away
+        by_team[home].append(slot_dt)
+        by_team[away].append(slot_dt)
+        by_day[timezone.localtime(slot_dt).date()] += 1
+        slots[slot_dt] += 1
+
+    assert max(slots.values()) == 1
+    assert max(by_day.values()) <= max_per_day
+    for dates in by_team.values():
+        dates.sort()
+        for previous, current in zip(dates, dates[1:]):
+            assert current - previous >= timedelta(days=rest_days)
+
+
+def test_round_robin_pairs_every_team_twice():
+    fixtures = generate_round_robin([1, 2, 3, 4])
+
+    assert len(fixtures) == 12
+    assert len({(h, a) for h, a, _ in fixtures}) == 12
+    assert {r for _, _, r in fixtures} == set(range(1, 7))
+
+
+def test_round_robin_with_odd_number_of_teams():
+    fixtures = generate_round_robin(["a", "b", "c", "d", "e"])
+
+    assert len(fixtures) == 5 * 4
+    assert all(None not in (h, a) for h, a, _ in fixtures)
+
+
+def test_scheduler_returns_plain_tuples_in_input_order():
+    fixtures = generate_round_robin([1, 2, 3, 4])
+    schedule = MatchScheduler(_start()).schedule(fixtures)
+
+    assert [(h, a, r) for h, a, r, _ in schedule] == fixtures
+    assert all(timezone.is_aware(slot_dt) for *_, slot_dt in schedule)
+
+
+def test_scheduler_starts_at_start_date():
+    start = _start().replace(hour=17)
+    schedule = MatchScheduler(start).schedule_round_robin([1, 2, 3, 4])
+
+    first = min(slot_dt for *_, slot_dt in schedule)
+    assert first >= start
+    assert timezone.localtime(first).strftime("%H:%M") == "18:30"
+
+
+@pytest.mark.parametrize("rest_days,max_per_day", [(3, 5), (0, 2), (2, 1)])
+def test_scheduler_respects_rest_and_daily_limits(rest_days, max_per_day):
+    scheduler = MatchScheduler(
+        _start(), rest_days=rest_days, max_matches_per_day=max_per_day
+    )
+    schedule = scheduler.schedule_round_robin(list(range(10)))
+
+    assert len(schedule) == 10 * 9
+    _assert_valid_schedule(schedule, rest_days, max_per_day)
+
+
+def test_scheduler_never_schedules_team_twice_on_same_day():
+    scheduler = MatchScheduler(
+        _start(), rest_days=0, time_slots=["10:00", "13:00", "16:00", "19:00"]
+    )
+    schedule = scheduler.schedule_round_robin(list(range(6)))
+
+    days = Counter()
+    for home, away, _round, slot_dt in schedule:
+        day = timezone.localtime(slot_dt).date()
+        days[(home, day)] += 1
+        days[(away, day)] += 1
+    assert max(days.values()) == 1
+
+
+def test_scheduler_handles_large_tournaments():
+    schedule = MatchScheduler(_start()).schedule_round_robin(list(range(120)))
+
+    assert len(schedule) == 120 * 119
+    _assert_valid_schedule(schedule, 3, 5)
+
+
+def test_scheduler_requires_time_slots():
+    with pytest.raises(ValueError):
+        MatchScheduler(_start(), time_slots=[])
+
+
+def test_iter_round_robin_yields_one_round_at_a_time():
+    rounds = list(iter_round_robin(list(range(6))))
+
+    assert [r for r, _ in rounds] == list(range(1, 11))
+    for _round, fixtures in rounds:
+        teams = [team for fixture in fixtures for team in fixture]
+        assert len(fixtures) == 3
+        assert len(set(teams)) == 6
+
+
+def test_iter_rounds_matches_full_schedule():
+    teams = list(range(8))
+    streamed = [
+        (home, away, round_num, slot_dt)
+        for round_num, fixtures in MatchScheduler(_start()).iter_rounds(teams)
+        for home, away, slot_dt in fixtures
+    ]
+
+    assert streamed == MatchScheduler(_start()).schedule_round_robin(teams)
+
+
+def test_iter_rounds_keeps_calendar_window_bounded():
+    scheduler = MatchScheduler(_start())
+    rounds = scheduler.iter_rounds(list(range(60)))
+
+    window = 0
+    for _round, fixtures in rounds:
+        calendar = scheduler.calendar
+        window = max(window, calendar.end_slot - calendar.first_slot)
+
+    assert scheduler.calendar.first_slot > 0
+    assert window < scheduler.calendar.end_slot / 10
@@ -0,0 +1,99 @@
+import pytest
+from io import StringIO
+from django.core.exceptions import ValidationError
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from matches.services import SeasonFixtureGeneratorService
+from matches.models import Match, Status
+from clubs.tests.factories import TeamFactory
+from leagues.tests.factories import LeagueDivisionFactory, LeagueSeasonFactory
+
+
+def _season_with_divisions(*sizes):
+    season = LeagueSeasonFactory(year=2024)
+    divisions = []
+    for i, size in enumerate(sizes):
+        division = LeagueDivisionFactory(season=season, name=f"Série {'ABCD'[i]}")
+        division.teams.add(*TeamFactory.create_batch(size))
+        divisions.append(division)
+    return season, divisions
+
+
+@pytest.mark.django_db
+def test_season_generator_creates_matches_for_every_division():
+    season, divisions = _season_with_divisions(4, 5)
+
+    results = SeasonFixtureGeneratorService(season, max_workers=2).generate_fixtures()
+
+    assert [r.division for r in results] == divisions
+    assert len(results[0].matches) == 4 * 3
+    assert len(results[1].matches) == 5 * 4
+    for result in results:
+        assert result.compute_seconds >= 0
+        assert result.persist_seconds >= 0
+        assert (
+            Match.objects.filter(league_division=result.division).count()
+            == len(result.matches)
+        )
+
+
+@pytest.mark.django_db
+def test_season_generator_rolls_back_every_division_on_conflict():
+    season, divisions = _season_with_divisions(4, 4)
+    SeasonFixtureGeneratorService(season, max_workers=1).generate_fixtures()
+    played = Match.objects.filter(league_division=divisions[0]).first()
+    Match.objects.filter(pk=played.pk).update(status=Status.FINISHED)
+
+    with pytest.raises(ValidationError):
+        # o confronto já disputado não pode ser gerado de novo
+        SeasonFixtureGeneratorService(season, max_workers=1).generate_fixtures()
+
+    assert Match.objects.filter(status=Status.SCHEDULED).count() == 2 * 12 - 1
+
+
+@pytest.mark.django_db
+def test_season_generator_requires_two_teams_per_division():
+    season, _ = _season_with_divisions(4, 1)
+
+    with pytest.raises(ValueError) as exc_info:
+        SeasonFixtureGeneratorService(season).generate_fixtures()
+
+    assert "Série B" in str(exc_info.value)
+
+
+@pytest.mark.django_db
+def test_generate_season_fixtures_command_reports_timings():
+    season, _ = _season_with_divisions(4, 4)
+    out = StringIO()
+
+    call_command(
+        "generate_season_fixtures",
+        str(season.year),
+        "--start-date=2024-04-01",
+        "--workers=1",
+        stdout=out,
+    )
+
+    output = out.getvalue()
+    assert "Série A: 12 partidas" in output
+    assert "cálculo" in output and "gravação" in output
+    assert Match.objects.count() == 24
+
+
+@pytest.mark.django_db
+def test_generate_season_fixtures_command_unknown_season():
+    with pytest.raises(CommandError):
+        call_command("generate_season_fixtures", "1900")
+
+
+@pytest.mark.django_db
+def test_generate_season_fixtures_command_reports_conflicts():
+    season, divisions = _season_with_divisions(4, 4)
+    SeasonFixtureGeneratorService(season, max_workers=1).generate_fixtures()
+    played = Match.objects.filter(league_division=divisions[0]).first()
+    Match.objects.filter(pk=played.pk).update(status=Status.FINISHED)
+
+    with pytest.raises(CommandError) as exc_info:
+        call_command("generate_season_fixtures", str(season.year), "--workers=1")
+
+    assert "Já existe uma partida" in str(exc_info.value)
@@ -0,0 +1,128 @@
+import numpy as np
+import pytest
+from datetime import timedelta
+from io import StringIO
+from django.core.management import CommandError, call_command
+from django.utils import timezone
+from clubs.tests.factories import TeamFactory
+from leagues.tests.factories import LeagueDivisionFactory
+from matches.models import Status
+from matches.services import (
+    FixtureGeneratorService,
+    SeasonSimulationService,
+    StandingsQueryService,
+)
+
+
+def _division(teams=6, finished=None, **kwargs):
+    division = LeagueDivisionFactory(**kwargs)
+    division.teams.add(*TeamFactory.create_batch(teams))
+    FixtureGeneratorService(division).generate_fixtures(bulk=True)
+    matches = list(division.matches.order_by("round", "date"))
+    for i, match in enumerate(matches[:finished]):
+        match.status = Status.IN_PROGRESS
+        match.home_score, match.away_score = (i * 7) % 4, (i * 3) % 3
+        match.save()
+        match.finish()
+    return division
+
+
+@pytest.mark.django_db
+def test_finished_season_reproduces_final_table():
+    division = _division(finished=None)
+
+    odds = SeasonSimulationService(division, simulations=50).simulate()
+
+    table = StandingsQueryService(division).table()
+    by_team = {o.team_id: o for o in odds}
+    for position, row in enumerate(table):
+        assert by_team[row.team_id].positions[position] == 1.0
+        assert by_team[row.team_id].expected_points == row.points
+    assert by_team[table[0].team_id].title == 1.0
+
+
+@pytest.mark.django_db
+def test_probabilities_are_consistent():
+    division = _division(finished=10)
+
+    odds = SeasonSimulationService(division, simulations=2_000, seed=3).simulate()
+
+    positions = np.array([o.positions for o in odds])
+    assert np.allclose(positions.sum(axis=0), 1)
+    assert np.allclose(positions.sum(axis=1), 1)
+    assert sum(o.title for o in odds) == pytest.approx(1)
+    assert sum(o.libertadores for o in odds) == pytest.approx(6)
+    # Divisão de topo sem divisão abaixo: sem acesso nem rebaixamento.
+    assert all(o.promotion == o.relegation == 0 for o in odds)
+
+
+@pytest.mark.django_db
+def test_matches_in_progress_are_simulated():
+    division = _division(teams=2, finished=0)
+    live, scheduled = division.matches.order_by("round")
+    live.start()
+
+    odds = SeasonSimulationService(division, simulations=200, seed=1).simulate()
+
+    # Duas partidas por simulação: pelo menos 2 pontos distribuídos em cada.
+    assert sum(o.expected_points for o in odds) >= 4
+
+
+@pytest.mark.django_db
+def test_live_score_is_the_floor_of_matches_in_progress():
+    division = _division(teams=2, finished=0)
+    live, scheduled = division.matches.order_by("round")
+    live.start()
+    # Três gols e o tempo regulamentar esgotado: nada mais a sortear.
+    division.matches.filter(pk=live.pk).update(
+        home_score=3, date=timezone.now() - timedelta(minutes=100)
+    )
+
+    odds = SeasonSimulationService(division, simulations=200, seed=1).simulate()
+
+    by_team = {o.team_id: o for o in odds}
+    home, away = by_team[live.home_team_id], by_team[live.away_team_id]
+    # A vitória em andamento vale 3 pontos em todas as simulações.
+    assert home.expected_points >= 3
+    assert away.expected_points <= 3
+
+
+@pytest.mark.django_db
+def test_zones_follow_division_hierarchy():
+    top = LeagueDivisionFactory()
+    division = _division(finished=10, parent_league=top)
+    LeagueDivisionFactory(parent_league=division)
+
+    odds = SeasonSimulationService(division, simulations=500, seed=1).simulate()
+
+    assert sum(o.libertadores for o in odds) == 0
+    assert sum(o.promotion for o in odds) == pytest.approx(4)
+    assert sum(o.relegation for o in odds) == pytest.approx(4)
+
+
+@pytest.mark.django_db
+def test_same_seed_gives_same_odds_across_worker_pool():
+    division = _division(finished=10)
+
+    def run(workers):
+        service = SeasonSimulationService(
+            division, simulations=600, max_workers=workers, seed=42
+        )
+        service.CHUNK_SIZE = 200
+        return [(o.team_id, o.title, o.expected_points) for o in service.simulate()]
+
+    assert run(1) == run(2)
+
+
+@pytest.mark.django_db
+def test_simulate_division_command():
+    division = _division(finished=10)
+    out = StringIO()
+
+    call_command(
+        "simulate_division", division.name, "--simulations=100", "--seed=1", stdout=out
+    )
+
+    assert out.getvalue().count(" [+] ") == 6
+    with pytest.raises(CommandError):
+        call_command("simulate_division", "Inexistente", stdout=out)
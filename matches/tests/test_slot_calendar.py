@@ -0,0 +1,83 @@
+from datetime import UTC, date, datetime, timedelta
+from zoneinfo import ZoneInfo
+import pytest
+from matches.services import SlotCalendar
+
+SAO_PAULO = ZoneInfo("America/Sao_Paulo")
+
+
+def test_slot_calendar_skips_slots_before_start():
+    start = datetime(2025, 4, 1, 17, 0, tzinfo=SAO_PAULO)
+    calendar = SlotCalendar(start, ["16:00", "18:30", "21:00"])
+
+    assert calendar.day_slots(0) == [
+        datetime(2025, 4, 1, 18, 30, tzinfo=SAO_PAULO),
+        datetime(2025, 4, 1, 21, 0, tzinfo=SAO_PAULO),
+    ]
+    assert len(calendar.day_slots(1)) == 3
+    assert calendar.day_date(1) == date(2025, 4, 2)
+
+
+def test_slot_calendar_indexes_are_stable():
+    calendar = SlotCalendar(
+        datetime(2025, 4, 1, tzinfo=SAO_PAULO), ["21:00", "16:00"]
+    )
+
+    assert calendar.slot(3) == datetime(2025, 4, 2, 21, 0, tzinfo=SAO_PAULO)
+    assert calendar.day_of(3) == 1
+    assert calendar.day_bounds(1) == (2, 4)
+    assert calendar.slot(0) == datetime(2025, 4, 1, 16, 0, tzinfo=SAO_PAULO)
+
+
+def test_slot_calendar_first_at_or_after_and_between():
+    calendar = SlotCalendar(
+        datetime(2025, 4, 1, tzinfo=SAO_PAULO), ["16:00", "21:00"]
+    )
+    moment = datetime(2025, 4, 3, 17, 0, tzinfo=SAO_PAULO)
+
+    assert calendar.slot(calendar.first_at_or_after(moment)) == datetime(
+        2025, 4, 3, 21, 0, tzinfo=SAO_PAULO
+    )
+    assert len(calendar.between(moment, moment + timedelta(days=2))) == 4
+
+
+def test_slot_calendar_utc_offsets_follow_daylight_saving_time():
+    # O Brasil teve horário de verão até fevereiro de 2019.
+    calendar = SlotCalendar(
+        datetime(2018, 1, 10, tzinfo=SAO_PAULO), ["16:00"], end=date(2018, 7, 10)
+    )
+    summer = calendar.day_slots(0)[0]
+    winter = calendar.day_slots((date(2018, 7, 10) - date(2018, 1, 10)).days)[0]
+
+    assert summer.utcoffset() == timedelta(hours=-2)
+    assert winter.utcoffset() == timedelta(hours=-3)
+    assert (summer.hour, winter.hour) == (16, 16)
+
+
+def test_slot_calendar_moves_nonexistent_local_time_forward():
+    # 04/11/2018: os relógios saltaram de 00:00 para 01:00.
+    calendar = SlotCalendar(
+        datetime(2018, 11, 3, 12, 0, tzinfo=SAO_PAULO), ["00:30", "16:00"]
+    )
+
+    gap_slot = calendar.day_slots(1)[0]
+    assert (gap_slot.hour, gap_slot.minute) == (1, 30)
+    assert gap_slot.utcoffset() == timedelta(hours=-2)
+    elapsed = calendar.slot(1).astimezone(UTC) - calendar.slot(0).astimezone(UTC)
+    assert elapsed == timedelta(hours=8, minutes=30)
+
+
+def test_slot_calendar_keeps_days_sorted_across_the_gap():
+    # 00:30 não existe em 04/11/2018 e vira 01:30, depois do slot das 01:15.
+    calendar = SlotCalendar(
+        datetime(2018, 11, 4, tzinfo=SAO_PAULO), ["00:30", "01:15", "16:00"]
+    )
+
+    slots = calendar.day_slots(0)
+    assert [(slot.hour, slot.minute) for slot in slots] == [(1, 15), (1, 30), (16, 0)]
+    assert calendar.slot(calendar.first_at_or_after(slots[1])) == slots[1]
+
+
+def test_slot_calendar_requires_time_slots():
+    with pytest.raises(ValueError):
+        SlotCalendar(datetime(2025, 4, 1, tzinfo=SAO_PAULO), [])
@@ -0,0 +1,109 @@
+import pytest
+from django.core.management import CommandError, call_command
+from clubs.tests.factories import TeamFactory
+from leagues.tests.factories import LeagueDivisionFactory
+from matches.cache import DivisionCache
+from matches.models import Match, Standing, Status
+from matches.services import StandingsService
+from matches.tests.factories import MatchFactory
+
+
+def _row(division, team):
+    return Standing.objects.get(league_division=division, team=team)
+
+
+@pytest.mark.django_db
+def test_finish_updates_both_rows():
+    match = MatchFactory(status=Status.IN_PROGRESS, home_score=2, away_score=1)
+
+    match.finish()
+
+    home = _row(match.league_division, match.home_team)
+    away = _row(match.league_division, match.away_team)
+    assert (home.points, home.wins, home.goals_for, home.goal_difference) == (
+        3,
+        1,
+        2,
+        1,
+    )
+    assert (away.points, away.losses, away.goals_against, away.goal_difference) == (
+        0,
+        1,
+        2,
+        -1,
+    )
+    assert home.games == away.games == 1
+
+
+@pytest.mark.django_db
+def test_bulk_finish_accumulates_per_team():
+    division = LeagueDivisionFactory()
+    a, b, c = TeamFactory.create_batch(3)
+    common = dict(league_division=division, status=Status.IN_PROGRESS)
+    MatchFactory(home_team=a, away_team=b, home_score=1, away_score=1, **common)
+    MatchFactory(home_team=c, away_team=a, home_score=0, away_score=3, **common)
+
+    Match.objects.filter(league_division=division).finish()
+
+    row = _row(division, a)
+    assert (row.points, row.games, row.wins, row.draws) == (4, 2, 1, 1)
+    assert (row.goals_for, row.goals_against, row.goal_difference) == (4, 1, 3)
+    assert [s.team_id for s in StandingsService.table(division)][0] == a.pk
+
+
+@pytest.mark.django_db
+def test_apply_cost_does_not_depend_on_batch_size(django_assert_num_queries):
+    division = LeagueDivisionFactory()
+    matches = MatchFactory.create_batch(
+        10, league_division=division, status=Status.FINISHED, home_score=1
+    )
+
+    # savepoint + INSERT + SELECT + UPDATE + release
+    with django_assert_num_queries(5):
+        StandingsService.apply(matches)
+
+    assert Standing.objects.filter(league_division=division).count() == 20
+
+
+@pytest.mark.django_db
+def test_rebuild_fixes_drift():
+    division = LeagueDivisionFactory()
+    a, b = TeamFactory.create_batch(2)
+    division.teams.add(a, b)
+    MatchFactory(
+        home_team=a,
+        away_team=b,
+        league_division=division,
+        status=Status.IN_PROGRESS,
+        home_score=2,
+    ).finish()
+    Standing.objects.filter(team=a).update(points=99)
+
+    with pytest.raises(CommandError):
+        call_command("rebuild_standings", division.name, "--check", stdout=None)
+    call_command("rebuild_standings", division.name, stdout=None)
+
+    assert _row(division, a).points == 3
+    assert _row(division, b).points == 0
+
+
+@pytest.mark.django_db
+def test_rebuild_invalidates_division_cache(django_capture_on_commit_callbacks):
+    division = LeagueDivisionFactory()
+    before = DivisionCache(division.pk).version()
+
+    with django_capture_on_commit_callbacks(execute=True):
+        call_command("rebuild_standings", division.name, stdout=None)
+
+    assert DivisionCache(division.pk).version() != before
+
+
+@pytest.mark.django_db
+def test_rebuild_includes_teams_without_matches():
+    division = LeagueDivisionFactory()
+    team = TeamFactory()
+    division.teams.add(team)
+
+    StandingsService.rebuild(division)
+
+    assert _row(division, team).games == 0
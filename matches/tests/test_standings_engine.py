@@ -0,0 +1,93 @@
+import numpy as np
+import pytest
+from datetime import timedelta
+from django.utils import timezone
+from clubs.tests.factories import TeamFactory
+from leagues.tests.factories import LeagueDivisionFactory
+from matches.models import Match, Status
+from matches.services import StandingsEngine, StandingsQueryService
+from matches.tests.factories import MatchFactory
+
+
+def _engine(teams, fixtures):
+    home, away, home_scores, away_scores = zip(*fixtures) if fixtures else ([],) * 4
+    return StandingsEngine(list(range(teams)), home, away, home_scores, away_scores)
+
+
+def test_points_match_calculate_points():
+    rng = np.random.default_rng(7)
+    home_scores = rng.integers(0, 5, 500)
+    away_scores = rng.integers(0, 5, 500)
+    engine = _engine(2, [(0, 1, h, a) for h, a in zip(home_scores, away_scores)])
+
+    home_points, away_points = engine.points()
+
+    for h, a, hp, ap in zip(home_scores, away_scores, home_points, away_points):
+        match = Match(home_score=int(h), away_score=int(a))
+        match._calculate_points()
+        assert (match.home_points, match.away_points) == (hp, ap)
+
+
+def test_batched_scores_equal_one_table_per_row():
+    rng = np.random.default_rng(11)
+    fixtures = [(h, a, 0, 0) for h in range(6) for a in range(6) if h != a]
+    engine = _engine(6, fixtures)
+    home_scores = rng.integers(0, 4, (50, len(fixtures)))
+    away_scores = rng.integers(0, 4, (50, len(fixtures)))
+
+    batch = engine.table(home_scores, away_scores)
+
+    for i in range(50):
+        single = engine.table(home_scores[i], away_scores[i])
+        for field in single._fields:
+            assert np.array_equal(getattr(batch, field)[i], getattr(single, field))
+
+
+def test_order_uses_criteria_then_head_to_head():
+    # 0 e 1 empatam em tudo; 1 venceu o confronto direto.
+    engine = _engine(4, [(1, 0, 1, 0), (0, 2, 1, 0), (3, 1, 1, 0)])
+
+    table = engine.table()
+
+    assert list(table.points) == [3, 3, 0, 3]
+    assert list(table.order) == [3, 1, 0, 2]
+
+
+def test_three_way_tie_keeps_name_order():
+    engine = _engine(3, [(0, 1, 1, 0), (1, 2, 1, 0), (2, 0, 1, 0)])
+
+    assert list(engine.table().order) == [0, 1, 2]
+
+
+@pytest.mark.django_db
+def test_division_table_equals_standings_query(django_assert_num_queries):
+    division = LeagueDivisionFactory()
+    teams = TeamFactory.create_batch(6)
+    for i, home in enumerate(teams):
+        for j, away in enumerate(teams):
+            if home != away:
+                match = MatchFactory(
+                    league_division=division,
+                    home_team=home,
+                    away_team=away,
+                    home_score=(i * 2 + j) % 3,
+                    away_score=(i + j) % 2,
+                    status=Status.IN_PROGRESS,
+                    date=timezone.now() - timedelta(days=1),
+                )
+                match.finish()
+
+    with django_assert_num_queries(1):
+        engine = StandingsEngine.from_division(division)
+    table = engine.table()
+
+    expected = StandingsQueryService(division).table()
+    assert [engine.team_ids[i] for i in table.order] == [r.team_id for r in expected]
+    for row in expected:
+        i = engine.team_ids.index(row.team_id)
+        assert (table.points[i], table.wins[i], table.losses[i]) == (
+            row.points,
+            row.wins,
+            row.losses,
+        )
+        assert table.goal_difference[i] == row.goal_difference
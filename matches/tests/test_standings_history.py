@@ -0,0 +1,165 @@
+import pytest
+from datetime import timedelta
+from django.core.cache import cache
+from django.utils import timezone
+from clubs.tests.factories import TeamFactory
+from leagues.tests.factories import LeagueDivisionFactory
+from matches.models import Status
+from matches.services import (
+    FixtureGeneratorService,
+    StandingsHistoryService,
+    StandingsQueryService,
+)
+from matches.tests.factories import MatchFactory
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+def _season(teams=4):
+    division = LeagueDivisionFactory()
+    division.teams.add(*TeamFactory.create_batch(teams))
+    FixtureGeneratorService(division).generate_fixtures(bulk=True)
+    matches = list(division.matches.order_by("round", "date"))
+    for i, match in enumerate(matches):
+        match.status = Status.IN_PROGRESS
+        match.home_score, match.away_score = i % 3, (i * 2) % 3
+        match.date = timezone.now() - timedelta(days=len(matches) - i)
+        match.save()
+        match.finish()
+    return division, matches
+
+
+def _summary(rows):
+    return [(row.team_id, row.points, row.goal_difference) for row in rows]
+
+
+@pytest.mark.django_db
+def test_every_round_matches_table_at_that_point():
+    division, matches = _season()
+    service = StandingsHistoryService(division)
+
+    snapshots = service.snapshots()
+
+    assert [snap.round for snap in snapshots] == list(range(1, 7))
+    for snap in snapshots:
+        last = max(m.date for m in matches if m.round == snap.round)
+        expected = StandingsQueryService(division, until=last).table()
+        assert _summary(snap.rows) == _summary(expected)
+
+
+@pytest.mark.django_db
+def test_snapshots_come_from_cache(django_assert_num_queries):
+    division, _ = _season()
+    service = StandingsHistoryService(division)
+    service.snapshots()
+
+    with django_assert_num_queries(0):
+        rows = service.table_after(3)
+
+    assert len(rows) == 4
+
+
+@pytest.mark.django_db
+def test_correction_only_invalidates_later_rounds(
+    django_assert_num_queries, django_capture_on_commit_callbacks
+):
+    division, matches = _season()
+    service = StandingsHistoryService(division)
+    before = service.snapshots()
+
+    corrected = next(m for m in matches if m.round == 4)
+    corrected.home_score += 5
+    corrected.home_points, corrected.away_points = 3, 0
+    with django_capture_on_commit_callbacks(execute=True):
+        corrected.save()
+
+    assert cache.get(service._key(3)) is not None
+    assert cache.get(service._key(4)) is None
+
+    # Só as partidas das rodadas 4 em diante são relidas.
+    with django_assert_num_queries(1):
+        after = service.snapshots()
+
+    assert _summary(after[2].rows) == _summary(before[2].rows)
+    assert _summary(after[3].rows) != _summary(before[3].rows)
+    assert _summary(after[-1].rows) == _summary(
+        StandingsQueryService(division).table()
+    )
+
+
+@pytest.mark.django_db
+def test_finishing_a_match_invalidates_from_its_round(
+    django_capture_on_commit_callbacks,
+):
+    division = LeagueDivisionFactory()
+    a, b = TeamFactory.create_batch(2)
+    MatchFactory(
+        league_division=division,
+        home_team=a,
+        away_team=b,
+        round=1,
+        status=Status.IN_PROGRESS,
+        home_score=1,
+    ).finish()
+    service = StandingsHistoryService(division)
+    assert [snap.round for snap in service.snapshots()] == [1]
+
+    with django_capture_on_commit_callbacks(execute=True):
+        MatchFactory(
+            league_division=division,
+            home_team=b,
+            away_team=a,
+            round=2,
+            status=Status.IN_PROGRESS,
+            home_score=2,
+        ).finish()
+
+    assert [snap.round for snap in service.snapshots()] == [1, 2]
+    assert _summary(service.table_after(2))[0][1] == 3
+
+
+@pytest.mark.django_db
+def test_snapshots_computed_before_commit_are_not_served(
+    django_capture_on_commit_callbacks,
+):
+    division, matches = _season()
+    service = StandingsHistoryService(division)
+    service.snapshots()
+    corrected = next(m for m in matches if m.round == 2)
+    corrected.home_score += 5
+    corrected.home_points, corrected.away_points = 3, 0
+
+    with django_capture_on_commit_callbacks(execute=True):
+        corrected.save()
+        # Leitura que regrava os snapshots antes do commit da correção.
+        stale = StandingsHistoryService(division).snapshots()
+
+    assert _summary(service.table_after(6)) == _summary(
+        StandingsQueryService(division).table()
+    )
+    assert _summary(service.table_after(6)) != _summary(stale[-1].rows)
+
+
+@pytest.mark.django_db
+def test_matches_without_round_use_match_days():
+    division = LeagueDivisionFactory()
+    a, b = TeamFactory.create_batch(2)
+    for days_ago, home, away in ((5, a, b), (2, b, a)):
+        MatchFactory(
+            league_division=division,
+            home_team=home,
+            away_team=away,
+            status=Status.IN_PROGRESS,
+            home_score=1,
+            date=timezone.now() - timedelta(days=days_ago),
+        ).finish()
+
+    snapshots = StandingsHistoryService(division).snapshots()
+
+    assert [snap.round for snap in snapshots] == [1, 2]
+    assert [row.points for row in snapshots[0].rows] == [3, 0]
@@ -0,0 +1,92 @@
+import pytest
+from datetime import timedelta
+from django.utils import timezone
+from clubs.tests.factories import TeamFactory
+from leagues.tests.factories import LeagueDivisionFactory
+from matches.models import Status
+from matches.services import StandingsQueryService, StandingsService
+from matches.tests.factories import MatchFactory
+
+
+def _finished(division, home, away, home_score, away_score, days_ago=1):
+    match = MatchFactory(
+        league_division=division,
+        home_team=home,
+        away_team=away,
+        home_score=home_score,
+        away_score=away_score,
+        status=Status.IN_PROGRESS,
+        date=timezone.now() - timedelta(days=days_ago),
+    )
+    match.finish()
+    return match
+
+
+@pytest.mark.django_db
+def test_table_aggregates_home_and_away_in_one_query(django_assert_num_queries):
+    division = LeagueDivisionFactory()
+    a, b, c = TeamFactory.create_batch(3)
+    _finished(division, a, b, 2, 0)
+    _finished(division, c, a, 1, 1)
+    _finished(division, b, c, 0, 3)
+    MatchFactory(league_division=division, home_team=a, away_team=c)
+
+    with django_assert_num_queries(1) as queries:
+        table = StandingsQueryService(division).table()
+
+    # A união não leva ORDER BY (recusado pelo Django 6.1 nesse formato).
+    assert "ORDER BY" not in queries.captured_queries[0]["sql"]
+    assert [row.team_id for row in table] == [c.pk, a.pk, b.pk]
+    row = table[1]
+    assert (row.points, row.games, row.wins, row.draws, row.losses) == (4, 2, 1, 1, 0)
+    assert (row.goals_for, row.goals_against, row.goal_difference) == (3, 1, 2)
+
+
+@pytest.mark.django_db
+def test_table_respects_date_cutoff():
+    division = LeagueDivisionFactory()
+    a, b = TeamFactory.create_batch(2)
+    _finished(division, a, b, 1, 0, days_ago=10)
+    _finished(division, b, a, 1, 0, days_ago=2)
+
+    table = StandingsQueryService(
+        division, until=timezone.now() - timedelta(days=5)
+    ).table()
+
+    assert [(row.team_id, row.points) for row in table] == [(a.pk, 3), (b.pk, 0)]
+
+
+@pytest.mark.django_db
+def test_head_to_head_breaks_two_team_ties(django_assert_num_queries):
+    division = LeagueDivisionFactory()
+    a, b, c, d = TeamFactory.create_batch(4)
+    # a e b empatam em todos os critérios gerais; b venceu o confronto.
+    _finished(division, b, a, 1, 0)
+    _finished(division, a, c, 1, 0)
+    _finished(division, d, b, 1, 0)
+
+    with django_assert_num_queries(2):
+        table = StandingsQueryService(division).table()
+
+    ids = [row.team_id for row in table]
+    assert ids.index(b.pk) == ids.index(a.pk) - 1
+
+
+@pytest.mark.django_db
+def test_matches_materialized_table():
+    division = LeagueDivisionFactory()
+    teams = TeamFactory.create_batch(4)
+    for i, home in enumerate(teams):
+        for j, away in enumerate(teams):
+            if home != away:
+                _finished(division, home, away, (i * 3 + j) % 4, (i + j * 2) % 3)
+
+    expected = [
+        (s.team_id, s.points, s.wins, s.goal_difference, s.goals_for)
+        for s in StandingsService.table(division)
+    ]
+    actual = [
+        (row.team_id, row.points, row.wins, row.goal_difference, row.goals_for)
+        for row in StandingsQueryService(division).table()
+    ]
+    assert sorted(actual) == sorted(expected)
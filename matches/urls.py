@@ -0,0 +1,31 @@
+from django.urls import path
+from rest_framework.routers import DefaultRouter
+
+from matches.views import (
+    DivisionLiveEventsView,
+    DivisionStandingsView,
+    MatchLiveEventsView,
+    MatchViewSet,
+)
+
+router = DefaultRouter()
+router.register("matches", MatchViewSet, basename="match")
+
+urlpatterns = [
+    path(
+        "divisions/<uuid:division_id>/standings/",
+        DivisionStandingsView.as_view(),
+        name="division-standings",
+    ),
+    path(
+        "divisions/<uuid:division_id>/events/",
+        DivisionLiveEventsView.as_view(),
+        name="division-events",
+    ),
+    path(
+        "matches/<uuid:match_id>/events/",
+        MatchLiveEventsView.as_view(),
+        name="match-events",
+    ),
+    *router.urls,
+]
@@ -1,3 +1,177 @@
-from django.shortcuts import render
+import asyncio
 
-# Create your views here.
+from asgiref.sync import sync_to_async
+from django.db import connection
+from django.http import JsonResponse, StreamingHttpResponse
+from django.shortcuts import get_object_or_404
+from django.views import View
+from rest_framework import generics, viewsets
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework.response import Response
+from rest_framework_simplejwt.authentication import JWTAuthentication
+
+from core.mixins import ConditionalGetMixin
+from core.pagination import KeysetPagination
+from leagues.models import LeagueDivision
+from matches.cache import DivisionCache
+from matches.filters import MatchFilter
+from matches.live import division_channel, get_broker, match_channel
+from matches.models import Match, Standing
+from matches.serializers import MatchSerializer, StandingSerializer
+
+
+class MatchViewSet(ConditionalGetMixin, viewsets.ReadOnlyModelViewSet):
+    """
+    Partidas em ordem de data, paginadas por cursor sobre ``(date, id)``.
+
+    Listagens filtradas por divisão (confrontos e resultados) vêm do cache da
+    divisão, assim como os validadores de ETag e Last-Modified.
+    """
+
+    queryset = Match.objects.select_related(
+        "home_team", "away_team", "league_division"
+    )
+    serializer_class = MatchSerializer
+    filterset_class = MatchFilter
+    pagination_class = KeysetPagination
+    last_modified_fields = (
+        "updated_at",
+        "home_team__updated_at",
+        "away_team__updated_at",
+        "league_division__updated_at",
+    )
+
+    def list(self, request, *args, **kwargs):
+        filterset = self.filterset_class(request.query_params, self.queryset)
+        if not filterset.is_valid() or not filterset.form.cleaned_data["division"]:
+            return super().list(request, *args, **kwargs)
+
+        cache = DivisionCache(filterset.form.cleaned_data["division"])
+        params = dict(request.query_params.lists())
+
+        def render():
+            data = cache.get_or_set(
+                "matches",
+                params,
+                lambda: super(ConditionalGetMixin, self)
+                .list(request, *args, **kwargs)
+                .data,
+            )
+            return Response(data)
+
+        # Os validadores seguem a mesma versão da divisão que a listagem.
+        validators = cache.get_or_set(
+            "matches-validators", params, lambda: self._validators(filterset.qs)
+        )
+        return self.conditional_response(request, *validators, render)
+
+
+class DivisionStandingsView(generics.ListAPIView):
+    """Tabela materializada de uma divisão, servida do cache da divisão."""
+
+    serializer_class = StandingSerializer
+    pagination_class = None
+
+    def get_queryset(self):
+        return Standing.objects.filter(
+            league_division_id=self.kwargs["division_id"]
+        ).select_related("team")
+
+    def list(self, request, *args, **kwargs):
+        division = get_object_or_404(LeagueDivision, pk=self.kwargs["division_id"])
+        data = DivisionCache(division.pk).get_or_set(
+            "standings",
+            {},
+            lambda: super(DivisionStandingsView, self).list(request).data,
+        )
+        return Response(data)
+
+
+class LiveEventsView(View):
+    """
+    Server-Sent Events com o placar ao vivo, publicados por ``matches.live``.
+
+    A autenticação valida o JWT de acesso sem consultar o banco, pelo
+    cabeçalho ``Authorization`` ou pelo parâmetro ``token`` (o
+    ``EventSource`` do navegador não envia cabeçalhos). Depois de conferir
+    que o recurso existe, a conexão com o banco é liberada: assinantes
+    parados só ocupam uma fila no broker.
+    """
+
+    KEEPALIVE_SECONDS = 15
+
+    async def get(self, request, **kwargs):
+        if not self._authenticated(request):
+            return JsonResponse(
+                {"detail": "As credenciais de autenticação não foram fornecidas."},
+                status=401,
+            )
+        if not await self._exists(kwargs):
+            return JsonResponse({"detail": "Não encontrado."}, status=404)
+
+        response = StreamingHttpResponse(
+            self._stream(self.channel(kwargs)), content_type="text/event-stream"
+        )
+        response["Cache-Control"] = "no-cache"
+        response["X-Accel-Buffering"] = "no"
+        return response
+
+    def channel(self, kwargs) -> str:
+        raise NotImplementedError
+
+    def queryset(self, kwargs):
+        raise NotImplementedError
+
+    async def _stream(self, channel: str):
+        async with get_broker().subscribe(channel) as queue:
+            # Já inscrito: quem recebeu este comentário não perde eventos.
+            yield ": conectado\n\n"
+            while True:
+                try:
+                    event = await asyncio.wait_for(
+                        queue.get(), self.KEEPALIVE_SECONDS
+                    )
+                except asyncio.TimeoutError:
+                    yield ": keepalive\n\n"
+                else:
+                    yield event.encode()
+
+    @staticmethod
+    def _authenticated(request) -> bool:
+        authentication = JWTAuthentication()
+        header = request.META.get("HTTP_AUTHORIZATION", "").encode()
+        try:
+            raw_token = authentication.get_raw_token(header) if header else None
+            raw_token = raw_token or request.GET.get("token")
+            if not raw_token:
+                return False
+            authentication.get_validated_token(raw_token)
+        except AuthenticationFailed:
+            return False
+        return True
+
+    async def _exists(self, kwargs) -> bool:
+        def exists():
+            try:
+                return self.queryset(kwargs).exists()
+            finally:
+                if not connection.in_atomic_block:
+                    connection.close()
+
+        return await sync_to_async(exists)()
+
+
+class MatchLiveEventsView(LiveEventsView):
+    def channel(self, kwargs) -> str:
+        return match_channel(kwargs["match_id"])
+
+    def queryset(self, kwargs):
+        return Match.objects.filter(pk=kwargs["match_id"])
+
+
+class DivisionLiveEventsView(LiveEventsView):
+    def channel(self, kwargs) -> str:
+        return division_channel(kwargs["division_id"])
+
+    def queryset(self, kwargs):
+        return LeagueDivision.objects.filter(pk=kwargs["division_id"])